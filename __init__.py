@@ -94,6 +94,7 @@ def register():
 
 def unregister():
     sverchok.utils.clear_node_classes()
+    sverchok.core.unregister_lazy_node_modules()
     sv_registration_utils.unregister_all(imported_modules + node_list)
 
 # EOF
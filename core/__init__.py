@@ -1,6 +1,10 @@
+import os
+import time
+import inspect
 import importlib
 import sverchok
-from sverchok.utils.logging import debug, exception
+from sverchok.utils.logging import debug, info, exception
+from sverchok.dependencies import lazy_loading
 from sverchok.core.update_system import clear_system_cache
 
 reload_event = False
@@ -52,6 +56,8 @@ def reload_all(imported_modules, node_list, old_nodes):
 
 
 def make_node_list(nodes):
+    if lazy_loading:
+        return make_lazy_node_list(nodes)
     node_list = []
     base_name = "sverchok.nodes"
     for category, names in nodes.nodes_dict.items():
@@ -60,6 +66,78 @@ def make_node_list(nodes):
     return node_list
 
 
+# lazy loading: {bl_idname: (module name relative to sverchok.nodes, bl_label)} of all nodes
+nodes_manifest = dict()
+# node modules imported and registered on demand, in order of loading
+lazy_node_list = []
+
+
+def make_lazy_node_list(nodes):
+    """
+    Node modules are not imported at start up in lazy loading mode,
+    only the manifest of which module defines which node is read
+    """
+    from sverchok.utils.sv_nodes_manifest import get_nodes_manifest
+    start = time.perf_counter()
+    nodes_manifest.clear()
+    nodes_manifest.update(get_nodes_manifest(nodes.nodes_dict, os.path.dirname(nodes.__file__)))
+    info("sv: lazy loading, manifest of %s nodes is read in %.3f s",
+         len(nodes_manifest), time.perf_counter() - start)
+    return []
+
+
+def load_node_modules(bl_idnames):
+    """
+    Import and register modules of the given nodes, if they were not loaded yet.
+    Returns bl_idnames which are unknown to the manifest.
+    """
+    from sverchok.utils import node_classes
+    base_name = "sverchok.nodes"
+    unknown = set()
+    module_names = set()
+    for bl_idname in bl_idnames:
+        if bl_idname in node_classes:
+            continue
+        record = nodes_manifest.get(bl_idname)
+        if record is None:
+            unknown.add(bl_idname)
+        else:
+            module_names.add(record[0])
+
+    loaded_names = {m.__name__ for m in lazy_node_list}
+    for module_name in sorted(module_names):
+        full_name = '{}.{}'.format(base_name, module_name)
+        if full_name in loaded_names:
+            continue
+        try:
+            module = importlib.import_module(full_name)
+            if hasattr(module, "register"):
+                module.register()
+        except Exception as err:
+            exception(err)
+            continue
+        lazy_node_list.append(module)
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            try:
+                if cls.bl_rna.base.name == "Node":
+                    node_classes[cls.bl_idname] = cls
+            except AttributeError:
+                pass
+    return unknown
+
+
+def load_all_node_modules():
+    """Import and register all nodes which were not loaded yet"""
+    return load_node_modules(list(nodes_manifest.keys()))
+
+
+def unregister_lazy_node_modules():
+    for module in reversed(lazy_node_list):
+        if hasattr(module, "unregister"):
+            module.unregister()
+    lazy_node_list.clear()
+
+
 def import_modules(modules, base, im_list):
     for m in modules:
         im = importlib.import_module('.{}'.format(m), base)
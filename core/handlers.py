@@ -6,8 +6,9 @@ from bpy.app.handlers import persistent
 from sverchok import old_nodes
 from sverchok import data_structure
 from sverchok.core import upgrade_nodes, undo_handler_node_count
-from sverchok.core.update_system import set_first_run, clear_system_cache
+from sverchok.core.update_system import set_first_run, clear_system_cache, clear_link_dependencies
 from sverchok.core.events import CurrentEvents, BlenderEventsTypes
+from sverchok.dependencies import lazy_loading
 from sverchok.ui import color_def, bgl_callback_nodeview, bgl_callback_3dview
 from sverchok.utils import app_handler_ops
 from sverchok.utils.logging import debug
@@ -74,6 +75,9 @@ def sv_handler_undo_post(scene):
 
     from sverchok.core import undo_handler_node_count
 
+    # undo restores links without reporting it as a change of the trees
+    clear_link_dependencies()
+
     num_to_test_against = 0
     links_changed = False
     for ng in sverchok_trees():
@@ -160,11 +164,52 @@ def sv_clean(scene):
 
 @persistent
 def sv_pre_load(scene):
+    from sverchok.core.monad import clear_monad_cache
     clear_system_cache()
+    clear_monad_cache()
     sv_clean(scene)
     set_first_run(True)
 
 
+@persistent
+def sv_pre_save(scene):
+    """
+    Record which node types each tree uses,
+    so that in lazy loading mode only their modules are loaded with the file.
+    """
+    sv_types = {'SverchCustomTreeType', 'SverchGroupTreeType'}
+    for ng in bpy.data.node_groups:
+        if ng.bl_idname in sv_types:
+            ng['sv_node_types'] = sorted({n.bl_idname for n in ng.nodes})
+
+
+def load_lazy_nodes(sv_trees):
+    """
+    Load modules of nodes used by the trees (lazy loading mode).
+    All nodes are loaded if some tree does not know its node types (it was saved
+    by an older version) or uses nodes which can't be found.
+    """
+    from sverchok.core import load_node_modules, load_all_node_modules
+    monad_classes = {ng.cls_bl_idname for ng in sv_trees if ng.bl_idname == 'SverchGroupTreeType'}
+    bl_idnames = set()
+    for ng in sv_trees:
+        node_types = ng.get('sv_node_types')
+        if node_types is None:
+            debug("Tree %s has no record of its node types, loading all nodes", ng.name)
+            load_all_node_modules()
+            return
+        bl_idnames.update(node_types)
+
+    unknown = load_node_modules(bl_idnames)
+    unknown = {bl_idname for bl_idname in unknown
+               if bl_idname not in monad_classes
+               and not old_nodes.is_old(bl_idname)
+               and not hasattr(bpy.types, bl_idname)}
+    if unknown:
+        debug("Unknown node types %s, loading all nodes", unknown)
+        load_all_node_modules()
+
+
 @persistent
 def sv_post_load(scene):
     """
@@ -173,6 +218,13 @@ def sv_post_load(scene):
 
     set_first_run(False)
 
+    sv_types = {'SverchCustomTreeType', 'SverchGroupTreeType'}
+    if lazy_loading:
+        try:
+            load_lazy_nodes([ng for ng in bpy.data.node_groups if ng.bl_idname in sv_types])
+        except:
+            traceback.print_exc()
+
     # ensure current nodeview view scale / location parameters reflect users' system settings
     from sverchok import node_tree
     node_tree.SverchCustomTreeNode.get_and_set_gl_scale_info(None, "sv_post_load")
@@ -182,7 +234,6 @@ def sv_post_load(scene):
         if monad.input_node and monad.output_node:
             monad.update_cls()
 
-    sv_types = {'SverchCustomTreeType', 'SverchGroupTreeType'}
     sv_trees = list(ng for ng in bpy.data.node_groups if ng.bl_idname in sv_types and ng.nodes)
 
     for ng in sv_trees:
@@ -241,6 +292,7 @@ handler_dict = {
     'undo_post': sv_handler_undo_post,
     'load_pre': sv_pre_load,
     'load_post': sv_post_load,
+    'save_pre': sv_pre_save,
     'depsgraph_update_pre': sv_main_handler
 }
 
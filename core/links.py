@@ -36,40 +36,55 @@ def get_output_socket_id(socket):
         return socket.socket_id, socket.node.node_id
 
 def get_new_linked_nodes(new_sv_links, before_sv_links, before_output_sockets):
-    affected_nodes = []
-    for link in new_sv_links:
-        if not link in before_sv_links:
-            if not link.from_socket_id in before_output_sockets:
-                if not link.from_node_id in affected_nodes:
-                    affected_nodes.append(link.from_node_id)
-            if not link.to_node_id in affected_nodes:
-                affected_nodes.append(link.to_node_id)
-    return affected_nodes
+    affected_nodes = collections.OrderedDict()
+    for link in new_sv_links - before_sv_links:
+        if not link.from_socket_id in before_output_sockets:
+            affected_nodes[link.from_node_id] = None
+        affected_nodes[link.to_node_id] = None
+    return list(affected_nodes)
 
 
-def get_new_unlinked_nodes(before_inputted_nodes, before_input_sockets, input_sockets, nodes_dict):
-    affected_nodes = []
+def get_new_unlinked_nodes(before_input_sockets, input_sockets, nodes_dict):
+    affected_nodes = collections.OrderedDict()
 
-    for node_id, socket in zip(before_inputted_nodes, before_input_sockets):
-        if not socket in input_sockets:
-            #if the node has been deleted it is not affected
-            if node_id in nodes_dict:
-                if not node_id in affected_nodes: 
-                    affected_nodes.append(node_id)
+    for socket in before_input_sockets.keys() - input_sockets.keys():
+        node_id = before_input_sockets[socket]
+        #if the node has been deleted it is not affected
+        if node_id in nodes_dict:
+            affected_nodes[node_id] = None
 
-    return affected_nodes
+    return list(affected_nodes)
 
 
-def split_new_links_data(new_sv_links):
-    inputted_nodes = []
-    input_sockets = []
-    output_sockets = []
-    for link in new_sv_links:
-        inputted_nodes.append(link.to_node_id)
-        input_sockets.append(link.to_socket_id)
-        output_sockets.append(link.from_socket_id)
+class SvLinksSnapshot:
+    """
+    State of links of a tree with hash based lookups, so comparing
+    two states takes time proportional to number of links
+    links: set of SvLink
+    output_sockets: set of ids of linked output sockets
+    input_sockets: {id of linked input socket: id of its node}
+    """
+    __slots__ = ('links', 'output_sockets', 'input_sockets')
 
-    return  inputted_nodes, input_sockets, output_sockets
+    def __init__(self, sv_links=()):
+        self.links = frozenset(sv_links)
+        self.output_sockets = {link.from_socket_id for link in self.links}
+        self.input_sockets = {link.to_socket_id: link.to_node_id for link in self.links}
+
+    def __bool__(self):
+        return bool(self.links)
+
+    def __eq__(self, other):
+        return self.links == other.links
+
+    def __ne__(self, other):
+        return self.links != other.links
+
+    def __contains__(self, sv_link):
+        return sv_link in self.links
+
+    def without(self, sv_link):
+        return SvLinksSnapshot(self.links - {sv_link})
 
 
 class SvLink(NamedTuple):
@@ -108,82 +123,52 @@ class SvLink(NamedTuple):
 class SvLinks:
     sv_links_new = {}
     sv_links_cache = {}
-    output_sockets_cache = {}
-    input_sockets_cache = {}
-    inputted_nodes_cache = {}
-    output_sockets_new = dict()
-    input_sockets_new = dict()
-    inputted_nodes_new = dict()
 
     def start_dictionaries(self, tree_id):
-        self.sv_links_new[tree_id] = dict()
-        self.sv_links_cache[tree_id] = dict()
-        self.output_sockets_new[tree_id] = dict()
-        self.input_sockets_new[tree_id] = dict()
-        self.inputted_nodes_new[tree_id] = dict()
-        self.output_sockets_cache[tree_id] = dict()
-        self.input_sockets_cache[tree_id] = dict()
-        self.inputted_nodes_cache[tree_id] = dict()
+        self.sv_links_new[tree_id] = SvLinksSnapshot()
+        self.sv_links_cache[tree_id] = SvLinksSnapshot()
 
     def clear_all_dictionaries(self):
         self.sv_links_new.clear()
         self.sv_links_cache.clear()
-        self.output_sockets_new.clear()
-        self.input_sockets_new.clear()
-        self.inputted_nodes_new.clear()
-        self.output_sockets_cache.clear()
-        self.input_sockets_cache.clear()
-        self.inputted_nodes_cache.clear()
-        
+
     def create_new_links(self, node_tree):
         tree_id = node_tree.tree_id
         if not node_tree.tree_id in self.sv_links_new:
             self.start_dictionaries(node_tree.tree_id)
 
-        new_sv_links = SvLink.init_from_links(node_tree.links)
-        self.sv_links_new[tree_id] = new_sv_links
-        new_inputted_nodes, new_input_sockets, new_output_sockets = split_new_links_data(new_sv_links)
-        self.output_sockets_new[tree_id] = new_output_sockets
-        self.input_sockets_new[tree_id] = new_input_sockets
-        self.inputted_nodes_new[tree_id] = new_inputted_nodes
+        self.sv_links_new[tree_id] = SvLinksSnapshot(SvLink.init_from_links(node_tree.links))
 
     def remove(self, node_tree, link):
         sv_link = SvLink.init_from_link(link)
         if sv_link in self.sv_links_cache[node_tree.tree_id]:
-            self.sv_links_cache[node_tree.tree_id].remove(sv_link)
-            
+            self.sv_links_cache[node_tree.tree_id] = self.sv_links_cache[node_tree.tree_id].without(sv_link)
+
     def links_have_changed(self, node_tree):
         return self.sv_links_new[node_tree.tree_id] != self.sv_links_cache[node_tree.tree_id]
 
     def store_links_cache(self, node_tree):
-        tree_id = node_tree.tree_id
         self.sv_links_cache[node_tree.tree_id] = self.sv_links_new[node_tree.tree_id]
-        self.output_sockets_cache[tree_id] = self.output_sockets_new[tree_id]
-        self.input_sockets_cache[tree_id] = self.input_sockets_new[tree_id]
-        self.inputted_nodes_cache[tree_id] = self.inputted_nodes_new[tree_id]
 
     def get_nodes(self, node_tree):
         tree_id = node_tree.tree_id
         new_sv_links = self.sv_links_new[tree_id]
         before_sv_links = self.sv_links_cache[tree_id]
 
-        if not self.sv_links_cache[tree_id]:
+        if not before_sv_links:
             #print('there was no links memory, creating it')
             self.create_new_links(node_tree)
             node_tree.nodes_dict.load_nodes(node_tree)
             return node_tree.nodes
 
-        affected_nodes = []
-
         new_linked_nodes = get_new_linked_nodes(
-            new_sv_links,
-            before_sv_links,
-            self.output_sockets_cache[tree_id])
+            new_sv_links.links,
+            before_sv_links.links,
+            before_sv_links.output_sockets)
 
         new_unlinked_linked_nodes = get_new_unlinked_nodes(
-            self.inputted_nodes_cache[tree_id],
-            self.input_sockets_cache[tree_id],
-            self.input_sockets_new[tree_id],
+            before_sv_links.input_sockets,
+            new_sv_links.input_sockets,
             node_tree.nodes_dict.get(node_tree)
             )
         affected_nodes = new_linked_nodes + new_unlinked_linked_nodes
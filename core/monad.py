@@ -18,6 +18,8 @@
 
 import pprint
 import random
+import time
+from collections import defaultdict
 from itertools import chain
 
 import bpy
@@ -28,8 +30,10 @@ import sverchok
 from sverchok.utils import get_node_class_reference, sv_IO_monad_helpers
 from sverchok.utils.logging import info, error
 from sverchok.node_tree import SverchCustomTreeNode, SvNodeTreeCommon
+from sverchok import data_structure
 from sverchok.data_structure import get_other_socket, updateNode, match_long_repeat
-from sverchok.core.update_system import make_tree_from_nodes, do_update
+from sverchok.core.update_system import make_tree_from_nodes, do_update, do_update_parallel, clear_link_dependencies
+from sverchok.core.socket_data import SvNoDataError
 from sverchok.core.monad_properties import SvIntPropertySettingsGroup, SvFloatPropertySettingsGroup, ensure_unique
 from sverchok.core.events import CurrentEvents, BlenderEventsTypes
 from sverchok.utils.handle_blender_data import get_sv_trees
@@ -389,6 +393,8 @@ class SverchGroupTree(NodeTree, SvNodeTreeCommon):
 
     def update(self):
         CurrentEvents.new_event(BlenderEventsTypes.monad_tree_update, self)
+        clear_monad_cache(self)
+        clear_link_dependencies(self)
         affected_trees = {instance.id_data for instance in self.instances}
         for tree in affected_trees:
             tree.update()
@@ -531,6 +537,74 @@ def uset(self, value, origin):
     return None
 
 
+# names of monad trees by class name of their instances,
+# so instances do not scan all node groups on each access
+_monad_trees = dict()
+# update lists of monads by tree_id, name and end point nodes of the monad
+_monad_update_lists = dict()
+# (batched, durations of iterations) of last vectorized processing by node_id of monad instances
+iteration_timings = dict()
+
+
+def find_monad(cls_bl_idname):
+    """Monad tree of instances with the given class name, or None"""
+    name = _monad_trees.get(cls_bl_idname)
+    if name is not None:
+        tree = bpy.data.node_groups.get(name)
+        if tree is not None and getattr(tree, "cls_bl_idname", None) == cls_bl_idname:
+            return tree
+    for tree in bpy.data.node_groups:
+        if getattr(tree, "cls_bl_idname", None) == cls_bl_idname:
+            _monad_trees[cls_bl_idname] = tree.name
+            return tree
+    return None
+
+
+def clear_monad_cache(monad=None):
+    """Forget cached update lists of the given monad, or everything cached about monads"""
+    if monad is None:
+        _monad_trees.clear()
+        _monad_update_lists.clear()
+        iteration_timings.clear()
+        return
+    for key in [key for key in _monad_update_lists if key[1] == monad.name]:
+        del _monad_update_lists[key]
+
+
+def is_batch_capable(node):
+    """Whether all items of a vectorized monad can be passed through the node at once"""
+    return not hasattr(node, "process") or getattr(node, "sv_batch_capable", False)
+
+
+class MonadUpdateList:
+    """
+    Update list of a monad together with what is needed to pass all items
+    of a vectorized monad through it at once
+    """
+    def __init__(self, monad, node_names):
+        self.nodes = make_tree_from_nodes(node_names, monad, down=False)
+        self.downstream = self.get_downstream(monad)
+        self.batch_capable = all(is_batch_capable(monad.nodes[name]) for name in self.nodes)
+
+    @staticmethod
+    def get_downstream(monad):
+        """Names of nodes which depend on the input node of the monad"""
+        children = defaultdict(set)
+        for link in monad.links:
+            children[link.from_node.name].add(link.to_node.name)
+        in_node = monad.input_node
+        if in_node is None:
+            return set()
+        downstream = set()
+        stack = [in_node.name]
+        while stack:
+            for name in children[stack.pop()]:
+                if name not in downstream:
+                    downstream.add(name)
+                    stack.append(name)
+        return downstream
+
+
 class SvGroupNodeExp:
     """
     Base class for all monad instances
@@ -559,10 +633,7 @@ class SvGroupNodeExp:
 
     @property
     def monad(self):
-        for tree in bpy.data.node_groups:
-            if tree.bl_idname == 'SverchGroupTreeType' and self.bl_idname == tree.cls_bl_idname:
-               return tree
-        return None # or raise LookupError or something, anyway big FAIL
+        return find_monad(self.bl_idname)
 
     def sv_init(self, context):
         self['loops'] = 0
@@ -586,6 +657,17 @@ class SvGroupNodeExp:
         self.draw_buttons(context, layout)
         layout.prop(self, 'loops_max')
 
+        timings = iteration_timings.get(self.node_id)
+        if self.vectorize and timings:
+            batched, durations = timings
+            col = layout.column(align=True)
+            if batched:
+                col.label(text=f"Batched: {durations[0] * 1000:.2f} ms")
+            else:
+                col.label(text=f"Iterations: {len(durations)}")
+                col.label(text=f"Mean: {sum(durations) / len(durations) * 1000:.2f} ms")
+                col.label(text=f"Max: {max(durations) * 1000:.2f} ms")
+
     def draw_buttons(self, context, layout):
 
         split = layout.column().split()
@@ -629,6 +711,25 @@ class SvGroupNodeExp:
                 endpoint_nodes.append(n.name)
         return endpoint_nodes
 
+    def get_update_list(self):
+        """Update list of the monad, cached until the monad tree is changed"""
+        monad = self.monad
+        node_names = self.get_nodes_to_process(monad.output_node.name)
+        key = (monad.tree_id, monad.name, tuple(node_names))
+        update_list = _monad_update_lists.get(key)
+        if update_list is None:
+            update_list = MonadUpdateList(monad, node_names)
+            _monad_update_lists[key] = update_list
+        return update_list
+
+    def update_monad(self, update_list):
+        """Process nodes of the monad, in parallel if it is enabled for the tree of the instance"""
+        monad = self.monad
+        if getattr(self.id_data, "sv_parallel_update", False) and not data_structure.HEAT_MAP:
+            do_update_parallel([update_list.nodes], monad.nodes)
+        else:
+            do_update(update_list.nodes, monad.nodes)
+
     def process(self):
         if not any(s.is_linked for s in self.outputs):
             return
@@ -651,10 +752,7 @@ class SvGroupNodeExp:
             data = socket.sv_get(deepcopy=False)
             in_node.outputs[index].sv_set(data)
 
-        node_names = self.get_nodes_to_process(out_node.name)
-        ul = make_tree_from_nodes(node_names, monad, down=False)
-
-        do_update(ul, monad.nodes)
+        self.update_monad(self.get_update_list())
         # set output sockets correctly
         for index, socket in enumerate(self.outputs):
             if socket.is_linked:
@@ -666,8 +764,7 @@ class SvGroupNodeExp:
         in_node = monad.input_node
         out_node = monad.output_node
 
-        node_names = self.get_nodes_to_process(out_node.name)
-        ul = make_tree_from_nodes(node_names, monad, down=False)
+        ul = self.get_update_list()
 
         data_out = [[] for s in self.outputs]
 
@@ -680,21 +777,81 @@ class SvGroupNodeExp:
 
         monad["current_total"] = len(data_in[0])
 
-
+        if ul.batch_capable and len(data_in[0]) > 1:
+            start = time.perf_counter()
+            batch_out = self.process_batched(ul, data_in)
+            if batch_out is not None:
+                iteration_timings[self.node_id] = (True, [time.perf_counter() - start])
+                for idx, socket in enumerate(self.outputs):
+                    if socket.is_linked:
+                        socket.sv_set(batch_out[idx])
+                return
+            # some node does not keep objects independent with the actual data,
+            # do not try it again until the monad is changed
+            ul.batch_capable = False
+
+        durations = []
         for master_idx, data in enumerate(zip(*data_in)):
+            start = time.perf_counter()
             for idx, d in enumerate(data):
                 socket = in_node.outputs[idx]
                 if socket.is_linked:
                     socket.sv_set([d])
             monad["current_index"] = master_idx
-            do_update(ul, monad.nodes)
+            self.update_monad(ul)
             for idx, s in enumerate(out_node.inputs[:-1]):
                 data_out[idx].extend(s.sv_get(deepcopy=False))
+            durations.append(time.perf_counter() - start)
+        iteration_timings[self.node_id] = (False, durations)
 
         for idx, socket in enumerate(self.outputs):
             if socket.is_linked:
                 socket.sv_set(data_out[idx])
 
+    def process_batched(self, ul, data_in):
+        """
+        Pass all items through the monad at once; this gives the same result as
+        processing items one by one when each node keeps objects independent.
+        Returns None if data produced by some node shows it is not the case.
+        """
+        monad = self.monad
+        in_node = monad.input_node
+        out_node = monad.output_node
+        total = len(data_in[0])
+
+        for idx, data in enumerate(data_in):
+            socket = in_node.outputs[idx]
+            if socket.is_linked:
+                socket.sv_set(list(data))
+        monad["current_index"] = 0
+        self.update_monad(ul)
+
+        # nodes depending on the input node should produce an object per item,
+        # other nodes should produce one object shared by all items
+        for name in ul.nodes:
+            node = monad.nodes[name]
+            if not hasattr(node, "process"):
+                continue
+            expected = total if name in ul.downstream else 1
+            for socket in node.outputs:
+                if not socket.is_linked:
+                    continue
+                try:
+                    if len(socket.sv_get(deepcopy=False)) != expected:
+                        return None
+                except SvNoDataError:
+                    return None
+
+        data_out = []
+        for socket in out_node.inputs[:-1]:
+            data = socket.sv_get(deepcopy=False)
+            if len(data) == 1:
+                data = data * total
+            elif len(data) != total:
+                return None
+            data_out.append(data)
+        return data_out
+
 
     # ----------- loop (iterate 2)
 
@@ -707,9 +864,7 @@ class SvGroupNodeExp:
         for index, data in enumerate(sockets_data_in):
             in_node.outputs[index].sv_set(data)        
 
-        node_names = self.get_nodes_to_process(out_node.name)
-        ul = make_tree_from_nodes(node_names, monad, down=False)
-        do_update(ul, monad.nodes)
+        self.update_monad(self.get_update_list())
 
         # set output sockets correctly
         socket_data_out = []
@@ -26,6 +26,7 @@ from sverchok.utils.surface import SvSurface
 from sverchok.utils.solid_conversion import to_solid_recursive
 
 from mathutils import Matrix, Quaternion
+import numpy as np
 from numpy import ndarray
 
 # conversion tests, to be used in sv_get!
@@ -71,7 +72,52 @@ def is_string_to_vector(socket):
 # ---
 
 
+def regular_array(data, last_dim):
+    """
+    numpy array of shape (n, last_dim) of all items of nested data, in order,
+    if all the items are numeric sequences of last_dim length; otherwise None.
+    """
+    try:
+        array = np.asarray(data, dtype=np.float64)
+    except (ValueError, TypeError):
+        # objects of different lengths
+        if not isinstance(data, (list, tuple)) or not data:
+            return None
+        parts = [regular_array(item, last_dim) for item in data]
+        if any(part is None for part in parts):
+            return None
+        return np.concatenate(parts)
+    if array.ndim < 2 or array.shape[-1] != last_dim:
+        return None
+    return array.reshape(-1, last_dim)
+
+
+def quaternions_to_matrix_array(quaternions):
+    """
+    (n, 4) array of quaternions (w, x, y, z) -> (n, 4, 4) array of rotation matrices,
+    as Quaternion.to_matrix().to_4x4() gives for each of them
+    """
+    w, x, y, z = quaternions.T
+    n = len(quaternions)
+    matrices = np.zeros((n, 4, 4))
+    matrices[:, 0, 0] = 1 - 2 * (y*y + z*z)
+    matrices[:, 0, 1] = 2 * (x*y - w*z)
+    matrices[:, 0, 2] = 2 * (x*z + w*y)
+    matrices[:, 1, 0] = 2 * (x*y + w*z)
+    matrices[:, 1, 1] = 1 - 2 * (x*x + z*z)
+    matrices[:, 1, 2] = 2 * (y*z - w*x)
+    matrices[:, 2, 0] = 2 * (x*z - w*y)
+    matrices[:, 2, 1] = 2 * (y*z + w*x)
+    matrices[:, 2, 2] = 1 - 2 * (x*x + y*y)
+    matrices[:, 3, 3] = 1
+    return matrices
+
+
 def get_matrices_from_locs(data):
+    locations = regular_array(data, 3)
+    if locations is not None:
+        return [Matrix.Translation(location) for location in locations.tolist()]
+
     location_matrices = []
     collect_matrix = location_matrices.append
 
@@ -89,6 +135,10 @@ def get_matrices_from_locs(data):
 
 
 def get_matrices_from_quaternions(data):
+    quaternions = regular_array(data, 4)
+    if quaternions is not None:
+        return [Matrix(matrix) for matrix in quaternions_to_matrix_array(quaternions).tolist()]
+
     matrices = []
     collect_matrix = matrices.append
 
@@ -132,6 +182,9 @@ def is_matrix(mat):  # doesnt work with Mathutils.Matrix ?
 
 
 def get_locs_from_matrices(data):
+    if isinstance(data, ndarray) and data.ndim == 3 and data.shape[1:] == (4, 4):
+        return [list(map(tuple, data[:, :3, 3].tolist()))]
+
     locations = []
     collect_vector = locations.append
 
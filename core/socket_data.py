@@ -16,7 +16,13 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+from itertools import count
+from threading import Lock
+
+import numpy as np
+
 from sverchok import data_structure
+from sverchok.core.sv_custom_exceptions import SvInputMutationError
 from sverchok.utils.logging import warning, info, debug
 
 #####################################
@@ -28,6 +34,19 @@ sentinel = object()
 # socket cache
 socket_data_cache = {}
 
+# versions of data in socket cache, {tree_id: {socket_id: version}}
+# a version is changed each time when a socket gets new data,
+# unless the data is small and equal to the previous one (see _is_same_data)
+SAME_DATA_CHECK_LIMIT = 1000
+socket_data_version = {}
+_version_counter = count(1)
+# data of output sockets converted for linked input sockets of other types,
+# {tree_id: {socket_id: {(socket type, conversion policy): (version, data)}}}
+# entries of a socket are dropped when it gets different data
+socket_conversion_cache = {}
+# nodes can be processed in several threads simultaneously
+socket_data_lock = Lock()
+
 # faster than builtin deep copy for us.
 # useful for our limited case
 # we should be able to specify vectors here to get them create
@@ -43,6 +62,93 @@ def sv_deep_copy(lst):
     return lst
 
 
+def readonly_array(array):
+    """return a view of numpy array which can't be changed in place"""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def _forbid_mutation(name):
+    def method(self, *args, **kwargs):
+        raise SvInputMutationError(f"Input data of the node can't be changed in place (list.{name} called); "
+                                   "use sv_get(deepcopy=True) to get a copy which can be changed")
+    method.__name__ = name
+    return method
+
+
+class SvFrozenList(list):
+    """
+    Read-only view of nested list socket data, used instead of
+    shared data when input mutation check is enabled.
+    Any attempt to change the list or its nested lists raises SvInputMutationError,
+    numpy arrays are replaced by read-only views. Nested lists are wrapped when
+    they are accessed through indexing, iteration or slicing; data read through
+    C-level list API is not checked. This is a debugging tool, it makes reading slower.
+    """
+    __slots__ = ()
+
+    def _wrap(self, index, item):
+        if isinstance(item, list) and not isinstance(item, SvFrozenList):
+            item = SvFrozenList(item)
+            list.__setitem__(self, index, item)
+        elif isinstance(item, np.ndarray) and item.flags.writeable:
+            item = readonly_array(item)
+            list.__setitem__(self, index, item)
+        return item
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        return self._wrap(key, list.__getitem__(self, key))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __reversed__(self):
+        for i in range(len(self)-1, -1, -1):
+            yield self[i]
+
+    def __add__(self, other):
+        return list(self) + other
+
+    def __radd__(self, other):
+        return other + list(self)
+
+    def __mul__(self, n):
+        return list(self) * n
+
+    __rmul__ = __mul__
+
+    def copy(self):
+        return list(self)
+
+    def pop(self, index=-1):
+        raise SvInputMutationError("Input data of the node can't be changed in place (list.pop called)")
+
+    __setitem__ = _forbid_mutation('__setitem__')
+    __delitem__ = _forbid_mutation('__delitem__')
+    __iadd__ = _forbid_mutation('__iadd__')
+    __imul__ = _forbid_mutation('__imul__')
+    append = _forbid_mutation('append')
+    extend = _forbid_mutation('extend')
+    insert = _forbid_mutation('insert')
+    remove = _forbid_mutation('remove')
+    clear = _forbid_mutation('clear')
+    sort = _forbid_mutation('sort')
+    reverse = _forbid_mutation('reverse')
+
+
+def freeze_data(data):
+    """return read-only view of socket data, see SvFrozenList"""
+    if isinstance(data, list):
+        return SvFrozenList(data)
+    elif isinstance(data, np.ndarray):
+        return readonly_array(data)
+    return data
+
+
 # Build string for showing in socket label
 def SvGetSocketInfo(socket):
     """returns string to show in socket label"""
@@ -76,10 +182,40 @@ def SvForgetSocket(socket):
             warning(f"{socket.node.name} forgetting unconncted socket: {socket.name}")
     s_id = socket.socket_id
     s_ng = socket.id_data.tree_id
-    try:
-        socket_data_cache[s_ng].pop(s_id, None)
-    except KeyError:
-        debug("it was never there")
+    with socket_data_lock:
+        try:
+            socket_data_cache[s_ng].pop(s_id, None)
+            socket_data_version.get(s_ng, {}).pop(s_id, None)
+            socket_conversion_cache.get(s_ng, {}).pop(s_id, None)
+        except KeyError:
+            debug("it was never there")
+
+def _is_same_data(old, new):
+    """
+    Check whether new socket data is equal to previous one.
+    Only small data (up to SAME_DATA_CHECK_LIMIT items) is compared, so that
+    sv_set stays cheap; bigger data is considered changed. Data which shares
+    a list with the previous data is considered changed too, because the list
+    could be changed in place. Data which can't be compared cheaply
+    (like numpy arrays or mathutils objects) is considered changed.
+    """
+    budget = [SAME_DATA_CHECK_LIMIT]
+
+    def same(a, b):
+        if type(a) is not type(b):
+            return False
+        if isinstance(a, (list, tuple)):
+            if a is b and isinstance(a, list):
+                return False
+            budget[0] -= len(a)
+            if budget[0] < 0 or len(a) != len(b):
+                return False
+            return all(same(x, y) for x, y in zip(a, b))
+        if a is None or isinstance(a, (bool, int, float, str)):
+            return a == b
+        return False
+
+    return same(old, new)
 
 def SvSetSocket(socket, out):
     """sets socket data for socket"""
@@ -91,16 +227,33 @@ def SvSetSocket(socket, out):
             warning(f"{socket.node.name} setting unconncted socket: {socket.name}")
     s_id = socket.socket_id
     s_ng = socket.id_data.tree_id
-    if s_ng not in socket_data_cache:
-        socket_data_cache[s_ng] = {}
-    socket_data_cache[s_ng][s_id] = out
+    with socket_data_lock:
+        if s_ng not in socket_data_cache:
+            socket_data_cache[s_ng] = {}
+        if s_ng not in socket_data_version:
+            socket_data_version[s_ng] = {}
+        tree_cache = socket_data_cache[s_ng]
+        old = tree_cache.get(s_id, sentinel)
+        tree_cache[s_id] = out
+    if old is sentinel or not _is_same_data(old, out):
+        socket_data_version[s_ng][s_id] = next(_version_counter)
+        socket_conversion_cache.get(s_ng, {}).pop(s_id, None)
+
+def SvGetSocketVersion(socket):
+    """
+    Returns version of data written into output socket,
+    or None if there is no data in the cache.
+    The version is changed each time when the socket gets different data.
+    """
+    return socket_data_version.get(socket.id_data.tree_id, {}).get(socket.socket_id)
 
 
 def SvGetSocket(socket, deepcopy=True):
     """gets socket data from socket,
     if deep copy is True a deep copy is make_dep_dict,
     to increase performance if the node doesn't mutate input
-    set to False and increase performance substanstilly
+    set to False and increase performance substanstilly.
+    In input mutation check mode shared data is returned read-only (see SvFrozenList)
     """
     global socket_data_cache
     if socket.is_linked:
@@ -110,11 +263,7 @@ def SvGetSocket(socket, deepcopy=True):
         if s_ng not in socket_data_cache:
             raise LookupError
         if s_id in socket_data_cache[s_ng]:
-            out = socket_data_cache[s_ng][s_id]
-            if deepcopy:
-                return sv_deep_copy(out)
-            else:
-                return out
+            return _shared_data(socket_data_cache[s_ng][s_id], deepcopy)
         else:
             if data_structure.DEBUG_MODE:
                 debug(f"cache miss: {socket.node.name} -> {socket.name} from: {other.node.name} -> {other.name}")
@@ -122,6 +271,47 @@ def SvGetSocket(socket, deepcopy=True):
     # not linked
     raise SvNoDataError(socket)
 
+def _shared_data(out, deepcopy):
+    """data which is kept in a cache, as it should be given to a node"""
+    if deepcopy:
+        return sv_deep_copy(out)
+    elif data_structure.CHECK_INPUT_MUTATION:
+        return freeze_data(out)
+    else:
+        return out
+
+
+def SvGetSocketConversion(socket, key, deepcopy=True):
+    """
+    Cached result of conversion of data of the output socket linked to
+    the input socket, or sentinel if there is no such result for current
+    data of the output. Key should identify the conversion, e.g.
+    (type of the input socket, conversion policy).
+    """
+    other = socket.other
+    s_ng = other.id_data.tree_id
+    s_id = other.socket_id
+    entry = socket_conversion_cache.get(s_ng, {}).get(s_id, {}).get(key)
+    if entry is None or entry[0] != socket_data_version.get(s_ng, {}).get(s_id):
+        return sentinel
+    return _shared_data(entry[1], deepcopy)
+
+
+def SvSetSocketConversion(socket, key, data, deepcopy=True):
+    """
+    Store result of conversion of data of the output socket linked to the input socket.
+    Returns the data as it should be given to the node.
+    """
+    other = socket.other
+    s_ng = other.id_data.tree_id
+    s_id = other.socket_id
+    version = socket_data_version.get(s_ng, {}).get(s_id)
+    if version is not None:
+        with socket_data_lock:
+            socket_conversion_cache.setdefault(s_ng, {}).setdefault(s_id, {})[key] = (version, data)
+    return _shared_data(data, deepcopy)
+
+
 class SvNoDataError(LookupError):
     def __init__(self, socket=None, node=None, msg=None):
         
@@ -179,6 +369,8 @@ def reset_socket_cache(ng):
     """
     global socket_data_cache
     socket_data_cache[ng.tree_id] = {}
+    socket_data_version[ng.tree_id] = {}
+    socket_conversion_cache[ng.tree_id] = {}
 
 def clear_all_socket_cache():
     """
@@ -186,3 +378,5 @@ def clear_all_socket_cache():
     """
     global socket_data_cache
     socket_data_cache.clear()
+    socket_data_version.clear()
+    socket_conversion_cache.clear()
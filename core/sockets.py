@@ -25,6 +25,7 @@ from bpy.types import NodeTree, NodeSocket
 from sverchok.core.socket_conversions import ConversionPolicies, is_vector_to_matrix, FieldImplicitConversionPolicy
 from sverchok.core.socket_data import (
     SvGetSocketInfo, SvGetSocket, SvSetSocket, SvForgetSocket,
+    SvGetSocketConversion, SvSetSocketConversion,
     SvNoDataError, sentinel)
 
 from sverchok.data_structure import (
@@ -285,7 +286,9 @@ class SvSocketCommon(SvSocketProcessing):
         4. script default property
         5. Raise no data error
         :param default: script default property
-        :param deepcopy: in most cases should be False for efficiency but not in cases if input data will be modified
+        :param deepcopy: in most cases should be False for efficiency but not in cases if input data will be modified;
+            without a copy the data is shared with other nodes, with "Check input mutation" preference
+            it is given read-only (see SvFrozenList)
         :param implicit_conversions: if needed automatic conversion data from one socket type to another
         :return: data bound to the socket
         """
@@ -296,7 +299,9 @@ class SvSocketCommon(SvSocketProcessing):
                 implicit_conversions = ConversionPolicies.DEFAULT.conversion
 
         if self.is_linked and not self.is_output:
-            return self.convert_data(SvGetSocket(self, deepcopy), implicit_conversions)
+            if self.needs_data_conversion():
+                return self.get_converted_data(deepcopy, implicit_conversions)
+            return SvGetSocket(self, deepcopy)
         elif self.get_prop_name():
             prop = getattr(self.node, self.get_prop_name())
             if isinstance(prop, (str, int, float)):
@@ -417,6 +422,26 @@ class SvSocketCommon(SvSocketProcessing):
             self.node.debug(f"Trying to convert data for input socket {self.name} by {implicit_conversions}")
             return implicit_conversions.convert(self, source_data)
 
+    def get_converted_data(self, deepcopy, implicit_conversions):
+        """
+        Data of linked socket of other type converted for this socket.
+        Result of conversion is cached until the linked socket gets new data,
+        so each input linked to the same output does not convert it again.
+        """
+        key = (self.bl_idname, implicit_conversions)
+        data = SvGetSocketConversion(self, key, deepcopy)
+        if data is not sentinel:
+            return data
+        source_data = SvGetSocket(self, deepcopy=False)
+        self.node.debug(f"Trying to convert data for input socket {self.name} by {implicit_conversions}")
+        data = implicit_conversions.convert(self, source_data)
+        if data is source_data:
+            # the data is passed as is, the node should get it as from a socket of the same type
+            if deepcopy:
+                return implicit_conversions.convert(self, SvGetSocket(self, deepcopy))
+            return data
+        return SvSetSocketConversion(self, key, data, deepcopy)
+
     def update_objects_number(self):
         """
         Should be called each time after process method of the socket owner
@@ -21,3 +21,11 @@ class SvNotFullyConnected(SvProcessingError):
 
     def __str__(self):
         return self.message
+
+
+class SvInputMutationError(SvProcessingError):
+    """
+    Raised (in input mutation check mode) when a node tries to change
+    input data which is shared with other nodes.
+    """
+    pass
@@ -18,15 +18,17 @@
 
 import collections
 import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from itertools import chain
 
 import bpy
 from mathutils import Vector
 
 from sverchok import data_structure
-from sverchok.core.socket_data import SvNoDataError, reset_socket_cache
+from sverchok.core.socket_data import SvNoDataError, reset_socket_cache, SvGetSocketVersion
 from sverchok.utils.logging import debug, info, warning, error, exception
 from sverchok.utils.profile import profile
+from sverchok.utils import tree_profiling
 from sverchok.utils.exception_drawing_with_bgl import clear_exception_drawing_with_bgl, start_exception_drawing_with_bgl
 from sverchok.core.socket_data import clear_all_socket_cache
 from sverchok.core.node_id_dict import clear_nodes_id_dict
@@ -54,8 +56,10 @@ def is_first_run():
 def clear_system_cache():
     print("cleaning Sverchok cache")
     clear_all_socket_cache()
+    node_signatures.clear()
     clear_nodes_id_dict()
     clear_link_memory()
+    clear_link_dependencies()
 
 def update_error_colors(self, context):
     global no_data_color
@@ -67,27 +71,43 @@ def update_error_colors(self, context):
 update_cache = {}
 # cache for partial update lists
 partial_update_cache = {}
+# state of nodes connections at the moment of their last processing
+# {tree_id: {node_id: signature}}
+node_signatures = collections.defaultdict(dict)
 
 
-def make_dep_dict(node_tree, down=False):
-    """
-    Create a dependency dictionary for node group.
-    """
-    ng = node_tree
+# links of node groups as dependencies in both directions,
+# {(tree_id, tree pointer): (node names, upstream dependencies, downstream dependencies)}
+# a copy of a tree has the same tree_id, so the pointer is a part of the key;
+# it is dropped when Blender reports changes of tree topology
+link_dependencies = {}
 
-    deps = collections.defaultdict(set)
 
-    # create wifi out dependencies, process if needed
+def clear_link_dependencies(ng=None):
+    if ng is None:
+        link_dependencies.clear()
+    else:
+        # also entries of copies of the tree, and the entry of
+        # the tree itself before undo, which changes the pointer
+        for key in [key for key in link_dependencies if key[0] == ng.tree_id]:
+            del link_dependencies[key]
 
-    wifi_out_nodes = [(name, node.var_name)
-                  for name, node in ng.nodes.items()
-                  if node.bl_idname == 'WifiOutNode' and node.outputs]
-    if wifi_out_nodes:
-        wifi_dict = {node.var_name: name
-                     for name, node in ng.nodes.items()
-                     if node.bl_idname == 'WifiInNode'}
 
-    for i,link in enumerate(list(ng.links)):
+def get_link_dependencies(ng):
+    """
+    Upstream and downstream dependencies of nodes of the tree by links, read
+    from the tree only once after each change of its nodes or links.
+    Returned dictionaries should not be modified.
+    """
+    key = (ng.tree_id, ng.as_pointer())
+    names = tuple(ng.nodes.keys())
+    cached = link_dependencies.get(key)
+    if cached is not None and cached[0] == names:
+        return cached[1], cached[2]
+
+    up = collections.defaultdict(set)
+    down = collections.defaultdict(set)
+    for link in list(ng.links):
         #  this proctects against a rare occurance where
         #  a link is considered valid without a to_socket
         #  or a from_socket. proctects against a blender crash
@@ -101,8 +121,35 @@ def make_dep_dict(node_tree, down=False):
             # return collections.defaultdict(set)  # this happens more often than one might think
         if link.is_hidden:
             continue
-        key, value = (link.from_node.name, link.to_node.name) if down else (link.to_node.name, link.from_node.name)
-        deps[key].add(value)
+        from_name, to_name = link.from_node.name, link.to_node.name
+        up[to_name].add(from_name)
+        down[from_name].add(to_name)
+
+    up, down = dict(up), dict(down)
+    link_dependencies[key] = (names, up, down)
+    return up, down
+
+
+def make_dep_dict(node_tree, down=False):
+    """
+    Create a dependency dictionary for node group.
+    """
+    ng = node_tree
+
+    link_deps = get_link_dependencies(ng)[1 if down else 0]
+    deps = collections.defaultdict(set)
+    for name, names in link_deps.items():
+        deps[name] = set(names)
+
+    # create wifi out dependencies, process if needed
+
+    wifi_out_nodes = [(name, node.var_name)
+                  for name, node in ng.nodes.items()
+                  if node.bl_idname == 'WifiOutNode' and node.outputs]
+    if wifi_out_nodes:
+        wifi_dict = {node.var_name: name
+                     for name, node in ng.nodes.items()
+                     if node.bl_idname == 'WifiInNode'}
 
     for name, var_name in wifi_out_nodes:
         other = wifi_dict.get(var_name)
@@ -271,7 +318,7 @@ def make_animation_tree(node_types, node_list, tree_name):
     return a_tree
 
 
-def do_update_heat_map(node_list, nodes):
+def do_update_heat_map(node_list, nodes, changed_nodes=None):
     """
     Create a heat map for the node tree,
     Needs development.
@@ -280,10 +327,10 @@ def do_update_heat_map(node_list, nodes):
         color_data = {node.name: (node.color[:], node.use_custom_color) for node in nodes}
         nodes.id_data.sv_user_colors = str(color_data)
 
-    times = do_update_general(node_list, nodes)
+    times = do_update_general(node_list, nodes, changed_nodes=changed_nodes)
     if not times:
         return
-    t_max = max(times)
+    t_max = max(times) or 1.0
     addon_name = data_structure.SVERCHOK_NAME
     addon = bpy.context.preferences.addons.get(addon_name)
     if addon:
@@ -358,10 +405,60 @@ def reset_error_nodes(ng):
         del ng["error nodes"]
 
 
+def get_node_signature(node):
+    """
+    Returns state of node connections - versions of data in linked
+    input and output sockets of the node.
+    None means that the state can't be tracked and the node should
+    always be processed: it does not have linked inputs (so it can only
+    depend on its own properties) or it can read data from the scene.
+    Only nodes declaring `sv_thread_safe` were checked not to read Blender
+    data (scene frame, objects...), all other nodes can read it.
+    """
+    if not hasattr(node, "process") or hasattr(node, "is_animatable"):
+        return None
+    if getattr(node, "sv_thread_safe", False) is not True:
+        return None
+    inputs = []
+    for socket in node.inputs:
+        if not socket.is_linked:
+            continue
+        other = socket.other
+        if other is None or not hasattr(other, 'socket_id'):
+            return None
+        version = SvGetSocketVersion(other)
+        if version is None:
+            return None
+        inputs.append((socket.identifier, other.socket_id, version))
+    if not inputs:
+        return None
+    outputs = tuple((socket.identifier, SvGetSocketVersion(socket))
+                    for socket in node.outputs if socket.is_linked)
+    return tuple(inputs), outputs
+
+
+def report_node_error(ng, node_name, err):
+    """
+    Mark the node as failed in the tree; should be called from an except block
+    """
+    update_error_nodes(ng, node_name, err)
+    #traceback.print_tb(err.__traceback__)
+    exception("Node %s had exception: %s", node_name, err)
+
+    if hasattr(ng, "sv_show_error_in_tree"):
+        # not yet supported in monad trees..
+        if ng.sv_show_error_in_tree:
+            error_text = traceback.format_exc()
+            start_exception_drawing_with_bgl(ng, node_name, error_text, err)
+
+
 @profile(section="UPDATE")
-def do_update_general(node_list, nodes, procesed_nodes=set()):
+def do_update_general(node_list, nodes, procesed_nodes=set(), changed_nodes=None):
     """
     General update function for node set
+    If changed_nodes (names of nodes which were changed by user) are given
+    and the tree has incremental update enabled, other nodes are processed
+    only if data in their linked sockets has changed since their last processing.
     """
     global graphs
     timings = []
@@ -371,19 +468,30 @@ def do_update_general(node_list, nodes, procesed_nodes=set()):
     total_time = 0
     done_nodes = set(procesed_nodes)
 
+    ng = nodes.id_data
+    track_changes = getattr(ng, "sv_incremental_update", False)
+    skip_unchanged = track_changes and changed_nodes is not None
+    signatures = node_signatures[ng.tree_id] if track_changes else None
+
     # this is a no-op if no bgl being drawn.
     clear_exception_drawing_with_bgl(nodes)
 
     for node_name in node_list:
         if node_name in done_nodes:
             continue
+        node = None
         try:
             node = nodes[node_name]
-            start = time.perf_counter()
-            if hasattr(node, "process"):
-                node.process()
+            if skip_unchanged and node_name not in changed_nodes:
+                signature = get_node_signature(node)
+                if signature is not None and signatures.get(node.node_id) == signature:
+                    timings.append(0.0)
+                    continue
 
-            delta = time.perf_counter() - start
+            if hasattr(node, "process"):
+                start, delta = tree_profiling.process_node(node)
+            else:
+                start, delta = time.perf_counter(), 0.0
             total_time += delta
 
             if data_structure.DEBUG_MODE:
@@ -396,18 +504,13 @@ def do_update_general(node_list, nodes, procesed_nodes=set()):
             # reroute nodes can be in node variable
             [s.update_objects_number() for s in chain(node.inputs, node.outputs) if hasattr(s, 'update_objects_number')]
 
+            if track_changes and hasattr(node, "process"):
+                signatures[node.node_id] = get_node_signature(node)
+
         except Exception as err:
-            ng = nodes.id_data
-            update_error_nodes(ng, node_name, err)
-            #traceback.print_tb(err.__traceback__)
-            exception("Node %s had exception: %s", node_name, err)
-            
-            if hasattr(ng, "sv_show_error_in_tree"):
-                # not yet supported in monad trees..
-                if ng.sv_show_error_in_tree:
-                    error_text = traceback.format_exc()
-                    start_exception_drawing_with_bgl(ng, node_name, error_text, err)
-            
+            if track_changes and node is not None and hasattr(node, "process"):
+                signatures.pop(node.node_id, None)
+            report_node_error(ng, node_name, err)
             return None
 
     graphs.append(graph)
@@ -417,11 +520,136 @@ def do_update_general(node_list, nodes, procesed_nodes=set()):
     return timings
 
 
-def do_update(node_list, nodes):
+def is_thread_safe(node):
+    """
+    Whether process method of the node can be called from a worker thread.
+    Only node classes which were checked not to touch Blender data
+    declare `sv_thread_safe = True`; all other nodes are processed in the main thread.
+    """
+    if not hasattr(node, "process") or hasattr(node, "is_animatable"):
+        return False
+    return getattr(node, "sv_thread_safe", False) is True
+
+
+@profile(section="UPDATE")
+def do_update_parallel(node_lists, nodes, changed_nodes=None):
+    """
+    Update function which processes independent nodes of the given
+    update lists simultaneously in a thread pool.
+    A node is processed as soon as all nodes it depends on are processed.
+    Nodes which are not thread safe are processed in the main thread
+    in the order of update lists, while no other node is being processed.
+    If a node fails, nodes depending on it are not processed.
+    """
+    global graphs
+    graph = []
+    gather = graph.append
+    ng = nodes.id_data
+
+    track_changes = getattr(ng, "sv_incremental_update", False)
+    skip_unchanged = track_changes and changed_nodes is not None
+    signatures = node_signatures[ng.tree_id] if track_changes else None
+
+    clear_exception_drawing_with_bgl(nodes)
+
+    order = [name for node_list in node_lists for name in node_list]
+    position = {name: i for i, name in enumerate(order)}
+    deps = make_dep_dict(ng)
+    dependents = collections.defaultdict(list)
+    waiting_for = dict()
+    for name in order:
+        upstream = {dep for dep in deps[name] if dep in position}
+        waiting_for[name] = len(upstream)
+        for dep in upstream:
+            dependents[dep].append(name)
+
+    ready_safe = []
+    ready_serial = []
+
+    def make_ready(name):
+        node = nodes[name]
+        if is_thread_safe(node):
+            ready_safe.append(name)
+        else:
+            ready_serial.append(name)
+
+    for name in order:
+        if not waiting_for[name]:
+            make_ready(name)
+
+    def run(name):
+        return tree_profiling.process_node(nodes[name])
+
+    def on_processed(name, start, delta):
+        node = nodes[name]
+        if delta is not None:
+            if data_structure.DEBUG_MODE:
+                debug("Processed  %s in: %.4f", name, delta)
+            gather({"name" : name, "bl_idname": node.bl_idname, "start": start, "duration": delta})
+            [s.update_objects_number() for s in chain(node.inputs, node.outputs) if hasattr(s, 'update_objects_number')]
+            if track_changes and hasattr(node, "process"):
+                signatures[node.node_id] = get_node_signature(node)
+        for dependent in dependents[name]:
+            waiting_for[dependent] -= 1
+            if not waiting_for[dependent]:
+                make_ready(dependent)
+
+    def on_failed(name, err):
+        node = nodes[name]
+        if track_changes and hasattr(node, "process"):
+            signatures.pop(node.node_id, None)
+        report_node_error(ng, name, err)
+
+    def is_unchanged(name):
+        if not skip_unchanged or name in changed_nodes:
+            return False
+        signature = get_node_signature(nodes[name])
+        return signature is not None and signatures.get(nodes[name].node_id) == signature
+
+    running = dict()
+    with ThreadPoolExecutor() as executor:
+        while ready_safe or ready_serial or running:
+            # thread safe nodes are not started when there are nodes waiting for main thread,
+            # to let the pool drain
+            while ready_safe and not ready_serial:
+                name = ready_safe.pop()
+                if is_unchanged(name):
+                    on_processed(name, None, None)
+                else:
+                    running[executor.submit(run, name)] = name
+
+            if ready_serial and not running:
+                ready_serial.sort(key=position.get)
+                name = ready_serial.pop(0)
+                if is_unchanged(name) or not hasattr(nodes[name], "process"):
+                    on_processed(name, None, None)
+                    continue
+                try:
+                    start, delta = run(name)
+                except Exception as err:
+                    on_failed(name, err)
+                    continue
+                on_processed(name, start, delta)
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    start, delta = future.result()
+                except Exception as err:
+                    on_failed(name, err)
+                    continue
+                on_processed(name, start, delta)
+
+    graphs.append(graph)
+
+
+def do_update(node_list, nodes, changed_nodes=None):
     if data_structure.HEAT_MAP:
-        do_update_heat_map(node_list, nodes)
+        do_update_heat_map(node_list, nodes, changed_nodes)
     else:
-        do_update_general(node_list, nodes)
+        do_update_general(node_list, nodes, changed_nodes=changed_nodes)
 
 def build_update_list(ng=None):
     """
@@ -478,7 +706,10 @@ def process_from_nodes(nodes):
     ng = nodes[0].id_data
     update_list = make_tree_from_nodes(node_names, ng)
     reset_error_some_nodes(ng, update_list)
-    do_update(update_list, ng.nodes)
+    if getattr(ng, "sv_parallel_update", False) and not data_structure.HEAT_MAP:
+        do_update_parallel([update_list], ng.nodes, changed_nodes=set(node_names))
+    else:
+        do_update(update_list, ng.nodes, changed_nodes=set(node_names))
 
 
 def process_from_node(node):
@@ -506,7 +737,10 @@ def process_from_node(node):
         nodes = ng.nodes
         if not ng.sv_process:
             return
-        do_update(update_list, nodes)
+        if getattr(ng, "sv_parallel_update", False) and not data_structure.HEAT_MAP:
+            do_update_parallel([update_list], nodes, changed_nodes={node.name})
+        else:
+            do_update(update_list, nodes, changed_nodes={node.name})
     else:
         process_tree(ng)
 
@@ -533,8 +767,11 @@ def process_tree(ng=None):
         if not update_list:
             build_update_list(ng)
             update_list = update_cache.get(ng.name)
-        for l in update_list:
-            do_update(l, ng.nodes)
+        if getattr(ng, "sv_parallel_update", False) and not data_structure.HEAT_MAP:
+            do_update_parallel(update_list, ng.nodes)
+        else:
+            for l in update_list:
+                do_update(l, ng.nodes)
     else:
         pass
 
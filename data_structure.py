@@ -40,6 +40,8 @@ from sverchok.core.events import CurrentEvents, BlenderEventsTypes
 DEBUG_MODE = False
 HEAT_MAP = False
 RELOAD_EVENT = False
+# raise an error when a node changes shared input data in place (see core.socket_data.SvFrozenList)
+CHECK_INPUT_MUTATION = False
 
 # this is set correctly later.
 SVERCHOK_NAME = "sverchok"
@@ -1040,6 +1042,7 @@ def setup_init():
     """
     global DEBUG_MODE
     global HEAT_MAP
+    global CHECK_INPUT_MUTATION
     global SVERCHOK_NAME
     import sverchok
     SVERCHOK_NAME = sverchok.__name__
@@ -1047,6 +1050,9 @@ def setup_init():
     if addon:
         DEBUG_MODE = addon.preferences.show_debug
         HEAT_MAP = addon.preferences.heat_map
+        CHECK_INPUT_MUTATION = addon.preferences.check_input_mutation
+        from sverchok.utils.frame_cache import frame_cache
+        frame_cache.set_limits(addon.preferences.frame_cache_size * 1024 * 1024, addon.preferences.frame_cache_spill)
     else:
         print("Setup of preferences failed")
 
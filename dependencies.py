@@ -1,5 +1,8 @@
 
+import os
 import logging
+import importlib
+import importlib.util
 
 # Logging setup
 # we have to set up logging here separately, because dependencies.py is loaded before settings.py,
@@ -13,6 +16,59 @@ logger.addHandler(ch)
 
 info, debug, error = logger.info, logger.debug, logger.error
 
+# With SVERCHOK_LAZY_LOADING environment variable set, node modules are imported only when
+# they are needed (see sverchok.core), and optional dependencies are imported on first use
+lazy_loading = os.environ.get("SVERCHOK_LAZY_LOADING", "") not in {"", "0"}
+
+class SvLazyModule():
+    """
+    Stand-in for an installed module, which imports the module on first access to its attributes.
+    If the import fails (broken installation), the dependency is marked as not available.
+    """
+    def __init__(self, name, dependency=None):
+        self.__dict__['_name'] = name
+        self.__dict__['_dependency'] = dependency
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        if self._module is None:
+            try:
+                self.__dict__['_module'] = importlib.import_module(self._name)
+            except ImportError as e:
+                if self._dependency is not None:
+                    self._dependency.module = None
+                    self._dependency.message = f"{self._dependency.package} package is installed, but can not be imported: {e}"
+                error("Can't import %s: %s", self._name, e)
+                raise
+        return self._module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+def import_dependency(name, dependency=None):
+    """
+    Import optional dependency, raise ImportError if it is not installed.
+    In lazy loading mode only the presence of the module is checked, and the
+    module is imported on first use; `dependency` (SvDependency) is marked
+    as not available if that import fails.
+    """
+    if not lazy_loading:
+        return importlib.import_module(name)
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
+        raise ImportError(f"No module named '{name}'")
+    return SvLazyModule(name, dependency)
+
 class SvDependency():
     def __init__(self, package, url, module=None, message=None):
         self.package = package
@@ -67,7 +123,7 @@ else:
 scipy_d = sv_dependencies["scipy"] = SvDependency("scipy", "https://www.scipy.org/")
 scipy_d.pip_installable = True
 try:
-    import scipy
+    scipy = import_dependency("scipy", scipy_d)
     scipy_d.message = "SciPy is available"
     scipy_d.module = scipy
 except ImportError:
@@ -78,7 +134,7 @@ except ImportError:
 geomdl_d = sv_dependencies["geomdl"] = SvDependency("geomdl", "https://github.com/orbingol/NURBS-Python/tree/master/geomdl")
 geomdl_d.pip_installable = True
 try:
-    import geomdl
+    geomdl = import_dependency("geomdl", geomdl_d)
     geomdl_d.message = "geomdl package is available"
     geomdl_d.module = geomdl
 except ImportError:
@@ -89,7 +145,7 @@ except ImportError:
 skimage_d = sv_dependencies["skimage"] = SvDependency("scikit-image", "https://scikit-image.org/")
 skimage_d.pip_installable = True
 try:
-    import skimage
+    skimage = import_dependency("skimage", skimage_d)
     skimage_d.message = "SciKit-Image package is available"
     skimage_d.module = skimage
 except ImportError:
@@ -99,7 +155,7 @@ except ImportError:
 
 mcubes_d = sv_dependencies["mcubes"] = SvDependency("mcubes", "https://github.com/pmneila/PyMCubes")
 try:
-    import mcubes
+    mcubes = import_dependency("mcubes", mcubes_d)
     mcubes_d.message = "PyMCubes package is available"
     mcubes_d.module = mcubes
 except ImportError:
@@ -110,7 +166,7 @@ except ImportError:
 circlify_d = sv_dependencies["circlify"] = SvDependency("circlify", "https://github.com/elmotec/circlify")
 circlify_d.pip_installable = True
 try:
-    import circlify
+    circlify = import_dependency("circlify", circlify_d)
     circlify_d.message = "Circlify package is available"
     circlify_d.module = circlify
 except ImportError:
@@ -120,6 +176,8 @@ except ImportError:
 
 freecad_d = sv_dependencies["freecad"] = SvDependency("FreeCAD", "https://www.freecadweb.org/")
 try:
+    # FreeCAD is always imported at once: only its import makes
+    # FreeCAD's own modules (Part etc.) importable
     import FreeCAD
     freecad_d.message = "FreeCAD package is available"
     freecad_d.module = FreeCAD
@@ -131,7 +189,7 @@ except ImportError:
 cython_d = sv_dependencies["cython"] = SvDependency("Cython", "https://www.freecadweb.org/")
 cython_d.pip_installable = True
 try:
-    import Cython
+    Cython = import_dependency("Cython", cython_d)
     cython_d.message = "Cython package is available"
     cython_d.module = Cython
 except ImportError:
@@ -34,6 +34,7 @@ from sverchok.ui.sv_icons import node_icon, icon
 from sverchok.utils.context_managers import sv_preferences
 from sverchok.utils.extra_categories import get_extra_categories
 from sverchok.core.update_system import set_first_run
+from sverchok.dependencies import lazy_loading
 
 class SverchNodeCategory(NodeCategory):
     @classmethod
@@ -468,7 +469,9 @@ def make_categories():
                 continue
             rna = get_node_class_reference(nodetype)
             if not rna and not nodetype == 'separator':
-                info("Node `%s' is not available (probably due to missing dependencies).", nodetype)
+                # in lazy loading mode node classes are registered only when they are used
+                if not lazy_loading:
+                    info("Node `%s' is not available (probably due to missing dependencies).", nodetype)
             else:
                 node_item = SverchNodeItem.new(nodetype)
                 node_items.append(node_item)
@@ -34,6 +34,7 @@ from sverchok.core.update_system import (
     process_from_node, process_from_nodes,
     process_tree,
     get_original_node_color,
+    clear_link_dependencies,
     is_first_run,)
 from sverchok.core.links import (
     SvLinks)
@@ -263,6 +264,23 @@ class SverchCustomTree(NodeTree, SvNodeTreeCommon):
         default="None", update=lambda s, c: process_tree(s), options=set()
     )
 
+    # nodes which input data was not changed are not processed during partial updates of the tree
+    sv_incremental_update: BoolProperty(
+        name="Skip unchanged nodes",
+        description="Do not process nodes if data in their linked sockets was not changed since last processing "
+                    "(only on partial updates, 'Update' button still processes all nodes). "
+                    "Nodes which can read Blender data are always processed",
+        default=False,
+        options=set())
+
+    # independent nodes are processed simultaneously in a thread pool
+    sv_parallel_update: BoolProperty(
+        name="Parallel processing",
+        description="Process independent nodes simultaneously in several threads. "
+                    "Only nodes known not to access Blender data are processed in worker threads",
+        default=False,
+        options=set())
+
     # this mode will replace properties of some nodes so they could have lesser values for draft mode
     sv_draft: BoolProperty(
         name="Draft",
@@ -277,6 +295,7 @@ class SverchCustomTree(NodeTree, SvNodeTreeCommon):
         """
 
         CurrentEvents.new_event(BlenderEventsTypes.tree_update, self)
+        clear_link_dependencies(self)
 
         # this is a no-op if there's no drawing
         clear_exception_drawing_with_bgl(self.nodes)
@@ -303,6 +322,15 @@ class SverchCustomTree(NodeTree, SvNodeTreeCommon):
 class UpdateNodes:
     """Everything related with update system of nodes"""
 
+    # whether process method of the node can be called from a worker thread
+    # when the tree is processed in parallel; should be set only for nodes
+    # which do not read or write Blender data (except their own properties and sockets)
+    sv_thread_safe = False
+
+    # whether the node processes each object of its inputs independently, producing one object
+    # per object of matched inputs; then a vectorized monad can pass all its items through the node at once
+    sv_batch_capable = False
+
     # identifier of the node, should be used via `node_id` property
     # overriding the property without `skip_save` option can lead to wrong importing bgl viewer nodes
     n_id: StringProperty(options={'SKIP_SAVE'})
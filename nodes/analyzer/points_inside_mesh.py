@@ -29,6 +29,8 @@ from mathutils.noise import seed_set, random_unit_vector
 from sverchok.node_tree import SverchCustomTreeNode, throttled
 from sverchok.data_structure import updateNode, list_match_func, list_match_modes
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
+from sverchok.utils.inside_mesh import get_inside_test
+from sverchok.dependencies import scipy
 
 
 def generate_random_unitvectors():
@@ -40,7 +42,17 @@ def generate_random_unitvectors():
 directions = generate_random_unitvectors()
 
 
+# exactly what the criteria should be here is not clear, this seems enough.
+# number of samples -> number of samples that must say "inside"
+samples_threshold = {1: 1, 2: 1, 3: 2, 4: 3, 5: 4, 6: 4}
+
+
 def get_points_in_mesh(verts, faces, points, eps=0.0, num_samples=3):
+    if eps == 0.0:
+        # all points are tested at once
+        test = get_inside_test(verts, faces)
+        return test.inside_by_rays(points, directions[:num_samples], samples_threshold[num_samples]).tolist()
+
     mask_inside = []
 
     bvh = BVHTree.FromPolygons(verts, faces, all_triangles=False, epsilon=eps)
@@ -62,28 +74,16 @@ def get_points_in_mesh(verts, faces, points, eps=0.0, num_samples=3):
     if len(mask_inside) == 1:
         return mask_inside[0]
     else:
-        mask_totals = []
-        oversample = mask_totals.append
-        num_points = len(points)
-
-        # exactly what the criteria should be here is not clear, this seems enough.
-        for i in range(num_points):
-            fsum = sum(mask_inside[j][i] for j in range(num_samples))
-
-            if num_samples == 2:
-                oversample(fsum >= 1)
-            elif num_samples == 3:
-                oversample(fsum >= 2)
-            elif num_samples == 4:
-                oversample(fsum >= 3)
-            elif num_samples == 5:
-                oversample(fsum >= 4)
-            elif num_samples == 6:
-                oversample(fsum >= 4)
-        return mask_totals
+        threshold = samples_threshold[num_samples]
+        return [sum(samples) >= threshold for samples in zip(*mask_inside)]
 
 
 def are_inside(verts, faces, points, eps):
+    if eps == 0.0 and scipy is not None:
+        # all points are tested at once
+        test = get_inside_test(verts, faces)
+        return test.inside_by_nearest(points).tolist()
+
     bm = bmesh_from_pydata(verts, [], faces, normal_update=True)
     mask_inside = []
     mask = mask_inside.append
@@ -3,7 +3,6 @@ import numpy as np
 
 import bpy
 from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty, StringProperty
-from mathutils import kdtree
 from mathutils import bvhtree
 
 from sverchok.node_tree import SverchCustomTreeNode, throttled
@@ -81,6 +80,13 @@ class SvAttractorFieldNodeMk2(bpy.types.Node, SverchCustomTreeNode):
         default = 'AVG',
         update = updateNode)
 
+    nearest_count : IntProperty(
+            name = "Nearest count",
+            description = "Number of nearest attraction centers to average over, when Nearest join mode is used",
+            default = 1,
+            min = 1,
+            update = updateNode)
+
     signed : BoolProperty(
             name = "Signed",
             default = False,
@@ -116,6 +122,8 @@ class SvAttractorFieldNodeMk2(bpy.types.Node, SverchCustomTreeNode):
         layout.prop(self, 'attractor_type')
         if self.attractor_type != 'Mesh':
             layout.prop(self, 'merge_mode')
+            if self.attractor_type == 'Point' and self.merge_mode == 'MIN':
+                layout.prop(self, 'nearest_count')
         elif self.attractor_type == 'Mesh':
             layout.prop(self, 'signed', toggle=True)
         layout.prop(self, 'falloff_type')
@@ -132,12 +140,8 @@ class SvAttractorFieldNodeMk2(bpy.types.Node, SverchCustomTreeNode):
             vfields = [SvVectorFieldPointDistance(center, falloff=falloff) for center in centers]
             vfield = SvAverageVectorField(vfields)
         elif self.merge_mode == 'MIN':
-            kdt = kdtree.KDTree(len(centers))
-            for i, v in enumerate(centers):
-                kdt.insert(v, i)
-            kdt.balance()
-            vfield = SvKdtVectorField(kdt=kdt, falloff=falloff)
-            sfield = SvKdtScalarField(kdt=kdt, falloff=falloff)
+            vfield = SvKdtVectorField(vertices=centers, falloff=falloff, k=self.nearest_count)
+            sfield = SvKdtScalarField(vertices=centers, falloff=falloff, k=self.nearest_count)
         else: # SEP
             sfield = [SvScalarFieldPointDistance(center, falloff=falloff) for center in centers]
             vfield = [SvVectorFieldPointDistance(center, falloff=falloff) for center in centers]
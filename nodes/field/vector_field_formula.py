@@ -6,8 +6,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty, St
 
 from sverchok.node_tree import SverchCustomTreeNode, throttled
 from sverchok.data_structure import updateNode, zip_long_repeat, fullList, match_long_repeat
-from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled
-from sverchok.utils.script_importhelper import safe_names_np
+from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled, safe_eval_vectorized
 from sverchok.utils.logging import info, exception
 from sverchok.utils.math import (
         from_cylindrical, from_spherical,
@@ -146,43 +145,25 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
         def carthesian_in(x, y, z, V):
             variables.update(dict(x=x, y=y, z=z, V=V))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
-            if not isinstance(v1, np.ndarray):
-                v1 = np.full_like(x, v1)
-            if not isinstance(v2, np.ndarray):
-                v2 = np.full_like(x, v2)
-            if not isinstance(v3, np.ndarray):
-                v3 = np.full_like(x, v3)
+            v1 = safe_eval_vectorized(compiled1, variables, x)
+            v2 = safe_eval_vectorized(compiled2, variables, x)
+            v3 = safe_eval_vectorized(compiled3, variables, x)
             return out_coordinates(v1, v2, v3)
 
         def cylindrical_in(x, y, z, V):
             rho, phi, z = to_cylindrical_np((x, y, z), mode='radians')
             variables.update(dict(rho=rho, phi=phi, z=z, V=V))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
-            if not isinstance(v1, np.ndarray):
-                v1 = np.full_like(x, v1)
-            if not isinstance(v2, np.ndarray):
-                v2 = np.full_like(x, v2)
-            if not isinstance(v3, np.ndarray):
-                v3 = np.full_like(x, v3)
+            v1 = safe_eval_vectorized(compiled1, variables, x)
+            v2 = safe_eval_vectorized(compiled2, variables, x)
+            v3 = safe_eval_vectorized(compiled3, variables, x)
             return out_coordinates(v1, v2, v3)
 
         def spherical_in(x, y, z, V):
             rho, phi, theta = to_spherical_np((x, y, z), mode='radians')
             variables.update(dict(rho=rho, phi=phi, theta=theta, V=V))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
-            if not isinstance(v1, np.ndarray):
-                v1 = np.full_like(x, v1)
-            if not isinstance(v2, np.ndarray):
-                v2 = np.full_like(x, v2)
-            if not isinstance(v3, np.ndarray):
-                v3 = np.full_like(x, v3)
+            v1 = safe_eval_vectorized(compiled1, variables, x)
+            v2 = safe_eval_vectorized(compiled2, variables, x)
+            v3 = safe_eval_vectorized(compiled3, variables, x)
             return out_coordinates(v1, v2, v3)
 
         if self.input_mode == 'XYZ':
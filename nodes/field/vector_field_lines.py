@@ -8,6 +8,7 @@ from sverchok.node_tree import SverchCustomTreeNode, throttled
 from sverchok.data_structure import updateNode, zip_long_repeat, repeat_last_for_length, match_long_repeat, ensure_nesting_level
 from sverchok.utils.logging import info, exception
 from sverchok.utils.sv_mesh_utils import mesh_join
+from sverchok.utils.field.integrate import integrate_fixed, integrate_adaptive
 
 class SvVectorFieldLinesNode(bpy.types.Node, SverchCustomTreeNode):
     """
@@ -41,7 +42,29 @@ class SvVectorFieldLinesNode(bpy.types.Node, SverchCustomTreeNode):
         default = True,
         update = updateNode)
 
+    methods = [
+            ('EULER', "Euler", "Forward Euler method, one field evaluation per step", 0),
+            ('RK4', "Runge-Kutta 4", "Classic 4th order Runge-Kutta method, four field evaluations per step; much more precise for the same step", 1),
+            ('RK45', "Adaptive", "Dormand-Prince 5(4) method with step control for each line; Step and Iterations define length of lines, and the number of points depends on the tolerance", 2)
+        ]
+
+    method : EnumProperty(
+        name = "Method",
+        items = methods,
+        default = 'EULER',
+        update = updateNode)
+
+    tolerance : FloatProperty(
+        name = "Tolerance",
+        default = 1e-4,
+        min = 1e-12,
+        precision = 6,
+        update = updateNode)
+
     def draw_buttons(self, context, layout):
+        layout.prop(self, 'method', text='')
+        if self.method == 'RK45':
+            layout.prop(self, 'tolerance')
         layout.prop(self, 'normalize', toggle=True)
         layout.prop(self, 'join', toggle=True)
 
@@ -54,21 +77,16 @@ class SvVectorFieldLinesNode(bpy.types.Node, SverchCustomTreeNode):
         self.outputs.new('SvStringsSocket', 'Edges')
 
     def generate_all(self, field, vertices, step, iterations):
-        new_verts = np.empty((iterations, len(vertices), 3))
-        for i in range(iterations):
-            xs = vertices[:,0]
-            ys = vertices[:,1]
-            zs = vertices[:,2]
-            new_xs, new_ys, new_zs = field.evaluate_grid(xs, ys, zs)
-            vectors = np.stack((new_xs, new_ys, new_zs)).T
-            if self.normalize:
-                norms = np.linalg.norm(vectors, axis=1)[np.newaxis].T
-                vertices = vertices + step * vectors / norms
-            else:
-                vertices = vertices + step * vectors
-            new_verts[i,:,:] = vertices
-        result = np.transpose(new_verts, axes=(1, 0, 2))
-        return result.tolist()
+        # each line starts with its start point, so a line from a point
+        # where the field is zero is not empty with any method
+        if self.method == 'RK45':
+            lines = integrate_adaptive(field, vertices, step * iterations,
+                        tolerance = self.tolerance, step = step,
+                        normalize = self.normalize)
+            return [np.concatenate((vertex[np.newaxis], line)).tolist() for vertex, line in zip(vertices, lines)]
+        result = integrate_fixed(field, vertices, step, iterations,
+                    method = self.method, normalize = self.normalize)
+        return np.concatenate((vertices[:, np.newaxis], result), axis=1).tolist()
 
     def process(self):
         if not any(socket.is_linked for socket in self.outputs):
@@ -102,7 +120,7 @@ class SvVectorFieldLinesNode(bpy.types.Node, SverchCustomTreeNode):
                     new_edges = []
                 else:
                     new_verts = self.generate_all(field, np.array(vertices), step, iterations)
-                    new_edges = [[(i,i+1) for i in range(iterations-1)]] * len(vertices)
+                    new_edges = [[(i,i+1) for i in range(len(line)-1)] for line in new_verts]
                     if self.join:
                         new_verts, new_edges, _ = mesh_join(new_verts, new_edges, [[]] * len(new_verts))
                 if self.join:
@@ -214,6 +214,7 @@ class SvLineNodeMK4(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Line'
     bl_icon = 'GRIP'
     sv_icon = 'SV_LINE'
+    sv_thread_safe = True
 
     def update_sockets(self, context):
         """ need to do UX transformation before updating node"""
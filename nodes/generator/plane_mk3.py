@@ -231,6 +231,7 @@ class SvPlaneNodeMk3(DraftMode, bpy.types.Node, SverchCustomTreeNode):
     bl_idname = 'SvPlaneNodeMk3'
     bl_label = 'Plane'
     bl_icon = 'MESH_PLANE'
+    sv_thread_safe = True
 
     correct_output_modes = [
         ('NONE', 'None', 'Leave at multi-object level (Advanced)', 0),
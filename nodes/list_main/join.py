@@ -94,6 +94,7 @@ class ListJoinNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'List Join'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_LIST_JOIN'
+    sv_thread_safe = True
 
     JoinLevel: IntProperty(
         name='JoinLevel', description='Choose join level of data (see help)',
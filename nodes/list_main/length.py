@@ -21,6 +21,7 @@ class ListLengthNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'List Length'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_LIST_LEN'
+    sv_thread_safe = True
 
     level: IntProperty(name='level_to_count', default=1, min=0, update=updateNode)
 
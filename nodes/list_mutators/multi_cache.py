@@ -21,11 +21,12 @@ import inspect
 from itertools import product
 from mathutils.noise import seed_set, random
 import bpy
-from bpy.props import FloatVectorProperty, IntVectorProperty, IntProperty, BoolProperty, StringProperty, EnumProperty
+from bpy.props import FloatVectorProperty, IntVectorProperty, IntProperty, BoolProperty, StringProperty, EnumProperty, CollectionProperty
 
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import changable_sockets, dataCorrect, updateNode, zip_long_repeat
+from sverchok.utils.frame_cache import frame_cache
 
 
 class SvvMultiCacheReset(bpy.types.Operator):
@@ -42,6 +43,20 @@ class SvvMultiCacheReset(bpy.types.Operator):
         updateNode(node, context)
         return {'FINISHED'}
 
+class SvMultiCacheBucket(bpy.types.PropertyGroup):
+    '''Stored copy of one bucket, to keep the data in the .blend file; name is repr of the bucket key'''
+    data: StringProperty()
+
+
+def bucket_key(bucket):
+    '''buckets are keyed as in a dict: 1 and 1.0 are the same bucket, 1.5 is another one'''
+    if isinstance(bucket, float) and bucket.is_integer():
+        return int(bucket)
+    return bucket
+
+# {node_id: {repr of bucket key: index in node.buckets}}
+bucket_indexes = dict()
+
 class SvMultiCacheNode(bpy.types.Node, SverchCustomTreeNode):
     """
     Triggers: Store List
@@ -76,8 +91,10 @@ class SvMultiCacheNode(bpy.types.Node, SverchCustomTreeNode):
         default=True,
         update=pause_recording_update)
 
-    node_mem = {}
+    # legacy storage of all buckets in one string, only read to upgrade old files
     memory: StringProperty(default="")
+    # written by process(), so the node must not declare sv_thread_safe
+    buckets: CollectionProperty(type=SvMultiCacheBucket)
 
     def draw_buttons(self, context, layout):
 
@@ -94,18 +111,58 @@ class SvMultiCacheNode(bpy.types.Node, SverchCustomTreeNode):
         self.fill_empty_dict()
 
 
-    def write_memory_prop(self, data):
-        '''write values to string property'''
-        self.memory = ''.join(str(data))
+    def get_bucket_item(self, name):
+        '''stored bucket by its name, or None'''
+        indexes = bucket_indexes.get(self.node_id)
+        if indexes is None or len(indexes) != len(self.buckets):
+            indexes = {item.name: idx for idx, item in enumerate(self.buckets)}
+            bucket_indexes[self.node_id] = indexes
+        idx = indexes.get(name)
+        if idx is None:
+            return None
+        item = self.buckets[idx]
+        if item.name != name:
+            # the collection was changed outside of the node (undo etc.)
+            del bucket_indexes[self.node_id]
+            return self.get_bucket_item(name)
+        return item
+
+    def write_bucket(self, bucket, data):
+        '''store the bucket in memory and write only this bucket to its string property'''
+        bucket = bucket_key(bucket)
+        frame_cache.put(self.node_id, bucket, data)
+        name = repr(bucket)
+        item = self.get_bucket_item(name)
+        if item is None:
+            item = self.buckets.add()
+            item.name = name
+            bucket_indexes[self.node_id][name] = len(self.buckets) - 1
+        item.data = str(data)
+
+    def read_bucket(self, bucket):
+        '''bucket data from memory, or from its string property if it was evicted or the file was reopened'''
+        bucket = bucket_key(bucket)
+        data = frame_cache.get(self.node_id, bucket)
+        if data is None:
+            item = self.get_bucket_item(repr(bucket))
+            if item is not None:
+                data = ast.literal_eval(item.data)
+                frame_cache.put(self.node_id, bucket, data)
+        return data
 
     def check_memory_prop(self):
+        '''move buckets stored by older versions into per-bucket properties'''
         tx = self.memory
         if len(tx) > 1:
-            return ast.literal_eval(tx)
-        return []
+            for bucket, data in ast.literal_eval(tx).items():
+                self.write_bucket(bucket, data)
+            self.memory = ""
 
     def fill_empty_dict(self):
-        self.node_mem[self.node_id] = {}
+        frame_cache.clear(self.node_id)
+        bucket_indexes.pop(self.node_id, None)
+        self.buckets.clear()
+        self.memory = ""
 
     def sv_update(self):
         '''adapt socket type to input type'''
@@ -119,12 +176,7 @@ class SvMultiCacheNode(bpy.types.Node, SverchCustomTreeNode):
             return
         in_bucket_s = self.inputs['In Bucket'].sv_get()[0]
         out_bucket_s = self.inputs['Out Bucket'].sv_get()[0]
-        if not self.node_id in self.node_mem:
-            text_memory = self.check_memory_prop()
-            if text_memory:
-                self.node_mem[self.node_id] = text_memory
-            else:
-                self.fill_empty_dict()
+        self.check_memory_prop()
 
         data_out = []
         add = data_out.extend if self.unwrap else data_out.append
@@ -132,20 +184,20 @@ class SvMultiCacheNode(bpy.types.Node, SverchCustomTreeNode):
             data = self.inputs['Data'].sv_get()
             if len(in_bucket_s) > 1:
                 for in_bucket, sub_list in zip_long_repeat(in_bucket_s, data):
-                    self.node_mem[self.node_id][in_bucket] = sub_list
+                    self.write_bucket(in_bucket, sub_list)
             else:
-                self.node_mem[self.node_id][in_bucket_s[0]] = data
-            self.write_memory_prop(self.node_mem[self.node_id])
+                self.write_bucket(in_bucket_s[0], data)
 
         for out_bucket in out_bucket_s:
-            if out_bucket in self.node_mem[self.node_id]:
-                add(self.node_mem[self.node_id][out_bucket])
+            bucket_data = self.read_bucket(out_bucket)
+            if bucket_data is not None:
+                add(bucket_data)
             else:
-                self.node_mem[self.node_id][out_bucket] = [[]]
+                self.write_bucket(out_bucket, [[]])
 
 
         self.outputs['Data'].sv_set(data_out)
 
 
-classes = [SvMultiCacheNode, SvvMultiCacheReset]
+classes = [SvMultiCacheBucket, SvMultiCacheNode, SvvMultiCacheReset]
 register, unregister = bpy.utils.register_classes_factory(classes)
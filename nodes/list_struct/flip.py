@@ -63,6 +63,7 @@ class ListFlipNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'List Flip'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_LIST_FLIP'
+    sv_thread_safe = True
 
     level: IntProperty(name='level_to_count', default=2, min=0, max=4, update=updateNode)
     typ: StringProperty(name='typ', default='')
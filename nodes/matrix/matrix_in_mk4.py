@@ -47,6 +47,7 @@ class SvMatrixInNodeMK4(bpy.types.Node, SverchCustomTreeNode, SvAngleHelper):
     bl_idname = 'SvMatrixInNodeMK4'
     bl_label = 'Matrix In'
     sv_icon = 'SV_MATRIX_IN'
+    sv_thread_safe = True
 
     def update_rotation_mode(self, context):
 
@@ -18,6 +18,8 @@
 
 from math import sin, cos, pi, sqrt, pow
 from functools import reduce
+from collections import defaultdict
+import numpy as np
 
 import bpy
 from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty
@@ -523,6 +525,53 @@ class SvAdaptivePolygonsNodeMk2(bpy.types.Node, SverchCustomTreeNode):
         prod = reduce(lambda x,y: x*y, scales, 1.0)
         return pow(prod, 1.0/n)
 
+    def _rotate_donor(self, donor, donor_verts_o, angle):
+        """
+        Calculate rotated donor vertices, and their bounds, in `donor`.
+        """
+        X, Y = self.get_other_axes()
+
+        donor.verts_v = self.rotate_z(donor_verts_o, angle)
+
+        if self.xy_mode == 'BOUNDS' or self.z_scale == 'AUTO' :
+            donor.max_x = max(v[X] for v in donor.verts_v)
+            donor.min_x = min(v[X] for v in donor.verts_v)
+            donor.max_y = max(v[Y] for v in donor.verts_v)
+            donor.min_y = min(v[Y] for v in donor.verts_v)
+
+        if self.xy_mode == 'BOUNDS':
+            donor.tri_vert_1, donor.tri_vert_2, donor.tri_vert_3 = self.bounding_triangle(donor.verts_v)
+
+    def _get_map_mode(self, n, m):
+        """
+        Define TRI/QUAD mode for the face with n vertices, based on node settings.
+        """
+        if not m:
+            return self.mask_mode
+        if n == 3:
+            if self.frame_mode == 'ALWAYS':
+                return 'FRAME'
+            else:
+                if self.map_mode == 'QUADTRI':
+                    return 'TRI'
+                else: # self.map_mode == 'QUADS':
+                    return 'QUAD'
+        elif n == 4:
+            if self.frame_mode in ['ALWAYS', 'NGONQUAD']:
+                return 'FRAME'
+            else:
+                return 'QUAD'
+        else:
+            if self.frame_mode in ['ALWAYS', 'NGONQUAD', 'NGONS']:
+                return 'FRAME'
+            else:
+                if self.ngon_mode == 'QUADS':
+                    return 'QUAD'
+                elif self.ngon_mode == 'ASIS':
+                    return 'ASIS'
+                else:
+                    return 'SKIP'
+
     def _process_face(self, map_mode, output, recpt_face_data, donor, zcoef, zoffset, angle, wcoef, facerot):
 
         X, Y = self.get_other_axes()
@@ -705,6 +754,118 @@ class SvAdaptivePolygonsNodeMk2(bpy.types.Node, SverchCustomTreeNode):
                     sub_recpt.vertices_idxs = [0, 1, 2, 3]
                     self._process_face(sub_map_mode, output, sub_recpt, donor, zcoef, zoffset, angle, wcoef, facerot)
 
+    def _process_batched(self, bm, faces_recpt, donor, donor_verts_o, z_size, zcoefs, zoffsets, zrotations, wcoefs, facerots, mask):
+        """
+        Faster equivalent of calling _process_face for each recipient face.
+        Recipient faces are grouped by mapping mode, number of vertices and
+        donor rotation angle; all faces of a group are mapped at once by
+        numpy. This supports only the case of single donor object without
+        Frame / Fan mode and automatic Z scale.
+        """
+        X, Y = self.get_other_axes()
+        Z = self.normal_axis_idx()
+
+        n_faces = len(faces_recpt)
+        verts_co = np.array([v.co[:] for v in bm.verts])
+        if self.use_shell_factor:
+            verts_normal = np.array([(v.normal * v.calc_shell_factor())[:] for v in bm.verts])
+        else:
+            verts_normal = np.array([v.normal[:] for v in bm.verts])
+        faces_normal = np.array([f.normal[:] for f in bm.faces])
+
+        zcoefs = np.array(zcoefs[:n_faces], dtype=np.float64)
+        zoffsets = np.array(zoffsets[:n_faces], dtype=np.float64)
+        wcoefs = np.array(wcoefs[:n_faces], dtype=np.float64)
+        if self.z_scale == 'CONST':
+            if abs(z_size) < 1e-6:
+                zcoefs = np.zeros(n_faces)
+            else:
+                zcoefs = zcoefs / z_size
+
+        # Group faces by the way they are to be processed.
+        map_modes = [self._get_map_mode(len(face), m) for face, m in zip(faces_recpt, mask)]
+        groups = defaultdict(list)
+        for face_idx, (face, map_mode, angle) in enumerate(zip(faces_recpt, map_modes, zrotations)):
+            if map_mode != 'SKIP':
+                groups[(map_mode, len(face), angle)].append(face_idx)
+
+        new_verts = dict()
+        for (map_mode, n, angle), face_idxs in groups.items():
+            if map_mode == 'ASIS':
+                continue
+            group_donor = DonorData()
+            group_donor.tri_vert_1, group_donor.tri_vert_2, group_donor.tri_vert_3 = donor.tri_vert_1, donor.tri_vert_2, donor.tri_vert_3
+            self._rotate_donor(group_donor, donor_verts_o, angle)
+            donor_verts = np.array([v[:] for v in group_donor.verts_v])
+
+            face_verts = np.array([faces_recpt[i] for i in face_idxs])
+            if map_mode == 'TRI':
+                corners = self.tri_vert_idxs
+            else:
+                corners = [idx % n for idx in self.quad_vert_idxs]
+            # Indexes of vertices of each face, rotated by facerot
+            positions = [[corners[(j + facerots[i]) % len(corners)] for j in range(len(corners))] for i in face_idxs]
+            corner_idxs = np.take_along_axis(face_verts, np.array(positions), axis=1)
+            dst_verts = verts_co[corner_idxs]
+            dst_normals = verts_normal[corner_idxs]
+
+            wcoef = wcoefs[face_idxs][:, np.newaxis]
+            if map_mode == 'TRI':
+                # Barycentric coordinates of donor vertices in the
+                # source triangle, which is scaled by 1/wcoef.
+                tri = np.array([self.to2d(group_donor.tri_vert_1)[:], self.to2d(group_donor.tri_vert_2)[:], self.to2d(group_donor.tri_vert_3)[:]])
+                mat = np.linalg.inv(np.array([tri[0] - tri[2], tri[1] - tri[2]]).T)
+                ab = donor_verts[:, [X, Y]] @ mat.T
+                a = ab[:,0][np.newaxis] * wcoef - (mat @ tri[2])[0]
+                b = ab[:,1][np.newaxis] * wcoef - (mat @ tri[2])[1]
+                weights = np.stack((a, b, 1.0 - a - b), axis=2)
+            else:
+                xs = donor_verts[:, X]
+                ys = donor_verts[:, Y]
+                if self.xy_mode == 'BOUNDS':
+                    xs = self.map_bounds(group_donor.min_x, group_donor.max_x, xs)
+                    ys = self.map_bounds(group_donor.min_y, group_donor.max_y, ys)
+                # Bilinear interpolation from [-1/2; 1/2] x [-1/2; 1/2] square
+                u = xs[np.newaxis] * wcoef + 0.5
+                v = ys[np.newaxis] * wcoef + 0.5
+                weights = np.stack(((1-u)*(1-v), u*(1-v), u*v, (1-u)*v), axis=2)
+
+            locs = np.einsum('fvk,fki->fvi', weights, dst_verts)
+            if self.normal_mode == 'MAP':
+                normals = np.einsum('fvk,fki->fvi', weights, dst_normals)
+                if self.normal_interp_mode == 'SMOOTH':
+                    # Zero normals are left as is, as Vector.normalize() does
+                    lengths = np.linalg.norm(normals, axis=2, keepdims=True)
+                    normals = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+            else:
+                normals = faces_normal[face_idxs][:, np.newaxis]
+            offsets = donor_verts[:, Z][np.newaxis] * zcoefs[face_idxs][:, np.newaxis] + zoffsets[face_idxs][:, np.newaxis]
+            verts = locs + normals * offsets[:, :, np.newaxis]
+            for face_idx, face_new_verts in zip(face_idxs, verts.tolist()):
+                new_verts[face_idx] = list(map(tuple, face_new_verts))
+
+        output = OutputData()
+        recpt_face_idx = 0
+        for face_idx, (face, map_mode) in enumerate(zip(faces_recpt, map_modes)):
+            if map_mode == 'SKIP':
+                continue
+            if map_mode == 'ASIS':
+                n = len(face)
+                output.verts_out.append(list(map(tuple, verts_co[face].tolist())))
+                output.faces_out.append([list(range(n))])
+                output.vert_recpt_idx_out.append([recpt_face_idx] * n)
+                output.face_recpt_idx_out.append([recpt_face_idx] * n)
+            else:
+                face_new_verts = new_verts[face_idx]
+                output.verts_out.append(face_new_verts)
+                output.faces_out.append(donor.faces_i)
+                output.face_data_out.append(donor.face_data_i)
+                output.vert_recpt_idx_out.append([recpt_face_idx] * len(face_new_verts))
+                output.face_recpt_idx_out.append([recpt_face_idx] * len(donor.faces_i))
+            recpt_face_idx += 1
+
+        return output
+
     def _process(self, verts_recpt, faces_recpt, verts_donor, faces_donor, face_data_donor, frame_widths, zcoefs, zoffsets, zrotations, wcoefs, facerots, mask):
         bm = bmesh_from_pydata(verts_recpt, [], faces_recpt, normal_update=True)
         bm.verts.ensure_lookup_table()
@@ -748,6 +909,14 @@ class SvAdaptivePolygonsNodeMk2(bpy.types.Node, SverchCustomTreeNode):
             # so it's size along Z is not going to change.
             z_size = diameter(donor_verts_o, Z)
 
+        if single_donor and self.frame_mode == 'NEVER' and self.z_scale != 'AUTO':
+            donor.faces_i = faces_donor[0]
+            donor.face_data_i = face_data_donor[0]
+            output = self._process_batched(bm, faces_recpt, donor, donor_verts_o, z_size,
+                                zcoefs, zoffsets, zrotations, wcoefs, facerots, mask)
+            bm.free()
+            return output
+
         output = OutputData()
 
         prev_angle = None
@@ -780,16 +949,7 @@ class SvAdaptivePolygonsNodeMk2(bpy.types.Node, SverchCustomTreeNode):
             # We have to recalculate rotated vertices only if
             # the rotation angle have changed.
             if prev_angle is None or angle != prev_angle or not single_donor:
-                donor.verts_v = self.rotate_z(donor_verts_o, angle)
-
-                if self.xy_mode == 'BOUNDS' or self.z_scale == 'AUTO' :
-                    donor.max_x = max(v[X] for v in donor.verts_v)
-                    donor.min_x = min(v[X] for v in donor.verts_v)
-                    donor.max_y = max(v[Y] for v in donor.verts_v)
-                    donor.min_y = min(v[Y] for v in donor.verts_v)
-
-                if self.xy_mode == 'BOUNDS':
-                    donor.tri_vert_1, donor.tri_vert_2, donor.tri_vert_3 = self.bounding_triangle(donor.verts_v)
+                self._rotate_donor(donor, donor_verts_o, angle)
 
             prev_angle = angle
 
@@ -799,35 +959,7 @@ class SvAdaptivePolygonsNodeMk2(bpy.types.Node, SverchCustomTreeNode):
                 else:
                     zcoef = zcoef / z_size
 
-            # Define TRI/QUAD mode based on node settings.
-            n = len(recpt_face)
-            if not m:
-                map_mode = self.mask_mode
-            else:
-                if n == 3:
-                    if self.frame_mode == 'ALWAYS':
-                        map_mode = 'FRAME'
-                    else:
-                        if self.map_mode == 'QUADTRI':
-                            map_mode = 'TRI'
-                        else: # self.map_mode == 'QUADS':
-                            map_mode = 'QUAD'
-                elif n == 4:
-                    if self.frame_mode in ['ALWAYS', 'NGONQUAD']:
-                        map_mode = 'FRAME'
-                    else:
-                        map_mode = 'QUAD'
-                else:
-                    if self.frame_mode in ['ALWAYS', 'NGONQUAD', 'NGONS']:
-                        map_mode = 'FRAME'
-                    else:
-                        if self.ngon_mode == 'QUADS':
-                            map_mode = 'QUAD'
-                        elif self.ngon_mode == 'ASIS':
-                            map_mode = 'ASIS'
-                        else:
-                            map_mode = 'SKIP'
-
+            map_mode = self._get_map_mode(len(recpt_face), m)
             if map_mode == 'SKIP':
                 # Skip this recipient's face - do not produce any vertices/faces for it
                 continue
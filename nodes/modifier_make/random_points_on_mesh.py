@@ -7,12 +7,13 @@
 
 
 from typing import NamedTuple, Any, List, Tuple
-import random
-from itertools import chain, repeat
+from itertools import chain, repeat, product
+
+import numpy as np
 
 import bpy
 from mathutils import Vector
-from mathutils.geometry import tessellate_polygon, area_tri
+from mathutils.geometry import tessellate_polygon
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
@@ -46,26 +47,84 @@ INPUT_CONFIG = [
 
 class NodeProperties(NamedTuple):
     proportional: bool
+    min_distance: float = 0.0
 
 
 def node_process(inputs: InputData, properties: NodeProperties):
-    me = TriangulatedMesh([Vector(co) for co in inputs.verts], inputs.faces)
+    me = TriangulatedMesh(inputs.verts, inputs.faces)
     if properties.proportional:
         me.use_even_points_distribution()
     if inputs.face_weight:
         me.set_custom_face_weights(inputs.face_weight)
-    return me.generate_random_points(inputs.number[0], inputs.seed[0])  # todo [0] <-- ?!
+    return me.generate_random_points(inputs.number[0], inputs.seed[0], properties.min_distance)  # todo [0] <-- ?!
+
+
+def close_pairs(points, radius):
+    """
+    All pairs of points (i < j) closer than radius to each other,
+    found with a spatial hash: uniform grid with cell size of radius.
+    Returns two arrays of indexes.
+    """
+    cells = np.floor(points / radius).astype(np.int64)
+    cells -= cells.min(axis=0) - 1
+    dims = cells.max(axis=0) + 2
+    if np.prod(dims.astype(np.float64)) >= 2 ** 62:
+        raise ValueError(f"Minimal distance {radius} is too small for the size of the mesh")
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    order = np.argsort(keys, kind='stable')
+    cell_keys, cell_starts, cell_counts = np.unique(keys[order], return_index=True, return_counts=True)
+
+    all_i, all_j = [], []
+    for dx, dy, dz in product((-1, 0, 1), repeat=3):
+        neighbour_keys = keys + (dx * dims[1] + dy) * dims[2] + dz
+        pos = np.searchsorted(cell_keys, neighbour_keys)
+        pos[pos == len(cell_keys)] = 0
+        found = np.flatnonzero(cell_keys[pos] == neighbour_keys)
+        counts = cell_counts[pos[found]]
+        i = np.repeat(found, counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        j = order[np.repeat(cell_starts[pos[found]], counts) + local]
+        close = (i < j) & (np.sum((points[i] - points[j]) ** 2, axis=1) < radius * radius)
+        all_i.append(i[close])
+        all_j.append(j[close])
+    return np.concatenate(all_i), np.concatenate(all_j)
+
+
+def poisson_disk_mask(points, radius):
+    """
+    Mask of points to keep so that no two kept points are closer than radius.
+    The result is the same as of accepting points one by one in their order,
+    skipping those which are too close to already accepted ones, but it is
+    found for all points at once: each round accepts the points which have no
+    undecided neighbours with lower index, and rejects neighbours of accepted ones.
+    """
+    UNDECIDED, ACCEPTED, REJECTED = 0, 1, 2
+    state = np.zeros(len(points), dtype=np.int8)
+    if not len(points):
+        return state.astype(bool)
+    i, j = close_pairs(points, radius)
+    while True:
+        active = (state[i] == UNDECIDED) & (state[j] == UNDECIDED)
+        i, j = i[active], j[active]
+        if not len(i):
+            state[state == UNDECIDED] = ACCEPTED
+            break
+        blocked = np.zeros(len(points), dtype=bool)
+        blocked[j] = True
+        state[(state == UNDECIDED) & ~blocked] = ACCEPTED
+        state[j[state[i] == ACCEPTED]] = REJECTED
+    return state == ACCEPTED
 
 
 class TriangulatedMesh:
-    def __init__(self, verts: List[Vector], faces: List[List[int]]):
-        self._verts = verts
+    def __init__(self, verts, faces: List[List[int]]):
+        self._verts = np.asarray(verts, dtype=np.float64).reshape((-1, 3))
         self._faces = faces
         self._face_weights = None
 
-        self._tri_faces = []
-        self._tri_face_areas = []
-        self._old_face_indexes_per_tri = []
+        self._tri_faces = np.zeros((0, 3), dtype=np.int64)
+        self._tri_face_areas = None
+        self._old_face_indexes_per_tri = np.zeros(0, dtype=np.int64)
 
         self._triangulate()
 
@@ -73,64 +132,110 @@ class TriangulatedMesh:
         self._face_weights = self.tri_face_areas if even else None
 
     def set_custom_face_weights(self, custom_weights):
-        weights_per_tri = self._face_attrs_to_tri_face_attrs(custom_weights)
-        if self._face_weights:
-            self._face_weights *= weights_per_tri  # can be troubles if set custom weights several times
+        weights_per_tri = np.clip(self._face_attrs_to_tri_face_attrs(custom_weights), 0, None)
+        if self._face_weights is not None:
+            self._face_weights = self._face_weights * weights_per_tri
         else:
             self._face_weights = weights_per_tri
 
-    def generate_random_points(self, random_points_total: int, seed: int) -> Tuple[list, list]:
-        random.seed(seed)
-        points_total_per_face = self._distribute_points(random_points_total)
-        random_points = []
-        old_face_indexes_per_point = []
-        for tri_face, face_index, points_total in zip(self._tri_faces,
-                                                      self._old_face_indexes_per_tri,
-                                                      points_total_per_face):
-            tri_random_points = self._get_random_vectors_on_tri(*[self._verts[i] for i in tri_face], points_total)
-            random_points.extend(tri_random_points)
-            old_face_indexes_per_point.extend([face_index for _ in range(len(tri_random_points))])
-        return [v[:] for v in random_points], old_face_indexes_per_point
+    def generate_random_points(self, random_points_total: int, seed: int, min_distance: float = 0.0) -> Tuple[list, list]:
+        """
+        Random points and indexes of faces they lie on. The same seed gives the same points.
+        If min_distance is given, points closer than that to previous ones are removed
+        (Poisson disk sampling), so there can be less points than requested.
+        """
+        rng = np.random.default_rng(int(seed) % 2 ** 32)
+        points_total_per_tri = self._distribute_points(int(random_points_total), rng)
+        tri_idxs = np.repeat(np.arange(len(self._tri_faces)), points_total_per_tri)
+        v1, v2, v3 = (self._verts[self._tri_faces[tri_idxs, i]] for i in range(3))
+        u = rng.random((len(tri_idxs), 2))
+        # points of the other half of the parallelogram are reflected into the triangle
+        outside = u.sum(axis=1) > 1
+        u[outside] = 1 - u[outside]
+        points = v1 + (v2 - v1) * u[:, 0, np.newaxis] + (v3 - v1) * u[:, 1, np.newaxis]
+        face_idxs = self._old_face_indexes_per_tri[tri_idxs]
+        if min_distance > 0:
+            mask = poisson_disk_mask(points, min_distance)
+            points, face_idxs = points[mask], face_idxs[mask]
+        return list(map(tuple, points.tolist())), face_idxs.tolist()
 
     @property
     def tri_face_areas(self):
-        if not self._tri_face_areas:
-            self._tri_face_areas = [area_tri(*[self._verts[i] for i in f]) for f in self._tri_faces]
+        if self._tri_face_areas is None:
+            v1, v2, v3 = (self._verts[self._tri_faces[:, i]] for i in range(3))
+            self._tri_face_areas = np.linalg.norm(np.cross(v2 - v1, v3 - v1), axis=1) / 2
         return self._tri_face_areas
 
-    def _distribute_points(self, random_points_total: int) -> List[int]:
-        # generate list of numbers which mean how many points should be created on face
-        points_total_per_face = [0 for _ in range(len(self._tri_faces))]
-        chosen_faces = random.choices(range(len(self._tri_faces)), self._face_weights, k=random_points_total)
-        for i in chosen_faces:
-            points_total_per_face[i] += 1
-        return points_total_per_face
+    def _distribute_points(self, random_points_total: int, rng) -> np.ndarray:
+        # generate array of numbers which mean how many points should be created on each triangle
+        n_tris = len(self._tri_faces)
+        if not n_tris or random_points_total <= 0:
+            return np.zeros(n_tris, dtype=np.int64)
+        if self._face_weights is None:
+            weights = np.ones(n_tris)
+        else:
+            weights = np.asarray(self._face_weights, dtype=np.float64)
+        total_weight = weights.sum()
+        if total_weight <= 0:
+            return np.zeros(n_tris, dtype=np.int64)
+        return rng.multinomial(random_points_total, weights / total_weight)
 
     def _triangulate(self):
-        # generate list of triangle faces and list of indexes which points to initial faces for each new triangle
-        for i, f in enumerate(self._faces):
-            face_verts = [[self._verts[i] for i in f]]
-            # [[v1,v2,v3,v4]] - face_verts
-            for tri_face in tessellate_polygon(face_verts):
-                self._tri_faces.append([f[itf] for itf in tri_face])
-                self._old_face_indexes_per_tri.append(i)
-
-    @staticmethod
-    def _get_random_vectors_on_tri(v1, v2, v3, number):
-        # returns random vertices for given triangle
-        out = []
-        for _ in range(number):
-            u1 = random.random()
-            u2 = random.random()
-            u1 = u1 if u1 + u2 <= 1 else 1 - u1
-            u2 = u2 if u1 + u2 <= 1 else 1 - u2
-            side1 = v2 - v1
-            side2 = v3 - v1
-            out.append(v1 + side1 * u1 + side2 * u2)
-        return out
+        # generate array of triangle faces and array of indexes which points to initial faces for each new triangle
+        # convex faces are triangulated as fans, concave ones by Blender's tessellate_polygon
+        totals = np.fromiter(map(len, self._faces), dtype=np.int64, count=len(self._faces))
+        totals[totals < 3] = 0
+        if not totals.sum():
+            return
+        loops = np.fromiter(chain.from_iterable(f for f, t in zip(self._faces, totals) if t), dtype=np.int64, count=totals.sum())
+        starts = np.cumsum(totals) - totals
+        concave = self._concave_faces(loops, starts, totals)
+
+        fan_totals = np.where(concave, 0, np.maximum(totals - 2, 0))
+        tri_face_idxs = np.repeat(np.arange(len(totals)), fan_totals)
+        local = np.arange(fan_totals.sum()) - np.repeat(np.cumsum(fan_totals) - fan_totals, fan_totals)
+        first = starts[tri_face_idxs]
+        tri_faces = np.stack((loops[first], loops[first + local + 1], loops[first + local + 2]), axis=1)
+
+        concave_idxs = np.flatnonzero(concave)
+        if len(concave_idxs):
+            extra_tris = []
+            extra_face_idxs = []
+            for i in concave_idxs.tolist():
+                f = self._faces[i]
+                for tri_face in tessellate_polygon([[Vector(self._verts[v]) for v in f]]):
+                    extra_tris.append([f[itf] for itf in tri_face])
+                    extra_face_idxs.append(i)
+            tri_faces = np.concatenate((tri_faces, np.array(extra_tris, dtype=np.int64).reshape((-1, 3))))
+            tri_face_idxs = np.concatenate((tri_face_idxs, np.array(extra_face_idxs, dtype=np.int64)))
+            order = np.argsort(tri_face_idxs, kind='stable')
+            tri_faces, tri_face_idxs = tri_faces[order], tri_face_idxs[order]
+
+        self._tri_faces = tri_faces
+        self._old_face_indexes_per_tri = tri_face_idxs
+
+    def _concave_faces(self, loops, starts, totals):
+        # a face is concave if at some corner it turns against its normal (found by Newell's method)
+        n_faces = len(totals)
+        face_of_loop = np.repeat(np.arange(n_faces), totals)
+        used = totals > 0
+        next_loop = np.arange(1, len(loops) + 1)
+        next_loop[(starts + totals - 1)[used]] = starts[used]
+        prev_loop = np.arange(-1, len(loops) - 1)
+        prev_loop[starts[used]] = (starts + totals - 1)[used]
+        co = self._verts[loops]
+        co_next = co[next_loop]
+        crosses = np.cross(co, co_next)
+        normals = np.stack([np.bincount(face_of_loop, crosses[:, k], minlength=n_faces) for k in range(3)], axis=1)
+        corners = np.cross(co - co[prev_loop], co_next - co)
+        turns = np.einsum('ij,ij->i', corners, normals[face_of_loop])
+        scale = np.linalg.norm(corners, axis=1) * np.linalg.norm(normals[face_of_loop], axis=1)
+        concave_loops = turns < -1e-6 * scale
+        return (np.bincount(face_of_loop, concave_loops, minlength=n_faces) > 0) & (totals > 3)
 
     def _face_attrs_to_tri_face_attrs(self, values):
-        return [values[i] if i <= len(values) - 1 else values[len(values) - 1] for i in self._old_face_indexes_per_tri]
+        values = np.asarray(values, dtype=np.float64)
+        return values[np.minimum(self._old_face_indexes_per_tri, len(values) - 1)]
 
 
 class SvRandomPointsOnMesh(bpy.types.Node, SverchCustomTreeNode):
@@ -154,9 +259,16 @@ class SvRandomPointsOnMesh(bpy.types.Node, SverchCustomTreeNode):
             description="If checked, then number of points at each face is proportional to the area of the face",
             default=True,
             update=updateNode)
-    
+
+    min_distance: bpy.props.FloatProperty(
+            name="Min distance",
+            description="If not zero, points which are closer than this to previously generated points are removed",
+            default=0.0, min=0.0,
+            update=updateNode)
+
     def draw_buttons(self, context, layout):
         layout.prop(self, "proportional", toggle=True)
+        layout.prop(self, "min_distance")
 
     def sv_init(self, context):
         [self.inputs.new(p.socket_type, p.name) for p in INPUT_CONFIG]
@@ -169,7 +281,7 @@ class SvRandomPointsOnMesh(bpy.types.Node, SverchCustomTreeNode):
         if not all([self.inputs['Verts'].is_linked, self.inputs['Faces'].is_linked]):
             return
 
-        props = NodeProperties(self.proportional)
+        props = NodeProperties(self.proportional, self.min_distance)
         out = [node_process(inputs, props) for inputs in self.get_input_data_iterator(INPUT_CONFIG)]
         [s.sv_set(data) for s, data in zip(self.outputs, zip(*out))]
 
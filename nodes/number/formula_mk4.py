@@ -14,10 +14,13 @@ from bpy.props import BoolProperty, StringProperty, EnumProperty, FloatVectorPro
 import json
 import io
 
+import numpy as np
+
 from sverchok.node_tree import SverchCustomTreeNode, throttled
 from sverchok.data_structure import updateNode, match_long_repeat, zip_long_repeat
 from sverchok.utils import logging
-from sverchok.utils.modules.eval_formula import get_variables, safe_eval
+from sverchok.utils.modules.eval_formula import (get_variables, safe_eval, sv_compile,
+            safe_eval_compiled, safe_eval_vectorized, SvNotVectorizableError)
 
 class SvFormulaNodeMk4(bpy.types.Node, SverchCustomTreeNode):
     """
@@ -59,6 +62,11 @@ class SvFormulaNodeMk4(bpy.types.Node, SverchCustomTreeNode):
     )
 
     use_ast: BoolProperty(name="AST", description="uses the ast.literal_eval module", update=updateNode)
+
+    use_numpy: BoolProperty(
+        name="Vectorize",
+        description="Evaluate formulas over whole lists of numbers at once; formulas which can not be vectorized are still evaluated per element",
+        default=False, update=updateNode)
     ui_message: StringProperty(name="ui message")
 
     def formulas(self):
@@ -89,6 +97,7 @@ class SvFormulaNodeMk4(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons_ext(self, context, layout):
         layout.prop(self, "dimensions")
         self.draw_buttons(context, layout)
+        layout.prop(self, "use_numpy")
 
     def sv_init(self, context):
         self.inputs.new('SvStringsSocket', "x")
@@ -184,6 +193,41 @@ class SvFormulaNodeMk4(bpy.types.Node, SverchCustomTreeNode):
         return inputs
 
 
+    def evaluate_vectorized(self, var_names, objects, compiled_formulas):
+        """
+        Evaluate formulas once over numpy arrays of variables values.
+        Returns None if this is not possible (inputs are not plain lists
+        of numbers, or formulas can not be vectorized).
+        """
+        arrays = []
+        for values in objects:
+            if not isinstance(values, (list, tuple, np.ndarray)) or not len(values):
+                return None
+            array = np.asarray(values)
+            # integer and boolean arrays do not behave as python numbers do
+            # (integers overflow silently, True + True is True)
+            if array.ndim != 1 or array.dtype.kind != 'f':
+                return None
+            arrays.append(array)
+
+        n = max(len(array) for array in arrays)
+        # repeat last values, as zip_long_repeat does
+        arrays = [np.pad(array, (0, n - len(array)), mode='edge') for array in arrays]
+        variables = dict(zip(var_names, arrays))
+
+        columns = []
+        try:
+            with np.errstate(divide='raise', over='raise', invalid='raise'):
+                for compiled in compiled_formulas:
+                    columns.append(safe_eval_vectorized(compiled, variables, (n,)).tolist())
+        except SvNotVectorizableError:
+            return None
+
+        if self.separate:
+            return [list(vector) for vector in zip(*columns)]
+        else:
+            return [value for vector in zip(*columns) for value in vector]
+
     def all_inputs_connected(self):
         if self.inputs:
             if not all(socket.is_linked for socket in self.inputs):
@@ -209,16 +253,22 @@ class SvFormulaNodeMk4(bpy.types.Node, SverchCustomTreeNode):
         if var_names:
             input_values = [inputs.get(name) for name in var_names]
             parameters = match_long_repeat(input_values)
+            compiled_formulas = [sv_compile(formula) for formula in self.formulas() if formula]
 
             for objects in zip(*parameters):
+                if self.use_numpy and compiled_formulas:
+                    object_results = self.evaluate_vectorized(var_names, objects, compiled_formulas)
+                    if object_results is not None:
+                        results.append(object_results)
+                        continue
+
                 object_results = []
                 for values in zip_long_repeat(*objects):
                     variables = dict(zip(var_names, values))
                     vector = []
-                    for formula in self.formulas():
-                        if formula:
-                            value = safe_eval(formula, variables)
-                            vector.append(value)
+                    for compiled in compiled_formulas:
+                        value = safe_eval_compiled(compiled, variables)
+                        vector.append(value)
                     if self.separate:
                         object_results.append(vector)
                     else:
@@ -49,6 +49,7 @@ class SvNumberNode(Show3DProperties, DraftMode, bpy.types.Node, SverchCustomTree
     bl_idname = 'SvNumberNode'
     bl_label = 'A Number'
     bl_icon = 'DOT'
+    sv_thread_safe = True
 
     @throttled
     def wrapped_update(self, context):
@@ -26,6 +26,7 @@ from sverchok.ui.sv_icons import custom_icon
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, list_match_func, numpy_list_match_modes, numpy_list_match_func, no_space
 from sverchok.utils.sv_itertools import (recurse_fx, recurse_fxy, recurse_f_level_control)
+from sverchok.utils.sv_ragged_batch import batch_apply
 import numpy as np
 # pylint: disable=C0326
 
@@ -115,8 +116,14 @@ def property_change(node, context, origin):
     updateNode(node, context)
 
 def math_numpy(params, constant, matching_f):
-    result = []
     func, matching_mode, out_numpy = constant
+
+    # process all objects at once, if they are regular lists of numbers
+    result = batch_apply(func, params, mode=matching_mode, out_numpy=out_numpy, single_argument=True)
+    if result is not None:
+        return result
+
+    result = []
     params = matching_f(params)
     matching_numpy = numpy_list_match_func[matching_mode]
     for props in zip(*params):
@@ -138,6 +145,8 @@ class SvScalarMathNodeMK4(bpy.types.Node, SverchCustomTreeNode):
     bl_idname = 'SvScalarMathNodeMK4'
     bl_label = 'Scalar Math'
     sv_icon = 'SV_SCALAR_MATH'
+    sv_batch_capable = True
+    sv_thread_safe = True
 
     def mode_change(self, context):
         self.update_sockets()
@@ -23,6 +23,7 @@ from bpy.props import BoolProperty, StringProperty, IntProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, node_id, changable_sockets
+from sverchok.utils.frame_cache import frame_cache
 
 
 class SvCacheNode(bpy.types.Node, SverchCustomTreeNode):
@@ -37,7 +38,6 @@ class SvCacheNode(bpy.types.Node, SverchCustomTreeNode):
     
     cache_amount: IntProperty(default=1, min=0)
     cache_offset: IntProperty(default=1, min=0)
-    node_dict = {}
     
     def sv_init(self, context):
         self.inputs.new("SvStringsSocket", "Data")
@@ -51,17 +51,15 @@ class SvCacheNode(bpy.types.Node, SverchCustomTreeNode):
         
     def process(self):
         n_id = node_id(self)
-        data = self.node_dict.get(n_id)
-        if not data:
-            self.node_dict[n_id] = {}
-            data = self.node_dict.get(n_id)
-            
         frame_current = bpy.context.scene.frame_current
         out_frame = frame_current - self.cache_offset
-        data[frame_current] = self.inputs[0].sv_get()
-        out_data = data.get(out_frame, [])
+        frame_cache.put(n_id, frame_current, self.inputs[0].sv_get())
+        out_data = frame_cache.get(n_id, out_frame, [])
         self.outputs[0].sv_set(out_data)
 
+    def sv_free(self):
+        frame_cache.clear(node_id(self))
+
 def register():
     bpy.utils.register_class(SvCacheNode)
 
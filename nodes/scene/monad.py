@@ -215,12 +215,7 @@ class SvMonadGenericNode(Node, SverchCustomTreeNode,  monad_def.SvGroupNodeExp):
         if not self.cls_bl_idname:
             return None
 
-        for monad in bpy.data.node_groups:
-            if hasattr(monad, "cls_bl_idname"):
-                if monad.cls_bl_idname == self.cls_bl_idname:
-                    return monad
-
-        return None
+        return monad_def.find_monad(self.cls_bl_idname)
 
     def sv_init(self, context):
         self.use_custom_color = True
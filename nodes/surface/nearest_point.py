@@ -3,7 +3,6 @@ import numpy as np
 import bpy
 from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty
 from mathutils import Matrix
-from mathutils.kdtree import KDTree
 
 import sverchok
 from sverchok.node_tree import SverchCustomTreeNode, throttled
@@ -16,42 +15,7 @@ from sverchok.dependencies import scipy
 if scipy is None:
     add_dummy('SvExNearestPointOnSurfaceNode', "Nearest Point on Surface", 'scipy')
 else:
-    from scipy.optimize import minimize
-
-    def init_guess(surface, points_from, samples=50):
-        u_min = surface.get_u_min()
-        u_max = surface.get_u_max()
-        v_min = surface.get_v_min()
-        v_max = surface.get_v_max()
-        us = np.linspace(u_min, u_max, num=samples)
-        vs = np.linspace(v_min, v_max, num=samples)
-        us, vs = np.meshgrid(us, vs)
-        us = us.flatten()
-        vs = vs.flatten()
-
-        points = surface.evaluate_array(us, vs).tolist()
-
-        kdt = KDTree(len(us))
-        for i, v in enumerate(points):
-            kdt.insert(v, i)
-        kdt.balance()
-
-        us_out = []
-        vs_out = []
-        nearest_out = []
-        for point_from in points_from:
-            nearest, i, distance = kdt.find(point_from)
-            us_out.append(us[i])
-            vs_out.append(vs[i])
-            nearest_out.append(tuple(nearest))
-
-        return us_out, vs_out, nearest_out
-
-    def goal(surface, point_from):
-        def distance(p):
-            dv = surface.evaluate(p[0], p[1]) - np.array(point_from)
-            return np.linalg.norm(dv)
-        return distance
+    from sverchok.utils.manifolds import nearest_point_on_surface
 
     class SvExNearestPointOnSurfaceNode(bpy.types.Node, SverchCustomTreeNode):
         """
@@ -117,36 +81,12 @@ else:
             points_uv_out = []
             for surfaces, src_points_i in zip_long_repeat(surfaces_s, src_point_s):
                 for surface, src_points in zip_long_repeat(surfaces, src_points_i):
-                    u_min = surface.get_u_min()
-                    u_max = surface.get_u_max()
-                    v_min = surface.get_v_min()
-                    v_max = surface.get_v_max()
-
-                    new_uv = []
-                    new_u = []
-                    new_v = []
-                    new_points = []
-
-                    init_us, init_vs, init_points = init_guess(surface, src_points, samples=self.samples)
-                    for src_point, init_u, init_v, init_point in zip(src_points, init_us, init_vs, init_points):
-                        if self.precise:
-                            result = minimize(goal(surface, src_point),
-                                        x0 = np.array([init_u, init_v]),
-                                        bounds = [(u_min, u_max), (v_min, v_max)],
-                                        method = self.method
-                                    )
-                            if not result.success:
-                                raise Exception("Can't find the nearest point for {}: {}".format(src_point, result.message))
-                            u0, v0 = result.x
-                        else:
-                            u0, v0 = init_u, init_v
-                            new_points.append(init_point)
-                        new_uv.append((u0, v0, 0))
-                        new_u.append(u0)
-                        new_v.append(v0)
-
-                    if self.precise and self.outputs['Point'].is_linked:
-                        new_points = surface.evaluate_array(np.array(new_u), np.array(new_v)).tolist()
+                    new_u, new_v, new_points = nearest_point_on_surface(src_points, surface,
+                                            samples = self.samples,
+                                            precise = self.precise,
+                                            method = self.method)
+                    new_uv = [(u, v, 0) for u, v in zip(new_u.tolist(), new_v.tolist())]
+                    new_points = new_points.tolist()
 
                     points_out.append(new_points)
                     points_uv_out.append(new_uv)
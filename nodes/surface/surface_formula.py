@@ -7,8 +7,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty, St
 
 from sverchok.node_tree import SverchCustomTreeNode, throttled
 from sverchok.data_structure import updateNode, zip_long_repeat, match_long_repeat, ensure_nesting_level
-from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled
-from sverchok.utils.script_importhelper import safe_names_np
+from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled, safe_eval_vectorized
 from sverchok.utils.logging import info, exception
 from sverchok.utils.math import (
             from_cylindrical, from_spherical,
@@ -137,16 +136,9 @@ class SvSurfaceFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
         def function(u, v):
             variables.update(dict(u=u, v=v))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
-
-            if not isinstance(v1, np.ndarray):
-                v1 = np.full_like(u, v1)
-            if not isinstance(v2, np.ndarray):
-                v2 = np.full_like(u, v2)
-            if not isinstance(v3, np.ndarray):
-                v3 = np.full_like(u, v3)
+            v1 = safe_eval_vectorized(compiled1, variables, u)
+            v2 = safe_eval_vectorized(compiled2, variables, u)
+            v3 = safe_eval_vectorized(compiled3, variables, u)
 
             return np.array(out_coordinates(v1, v2, v3)).T
 
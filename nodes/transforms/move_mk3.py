@@ -57,6 +57,8 @@ class SvMoveNodeMk3(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Move'
     bl_icon = 'ORIENTATION_VIEW'
     sv_icon = 'SV_MOVE'
+    sv_batch_capable = True
+    sv_thread_safe = True
 
 
     movement_vectors: FloatVectorProperty(
@@ -165,6 +165,8 @@ class SvRotationNodeMk3(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Rotate'
     bl_icon = 'NONE'
     sv_icon = 'SV_ROTATE'
+    sv_batch_capable = True
+    sv_thread_safe = True
 
 
     centers_: FloatVectorProperty(
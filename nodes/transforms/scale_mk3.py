@@ -57,6 +57,8 @@ class SvScaleNodeMk3(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Scale'
     bl_icon = 'ORIENTATION_VIEW'
     sv_icon = 'SV_MOVE'
+    sv_batch_capable = True
+    sv_thread_safe = True
 
 
     centers: FloatVectorProperty(
@@ -18,7 +18,7 @@
 from colorsys import rgb_to_hls
 from itertools import repeat
 import bpy
-from bpy.props import EnumProperty, FloatProperty, FloatVectorProperty, StringProperty
+from bpy.props import EnumProperty, FloatProperty, FloatVectorProperty, StringProperty, BoolProperty, IntProperty
 from mathutils import Vector, Matrix
 
 from sverchok.node_tree import SverchCustomTreeNode, throttled
@@ -144,6 +144,15 @@ class SvDisplaceNodeMk2(bpy.types.Node, SverchCustomTreeNode, SvAnimatableNode):
         items=numpy_list_match_modes, default="REPEAT",
         update=updateNode)
 
+    baked: BoolProperty(
+        name='Baked',
+        description='Evaluate the texture on a lattice around the vertices once and interpolate (faster, less precise)',
+        default=False, update=updateNode)
+
+    lattice_resolution: IntProperty(
+        name='Lattice Resolution', description='Number of texture samples along each axis of the lattice',
+        default=32, min=2, max=256, update=updateNode)
+
     def sv_init(self, context):
         self.width = 200
         self.inputs.new('SvVerticesSocket', 'Vertices')
@@ -182,6 +191,10 @@ class SvDisplaceNodeMk2(bpy.types.Node, SverchCustomTreeNode, SvAnimatableNode):
             r = layout.split(factor=0.3, align=False)
             r.label(text='Channel'+ ':')
             r.prop(self, 'color_channel', expand=False, text='')
+        r = layout.row(align=True)
+        r.prop(self, 'baked', toggle=True)
+        if self.baked:
+            r.prop(self, 'lattice_resolution', text='')
 
 
     def draw_buttons_ext(self, context, layout):
@@ -228,7 +241,8 @@ class SvDisplaceNodeMk2(bpy.types.Node, SverchCustomTreeNode, SvAnimatableNode):
         desired_levels = [3, 3, 2, 3, mat_level, 2, 2, 3]
         out_mode = self.out_mode.replace("_", " ")
 
-        ops = [out_mode, displace_funcs[out_mode], self.color_channel.replace("_", " "), self.list_match, self.tex_coord_type.replace("_", " ")]
+        ops = [out_mode, displace_funcs[out_mode], self.color_channel.replace("_", " "), self.list_match, self.tex_coord_type.replace("_", " "),
+               self.lattice_resolution if self.baked else 0]
 
         result = recurse_f_level_control(params, ops, meshes_texture_diplace, matching_f, desired_levels)
 
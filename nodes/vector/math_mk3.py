@@ -28,6 +28,7 @@ from sverchok.data_structure import (
 from sverchok.ui.sv_icons import custom_icon
 import numpy as np
 from sverchok.utils.modules.vector_math_utils import numpy_vector_func_dict, mathutils_vector_func_dict, vector_math_ops
+from sverchok.utils.sv_ragged_batch import batch_apply
 
 
 socket_type = {'s': 'SvStringsSocket', 'v': 'SvVerticesSocket'}
@@ -36,6 +37,11 @@ socket_type = {'s': 'SvStringsSocket', 'v': 'SvVerticesSocket'}
 # - fx and fxy do full list matching by length
 
 def recurse_fx_numpy(l, func, level, out_numpy):
+    if level == 2:
+        # process all objects at once, if they are regular lists of vectors
+        res = batch_apply(func, [l], [1], out_numpy=out_numpy)
+        if res is not None:
+            return res
     if level == 1:
         nl = np.array(l)
         return func(nl) if out_numpy else func(nl).tolist()
@@ -45,6 +51,12 @@ def recurse_fx_numpy(l, func, level, out_numpy):
     return t
 
 def recurse_fxy_numpy(l1, l2, func, level, min_l2_level, out_numpy):
+    if level == 2:
+        # process all objects at once, if they are regular lists of vectors / numbers
+        l2_element_ndim = 1 if min_l2_level == 3 else 0
+        res = batch_apply(func, [l1, l2], [1, l2_element_ndim], out_numpy=out_numpy)
+        if res is not None:
+            return res
     if level == 1:
         nl1 = np.array(l1)
         nl2 = np.array(l2)
@@ -97,6 +109,8 @@ class SvVectorMathNodeMK3(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Vector Math'
     bl_icon = 'THREE_DOTS'
     sv_icon = 'SV_VECTOR_MATH'
+    sv_batch_capable = True
+    sv_thread_safe = True
 
     @throttled
     def mode_change(self, context):
@@ -16,9 +16,10 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 from colorsys import rgb_to_hls
-from itertools import repeat
+from itertools import repeat, islice
 import bpy
-from bpy.props import EnumProperty, FloatProperty, FloatVectorProperty, StringProperty, BoolProperty
+from bpy.props import EnumProperty, FloatProperty, FloatVectorProperty, StringProperty, BoolProperty, IntProperty
+import numpy as np
 from mathutils import Vector, Matrix, Color
 
 from sverchok.node_tree import SverchCustomTreeNode, throttled
@@ -28,6 +29,7 @@ from sverchok.utils.sv_IO_pointer_helpers import pack_pointer_property_name, unp
 from sverchok.data_structure import updateNode, list_match_func, numpy_list_match_modes, iter_list_match_func, no_space
 from sverchok.utils.sv_itertools import recurse_f_level_control
 from sverchok.utils.modules.color_utils import color_channels
+from sverchok.utils.modules.texture_lattice import evaluate_textures_baked, color_channel_values
 
 class EmptyTexture():
     def evaluate(self, vec):
@@ -50,11 +52,13 @@ def meshes_texture_evaluate(params, constant, matching_f):
     - texture can be [texture, texture] or [[texture, texture],[texture]] for per vertex texture
 
     desired_levels = [3, 2 or 3]
-    constant are the function options (data that does not need to be matched)
+    constant are the function options (data that does not need to be matched),
+    optional last one is the resolution of the lattice to bake textures on (0 to evaluate per vertex)
     matching_f stands for list matching formula to use
     '''
     result = []
-    color_channel, mapping_mode, match_mode = constant
+    color_channel, mapping_mode, match_mode = constant[:3]
+    lattice_resolution = constant[3] if len(constant) > 3 else 0
     params = matching_f(params)
     local_match = iter_list_match_func[match_mode]
     mapper_func = mapper_funcs[mapping_mode]
@@ -64,7 +68,15 @@ def meshes_texture_evaluate(params, constant, matching_f):
         if  not type(texture) == list:
             texture = [texture]
         m_texture = local_match([texture])[0]
-        result.append([texture_evaluate(v_prop, mapper_func, extract_func) for v_prop in zip(verts, m_texture)])
+        if lattice_resolution:
+            m_texture = list(islice(m_texture, len(verts)))
+            coords = np.array(verts[:len(m_texture)], dtype=np.float64).reshape((-1, 3))
+            if mapping_mode == 'UV':
+                coords = coords * (2, 2, 1) - (1, 1, 0)
+            rgba = evaluate_textures_baked(m_texture, coords, lattice_resolution)
+            result.append(color_channel_values(rgba, color_channel).tolist())
+        else:
+            result.append([texture_evaluate(v_prop, mapper_func, extract_func) for v_prop in zip(verts, m_texture)])
 
     return result
 
@@ -122,6 +134,15 @@ class SvTextureEvaluateNodeMk2(bpy.types.Node, SverchCustomTreeNode, SvAnimatabl
 
     use_alpha: BoolProperty(default=False, update=updateNode)
 
+    baked: BoolProperty(
+        name='Baked',
+        description='Evaluate the texture on a lattice around the vertices once and interpolate (faster, less precise)',
+        default=False, update=updateNode)
+
+    lattice_resolution: IntProperty(
+        name='Lattice Resolution', description='Number of texture samples along each axis of the lattice',
+        default=32, min=2, max=256, update=updateNode)
+
     list_match: EnumProperty(
         name="List Match",
         description="Behavior on different list lengths",
@@ -154,6 +175,10 @@ class SvTextureEvaluateNodeMk2(bpy.types.Node, SverchCustomTreeNode, SvAnimatabl
         c.prop(self, 'color_channel', text="")
         if self.color_channel == 'Color':
             layout.prop(self, 'use_alpha', text="Use Alpha")
+        r = layout.row(align=True)
+        r.prop(self, 'baked', toggle=True)
+        if self.baked:
+            r.prop(self, 'lattice_resolution', text='')
 
     def draw_buttons_ext(self, context, layout):
         '''draw buttons on the N-panel'''
@@ -193,7 +218,7 @@ class SvTextureEvaluateNodeMk2(bpy.types.Node, SverchCustomTreeNode, SvAnimatabl
         else:
             channel = self.color_channel
 
-        ops = [channel, self.tex_coord_type, self.list_match]
+        ops = [channel, self.tex_coord_type, self.list_match, self.lattice_resolution if self.baked else 0]
 
         result = recurse_f_level_control(params, ops, meshes_texture_evaluate, matching_f, desired_levels)
 
@@ -72,6 +72,8 @@ class GenVectorsNode(bpy.types.Node, SverchCustomTreeNode):
     bl_idname = 'GenVectorsNode'
     bl_label = 'Vector in'
     sv_icon = 'SV_VECTOR_IN'
+    sv_batch_capable = True
+    sv_thread_safe = True
 
     x_: FloatProperty(name='X', description='X', default=0.0, precision=3, update=updateNode)
     y_: FloatProperty(name='Y', description='Y', default=0.0, precision=3, update=updateNode)
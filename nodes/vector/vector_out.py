@@ -74,6 +74,8 @@ class VectorsOutNode(bpy.types.Node, SverchCustomTreeNode):
     bl_idname = 'VectorsOutNode'
     bl_label = 'Vector out'
     sv_icon = 'SV_VECTOR_OUT'
+    sv_batch_capable = True
+    sv_thread_safe = True
 
     output_numpy: BoolProperty(
         name='Output NumPy',
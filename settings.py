@@ -10,6 +10,7 @@ from sverchok.core import handlers
 from sverchok.core import update_system
 from sverchok.utils import logging
 from sverchok.utils.sv_gist_tools import TOKEN_HELP_URL
+from sverchok.utils.frame_cache import frame_cache
 from sverchok.ui import color_def
 
 PYPATH = bpy.app.binary_path_python
@@ -141,6 +142,12 @@ class SverchokPreferences(AddonPreferences):
     def update_heat_map(self, context):
         data_structure.heat_map_state(self.heat_map)
 
+    def update_socket_data_mode(self, context):
+        data_structure.CHECK_INPUT_MUTATION = self.check_input_mutation
+
+    def update_frame_cache(self, context):
+        frame_cache.set_limits(self.frame_cache_size * 1024 * 1024, self.frame_cache_spill)
+
     def set_frame_change(self, context):
         handlers.set_frame_change(self.frame_change_mode)
 
@@ -183,6 +190,24 @@ class SverchokPreferences(AddonPreferences):
         default=False, subtype='NONE',
         update=update_heat_map)
 
+    check_input_mutation: BoolProperty(
+        name="Check input mutation",
+        description="Raise an error when a node changes input data shared with other nodes (slow)",
+        default=False,
+        update=update_socket_data_mode)
+
+    frame_cache_size: IntProperty(
+        name="Cache memory (MB)",
+        description="Memory which Cache nodes can use for all stored frames together",
+        default=512, min=1,
+        update=update_frame_cache)
+
+    frame_cache_spill: BoolProperty(
+        name="Spill cache to disk",
+        description="Write frames which do not fit into cache memory to temporary files instead of dropping them",
+        default=False,
+        update=update_frame_cache)
+
     heat_map_hot: FloatVectorProperty(
         name="Heat map hot", description='',
         size=3, min=0.0, max=1.0,
@@ -422,11 +447,14 @@ class SverchokPreferences(AddonPreferences):
         col2.label(text="Frame change handler:")
         col2.row().prop(self, "frame_change_mode", expand=True)
         col2.separator()
+        col2.prop(self, "frame_cache_size")
+        col2.prop(self, "frame_cache_spill")
 
         col2box = col2.box()
         col2box.label(text="Debug:")
         col2box.prop(self, "show_debug")
         col2box.prop(self, "heat_map")
+        col2box.prop(self, "check_input_mutation")
         col2box.prop(self, "developer_mode")
 
         log_box = col2.box()
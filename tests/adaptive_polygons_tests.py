@@ -0,0 +1,61 @@
+from itertools import product
+
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.data_structure import Vector_degenerate
+
+class AdaptivePolygonsBatchedTest(NodeProcessTestCase):
+    node_bl_idname = "SvAdaptivePolygonsNodeMk2"
+
+    # triangle, quad, pentagon and a degenerate triangle (zero normals)
+    recipient_verts = [(0, 0, 0), (1, 0, 0), (0, 1, 0.2),
+                       (2, 0, 0), (3, 0, 0.3), (3, 1, 0), (2, 1, 0),
+                       (4, 0, 0), (5, 0, 0), (5.5, 1, 0.2), (4.5, 2, 0), (3.8, 1, 0),
+                       (6, 0, 0), (7, 0, 0), (8, 0, 0)]
+    recipient_faces = [[0, 1, 2], [3, 4, 5, 6], [7, 8, 9, 10, 11], [12, 13, 14]]
+
+    donor_verts = [(-0.3, -0.2, 0), (0.4, -0.3, 0), (0.2, 0.3, 0), (0, 0, 0.5)]
+    donor_faces = [[0, 1, 2], [0, 1, 3], [1, 2, 3], [2, 0, 3]]
+
+    def run_process(self, single_donor, facerots):
+        n = len(self.recipient_faces)
+        if single_donor:
+            self.node.matching_mode = 'LONG'
+            verts_donor, faces_donor, face_data_donor = self.donor_verts, self.donor_faces, []
+        else:
+            # the same donor for each face goes through the per-face path
+            self.node.matching_mode = 'PERFACE'
+            verts_donor, faces_donor, face_data_donor = [self.donor_verts], [self.donor_faces], [[]]
+        output = self.node._process(self.recipient_verts, self.recipient_faces,
+                                    verts_donor, faces_donor, face_data_donor,
+                                    [0.5] * n,
+                                    [1.0, 0.5, 2.0, 1.0], [0.0, 0.1, -0.2, 0.0],
+                                    [0.0, 0.3, 0.0, 0.0], [1.0, 0.8, 1.0, 1.0],
+                                    facerots, [1] * n)
+        return output
+
+    def test_batched_equals_per_face(self):
+        self.node.frame_mode = 'NEVER'
+        self.node.ngon_mode = 'QUADS'
+        modes = product(['QUADTRI', 'QUADS'], ['BOUNDS', 'PLAIN'], ['MAP', 'FACE'],
+                        ['LINEAR', 'SMOOTH'], ['PROP', 'CONST'], [[0] * 4, [1, 2, 3, 1]])
+        for map_mode, xy_mode, normal_mode, interp_mode, z_scale, facerots in modes:
+            with self.subTest(map_mode=map_mode, xy_mode=xy_mode, normal_mode=normal_mode,
+                              normal_interp_mode=interp_mode, z_scale=z_scale, facerots=facerots):
+                self.node.map_mode = map_mode
+                self.node.xy_mode = xy_mode
+                self.node.normal_mode = normal_mode
+                self.node.normal_interp_mode = interp_mode
+                self.node.z_scale = z_scale
+
+                expected = self.run_process(False, facerots)
+                result = self.run_process(True, facerots)
+
+                self.assertEqual(result.faces_out, expected.faces_out)
+                self.assertEqual(result.vert_recpt_idx_out, expected.vert_recpt_idx_out)
+                self.assertEqual(result.face_recpt_idx_out, expected.face_recpt_idx_out)
+                result_verts = Vector_degenerate(result.verts_out)
+                self.assertTrue(all(isinstance(v, tuple) for obj in result_verts for v in obj))
+                expected_verts = np.array([v for obj in Vector_degenerate(expected.verts_out) for v in obj])
+                self.assert_numpy_arrays_equal(np.array([v for obj in result_verts for v in obj]), expected_verts, precision=6)
@@ -0,0 +1,53 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils import sv_bmesh_utils
+from sverchok.utils.sv_bmesh_utils import (
+        bmesh_from_pydata, pydata_from_bmesh, numpy_data_from_bmesh, faces_to_loops, valid_bulk_faces)
+
+class BulkBMeshTests(SverchokTestCase):
+    def make_grid(self, n):
+        verts = [(x, y, 0.0) for y in range(n) for x in range(n)]
+        faces = [[y*n + x, y*n + x + 1, (y+1)*n + x + 1, (y+1)*n + x] for y in range(n-1) for x in range(n-1)]
+        edges = [[0, n*n - 1], [1, 0], [n, 1]]
+        return verts, edges, faces
+
+    def element_by_element(self, function, *args, **kwargs):
+        bulk_min_verts = sv_bmesh_utils.BULK_MIN_VERTS
+        sv_bmesh_utils.BULK_MIN_VERTS = float('inf')
+        try:
+            return function(*args, **kwargs)
+        finally:
+            sv_bmesh_utils.BULK_MIN_VERTS = bulk_min_verts
+
+    def test_same_as_element_by_element(self):
+        verts, edges, faces = self.make_grid(20)
+        face_data = list(range(len(faces)))
+
+        bm = bmesh_from_pydata(verts, edges, faces, markup_face_data=True, markup_edge_data=True)
+        expected_bm = self.element_by_element(bmesh_from_pydata, verts, edges, faces,
+                                              markup_face_data=True, markup_edge_data=True)
+
+        result = pydata_from_bmesh(bm, face_data)
+        expected = self.element_by_element(pydata_from_bmesh, expected_bm, face_data)
+        self.assertEqual(result, expected)
+
+        layer = bm.edges.layers.int.get("initial_index")
+        expected_layer = expected_bm.edges.layers.int.get("initial_index")
+        self.assertEqual([e[layer] for e in bm.edges], [e[expected_layer] for e in expected_bm.edges])
+        bm.free()
+        expected_bm.free()
+
+    def test_numpy_output(self):
+        verts, edges, faces = self.make_grid(20)
+        bm = bmesh_from_pydata(np.array(verts), edges, np.array(faces))
+        new_verts, new_edges, new_faces, _ = numpy_data_from_bmesh(bm, [True, True, True, False])
+        bm.free()
+        self.assert_numpy_arrays_equal(new_verts, np.array(verts))
+        self.assert_numpy_arrays_equal(new_faces, np.array(faces))
+
+    def test_invalid_faces(self):
+        self.assertFalse(valid_bulk_faces(4, *faces_to_loops([[0, 1, 1]])))
+        self.assertFalse(valid_bulk_faces(4, *faces_to_loops([[0, 1, 2], [2, 0, 1]])))
+        self.assertFalse(valid_bulk_faces(4, *faces_to_loops([[0, 1, 4]])))
+        self.assertTrue(valid_bulk_faces(4, *faces_to_loops([[0, 1, 2], [0, 2, 3]])))
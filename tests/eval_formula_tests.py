@@ -0,0 +1,110 @@
+from math import pi
+
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.utils.modules.eval_formula import (sv_compile, safe_eval_compiled,
+            safe_eval_vectorized, SvNotVectorizableError)
+from sverchok.utils.curve.core import SvLambdaCurve
+
+class CompileCacheTests(SverchokTestCase):
+
+    def test_same_code(self):
+        self.assertIs(sv_compile("x + sin(y)"), sv_compile("x + sin(y)"))
+        self.assertIsNot(sv_compile("x + sin(y)"), sv_compile("x - sin(y)"))
+
+    def test_syntax_error(self):
+        with self.assertRaises(Exception):
+            sv_compile("x +")
+
+class VectorizedEvalTests(SverchokTestCase):
+
+    xs = np.array([0.0, 0.5, 1.0, 2.5, -3.0])
+    ys = np.array([1.0, -2.0, 0.25, 4.0, 0.5])
+
+    def per_element(self, formula, xs, ys):
+        compiled = sv_compile(formula)
+        return np.array([safe_eval_compiled(compiled, dict(x=x, y=y)) for x, y in zip(xs, ys)])
+
+    def vectorized(self, formula, xs, ys):
+        with np.errstate(divide='raise', over='raise', invalid='raise'):
+            return safe_eval_vectorized(sv_compile(formula), dict(x=xs, y=ys), xs)
+
+    def test_equivalence(self):
+        formulas = ["x + y", "x * y - 2", "x / y", "x ** 2 + y ** 3", "sin(x) * cos(y)",
+                    "sqrt(abs(x)) + exp(y)", "atan2(y, x)", "hypot(x, y)", "pi * x", "5"]
+        for formula in formulas:
+            with self.subTest(formula=formula):
+                expected = self.per_element(formula, self.xs, self.ys)
+                result = self.vectorized(formula, self.xs, self.ys)
+                self.assertEqual(result.shape, self.xs.shape)
+                self.assert_numpy_arrays_equal(result, expected, precision=12)
+
+    def test_integer_inputs(self):
+        # formula node does not vectorize integer inputs, where numpy
+        # would overflow silently; float arrays of integer values are fine
+        xs = np.array([1, 2, 3])
+        ys = np.array([10, 20, 30])
+        for formula in ["x + y", "x * y", "x // 2", "y % 7", "x / y"]:
+            with self.subTest(formula=formula):
+                expected = self.per_element(formula, xs.tolist(), ys.tolist())
+                result = self.vectorized(formula, xs.astype(np.float64), ys.astype(np.float64))
+                self.assertEqual(result.tolist(), expected.tolist())
+
+    def test_fallback(self):
+        formulas = ["x if x > 0 else y", "1 / (x - x)", "sqrt(x)", "[x, y]", "factorial(x)"]
+        for formula in formulas:
+            with self.subTest(formula=formula):
+                with self.assertRaises(SvNotVectorizableError):
+                    self.vectorized(formula, self.xs, self.ys)
+
+    def test_errors(self):
+        # errors of the formula itself are not hidden by the fallback
+        with self.assertRaises(NameError):
+            self.vectorized("x + z", self.xs, self.ys)
+        with self.assertRaises(ZeroDivisionError):
+            self.vectorized("x + 1 / 0", self.xs, self.ys)
+
+class LambdaCurveFallbackTests(SverchokTestCase):
+
+    def test_retry(self):
+        calls = []
+
+        def function(t):
+            return np.array([t, 2*t, 0.0])
+
+        def function_numpy(ts):
+            calls.append(len(ts))
+            if len(ts) > 2:
+                raise SvNotVectorizableError("test")
+            return np.stack((ts, 2*ts, np.zeros_like(ts))).T
+
+        curve = SvLambdaCurve(function, function_numpy)
+        ts = np.linspace(0, 1, 5)
+        expected = np.stack((ts, 2*ts, np.zeros_like(ts))).T
+        self.assert_numpy_arrays_equal(curve.evaluate_array(ts), expected)
+        self.assert_numpy_arrays_equal(curve.evaluate_array(ts[:2]), expected[:2])
+        self.assertEqual(calls, [5, 2])
+
+class FormulaNodeVectorizedTests(NodeProcessTestCase):
+    node_bl_idname = "SvFormulaNodeMk4"
+
+    def evaluate(self, formula, values, use_numpy):
+        self.node.use_numpy = use_numpy
+        compiled = [sv_compile(formula)]
+        if use_numpy:
+            return self.node.evaluate_vectorized(['x'], [values], compiled)
+        return [safe_eval_compiled(compiled[0], dict(x=x)) for x in values]
+
+    def test_float_inputs(self):
+        values = [0.5, 1.5, 2.0, -1.0]
+        for formula in ["x * 2 + 1", "x ** 3", "cos(x)"]:
+            with self.subTest(formula=formula):
+                self.assertEqual(self.evaluate(formula, values, True), self.evaluate(formula, values, False))
+
+    def test_integer_inputs(self):
+        # numpy int64 would overflow here, python integers do not
+        values = [2, 3, 4]
+        self.assertIsNone(self.evaluate("x ** 70", values, True))
+        self.assertIsNone(self.evaluate("x + x", [True, False], True))
+        self.assertEqual(self.evaluate("x ** 70", values, False), [x ** 70 for x in values])
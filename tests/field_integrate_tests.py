@@ -0,0 +1,84 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, NodeProcessTestCase
+from sverchok.utils.field.integrate import integrate_fixed, integrate_adaptive
+
+class RotationField(object):
+    """F(x, y, z) = (-y, x, 0): field lines are circles, passed with angular speed 1"""
+    def evaluate_grid(self, xs, ys, zs):
+        return -ys, xs, np.zeros_like(zs)
+
+class IntegrateFieldTests(SverchokTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.field = RotationField()
+        self.start = np.array([[1.0, 0.0, 0.0], [0.0, 2.0, 0.5]])
+
+    def exact(self, t):
+        cos_t, sin_t = np.cos(t), np.sin(t)
+        xs, ys, zs = self.start[:,0], self.start[:,1], self.start[:,2]
+        return np.stack((xs*cos_t - ys*sin_t, xs*sin_t + ys*cos_t, zs), axis=1)
+
+    def fixed_error(self, method, step, length=2.0):
+        iterations = int(round(length / step))
+        result = integrate_fixed(self.field, self.start, step, iterations, method=method, normalize=False)
+        return np.linalg.norm(result[:, -1, :] - self.exact(length), axis=1).max()
+
+    def test_rk4_accuracy(self):
+        rk4_error = self.fixed_error('RK4', 0.1)
+        self.assertLess(rk4_error, 1e-4)
+        self.assertLess(rk4_error * 100, self.fixed_error('EULER', 0.1))
+        # 4th order: half step makes the error about 16 times smaller
+        self.assertGreater(rk4_error / self.fixed_error('RK4', 0.05), 12)
+
+    def test_points_not_changed(self):
+        points = self.start.copy()
+        integrate_fixed(self.field, points, 0.1, 5, normalize=False)
+        self.assert_numpy_arrays_equal(points, self.start)
+
+    def test_adaptive_step_control(self):
+        length = 2.0
+        exact = self.exact(length)
+        lines = integrate_adaptive(self.field, self.start, length, tolerance=1e-4, normalize=False)
+        precise_lines = integrate_adaptive(self.field, self.start, length, tolerance=1e-9, normalize=False)
+        for i in range(len(self.start)):
+            error = np.linalg.norm(lines[i][-1] - exact[i])
+            precise_error = np.linalg.norm(precise_lines[i][-1] - exact[i])
+            self.assertLess(error, 1e-3)
+            self.assertLess(precise_error, 1e-7)
+            # smaller tolerance needs smaller steps
+            self.assertGreater(len(precise_lines[i]), len(lines[i]))
+
+    def test_adaptive_zero_tolerance(self):
+        lines = integrate_adaptive(self.field, self.start[:1], 1.0, tolerance=0.0, normalize=False)
+        self.assertTrue(len(lines[0]) > 0)
+        self.assert_numpy_arrays_equal(lines[0][-1], self.exact(1.0)[0], precision=8)
+
+    def test_adaptive_no_points(self):
+        self.assertEqual(integrate_adaptive(self.field, np.zeros((0, 3)), 1.0), [])
+
+    def test_zero_field(self):
+        # the field is zero at the origin, the line stays there
+        start = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]])
+        fixed = integrate_fixed(self.field, start, 0.1, 5)
+        self.assert_numpy_arrays_equal(fixed[0], np.zeros((5, 3)))
+        lines = integrate_adaptive(self.field, start, 0.5)
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0].shape, (0, 3))
+        self.assertTrue(len(lines[1]) > 0)
+
+class VectorFieldLinesNodeTests(NodeProcessTestCase):
+    node_bl_idname = "SvExVectorFieldLinesNode"
+
+    def test_start_points(self):
+        start = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]])
+        for method in ['EULER', 'RK4', 'RK45']:
+            with self.subTest(method=method):
+                self.node.method = method
+                lines = self.node.generate_all(RotationField(), start, 0.1, 5)
+                self.assertEqual(len(lines), 2)
+                # lines start with the start points, also where the field is zero
+                self.assertEqual([line[0] for line in lines], start.tolist())
+                self.assertTrue(all(point == [0.0, 0.0, 0.0] for point in lines[0]))
+                self.assertTrue(len(lines[1]) > 1)
@@ -0,0 +1,87 @@
+import os
+import tempfile
+
+import numpy as np
+from mathutils import Matrix, Vector
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.frame_cache import SvFrameCache, write_entry, read_entry
+
+class FrameCacheSpillTests(SverchokTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super().tearDown()
+
+    def round_trip(self, data):
+        path = write_entry(os.path.join(self.directory.name, "entry"), data)
+        result = read_entry(path)
+        os.remove(path)
+        return path, result
+
+    def assert_same_types(self, data, result):
+        self.assertEqual(type(data), type(result))
+        if isinstance(data, (list, tuple)):
+            self.assertEqual(len(data), len(result))
+            for item, result_item in zip(data, result):
+                self.assert_same_types(item, result_item)
+
+    def test_numbers(self):
+        data = [[1, 2, 3], [0.5, 1.5], [(0.0, 1.0, 2.0), (3.0, 4.0, 5.0)], [[1, 2], [3, 4]], 7, 2.5, [True, False]]
+        path, result = self.round_trip(data)
+        self.assertTrue(path.endswith('.npz'))
+        self.assertEqual(result, data)
+        self.assert_same_types(data, result)
+
+    def test_mixed_numbers(self):
+        # integers mixed with floats are not converted to floats
+        data = [[1, 2.5, 3], [(0, 1.0, 2)]]
+        _, result = self.round_trip(data)
+        self.assertEqual(result, data)
+        self.assert_same_types(data, result)
+
+    def test_matrices_and_vectors(self):
+        data = [[Matrix.Translation((1, 2, 3)), Matrix()], [Vector((1, 2, 3)), Vector((4, 5, 6))]]
+        path, result = self.round_trip(data)
+        self.assertTrue(path.endswith('.npz'))
+        self.assertEqual(result, data)
+        self.assert_same_types(data, result)
+
+    def test_arrays(self):
+        data = [np.arange(6).reshape((2, 3)), np.linspace(0, 1, 5)]
+        _, result = self.round_trip(data)
+        for array, result_array in zip(data, result):
+            self.assert_numpy_arrays_equal(result_array, array)
+            self.assertEqual(result_array.dtype, array.dtype)
+
+    def test_irregular(self):
+        data = [[[1, 2], [3]], ["text"], {'a': 1}]
+        path, result = self.round_trip(data)
+        self.assertTrue(path.endswith('.pickle'))
+        self.assertEqual(result, data)
+
+    def test_spill(self):
+        cache = SvFrameCache(budget=1, spill=True)
+        try:
+            cache.put("node", 1, [[1, 2, 3]])
+            cache.put("node", 2, [[(1.0, 2.0, 3.0)]])
+            # the first entry was written to disk
+            self.assertEqual(cache.keys("node"), [2, 1])
+            self.assertEqual(cache.get("node", 1), [[1, 2, 3]])
+        finally:
+            cache.clear()
+
+    def test_failed_spill(self):
+        cache = SvFrameCache(budget=1, spill=True)
+        try:
+            # functions can not be pickled, so the entry stays in memory
+            data = [[lambda x: x]]
+            cache.put("node", 1, data)
+            cache.put("node", 2, [[1]])
+            self.assertIs(cache.get("node", 1), data)
+        finally:
+            cache.clear()
@@ -0,0 +1,86 @@
+import numpy as np
+
+from sverchok.dependencies import scipy
+from sverchok.utils.testing import *
+from sverchok.utils.field.scalar import SvScalarFieldPointDistance
+from sverchok.utils.manifolds import raycast_implicit_surface
+
+if scipy is not None:
+    from scipy.optimize import root_scalar
+
+def raycast_root_scalar(field, init, direction, iso_value, max_distance):
+    """Per ray raycast, as Implicit Surface Raycast node did it before"""
+    def goal(t):
+        p = init + t * direction
+        return field.evaluate(p[0], p[1], p[2]) - iso_value
+
+    sign = goal(0.0)
+    distance = max_distance
+    for i in range(10):
+        if goal(distance) * sign < 0:
+            break
+        distance /= 2.0
+    else:
+        raise Exception("Can not find range where the field jumps over iso_value")
+    return root_scalar(goal, method='ridder', x0=0, bracket=(0, distance)).root
+
+@requires(scipy)
+class RaycastImplicitSurfaceTests(SverchokTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # sphere of radius 2 around (1, 0, 0)
+        self.field = SvScalarFieldPointDistance(np.array([1.0, 0.0, 0.0]))
+        self.radius = 2.0
+
+    def raycast(self, src_points, directions, max_distances):
+        src_points = np.array(src_points)
+        directions = np.array(directions)
+        directions = directions / np.linalg.norm(directions, axis=1, keepdims=True)
+        iso_values = np.full(len(src_points), self.radius)
+        return src_points, directions, raycast_implicit_surface(self.field, src_points, directions, iso_values, np.array(max_distances))
+
+    def test_root_scalar(self):
+        # from inside the sphere, and from outside with the far end inside
+        src_points, directions, (ts, points) = self.raycast(
+                    [(1.0, 0.0, 0.0), (1.5, 0.5, -0.3), (-3.0, 0.0, 0.0), (1.0, 5.0, 1.0)],
+                    [(0.0, 0.0, 1.0), (1.0, 1.0, 1.0), (1.0, 0.0, 0.0), (0.0, -1.0, -0.2)],
+                    [10.0, 3.0, 4.0, 5.0])
+        expected = [raycast_root_scalar(self.field, src_points[i], directions[i], self.radius, max_distance)
+                        for i, max_distance in enumerate([10.0, 3.0, 4.0, 5.0])]
+        self.assertLess(abs(ts - np.array(expected)).max(), 1e-8)
+        self.assert_numpy_arrays_equal(ts[:1], np.array([2.0]), precision=8)
+        self.assert_numpy_arrays_equal(ts[2:3], np.array([2.0]), precision=8)
+        distances = np.linalg.norm(points - np.array([1.0, 0.0, 0.0]), axis=1)
+        self.assertLess(abs(distances - self.radius).max(), 1e-8)
+
+    def test_miss(self):
+        # the first ray passes by the sphere, the second ray is too short
+        rays = [((-5.0, 3.0, 0.0), (1.0, 0.0, 0.0), 20.0), ((-5.0, 0.0, 0.0), (1.0, 0.0, 0.0), 1.5)]
+        for src_point, direction, max_distance in rays:
+            with self.subTest(src_point=src_point):
+                with self.assertRaises(Exception):
+                    self.raycast([src_point], [direction], [max_distance])
+                with self.assertRaises(Exception):
+                    raycast_root_scalar(self.field, np.array(src_point), np.array(direction), self.radius, max_distance)
+
+    def test_empty(self):
+        ts, points = raycast_implicit_surface(self.field, np.zeros((0, 3)), np.zeros((0, 3)), np.zeros(0), np.zeros(0))
+        self.assertEqual(ts.shape, (0,))
+        self.assertEqual(points.shape, (0, 3))
+
+class ImplicitSurfaceRaycastNodeTests(NodeProcessTestCase):
+    node_bl_idname = "SvExImplSurfaceRaycastNode"
+    connect_output_sockets = ["Vertices", "Distance"]
+
+    def test_empty_vertices(self):
+        field = create_node("SvExScalarFieldPointNode", self.tree.name)
+        verts = create_node("SvNGonNode", self.tree.name)
+        self.tree.links.new(field.outputs['Field'], self.node.inputs['Field'])
+        self.tree.links.new(verts.outputs['Vertices'], self.node.inputs['Vertices'])
+        field.outputs['Field'].sv_set([SvScalarFieldPointDistance(np.array([0.0, 0.0, 0.0]))])
+        verts.outputs['Vertices'].sv_set([[]])
+
+        self.node.process()
+        self.assert_output_data_equals("Vertices", [[]])
+        self.assert_output_data_equals("Distance", [[]])
@@ -0,0 +1,60 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.utils.inside_mesh import get_inside_test, closest_points_on_triangles, triangulate_faces
+from sverchok.dependencies import scipy
+
+class InsideMeshTests(SverchokTestCase):
+    verts = [(-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),
+             (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1)]
+    faces = [(0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4),
+             (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)]
+    points = [(0, 0, 0), (0.5, -0.9, 0.3), (2, 0, 0), (0, 0, -1.5), (0.99, 0.99, 0.99)]
+    expected = [True, True, False, False, True]
+
+    def test_rays(self):
+        test = get_inside_test(self.verts, self.faces)
+        directions = [(0.3, 0.5, 0.8), (-0.7, 0.1, 0.2), (0.1, -0.9, -0.4)]
+        result = test.inside_by_rays(self.points, directions, 2)
+        self.assertEqual(result.tolist(), self.expected)
+
+    def test_ray_distance(self):
+        test = get_inside_test(self.verts, self.faces)
+        hit, distances, normals = test.cast_rays([(0, 0, 0), (0, 0, 2)], (0, 0, 1))
+        self.assertEqual(hit.tolist(), [True, False])
+        self.assertAlmostEqual(distances[0], 1.0)
+
+    def test_closest_points(self):
+        v0 = np.array([[0, 0, 0], [0, 0, 0], [0, 0, 0]], dtype=np.float64)
+        v1 = np.array([[1, 0, 0], [1, 0, 0], [1, 0, 0]], dtype=np.float64)
+        v2 = np.array([[0, 1, 0], [0, 1, 0], [0, 1, 0]], dtype=np.float64)
+        points = np.array([[0.2, 0.2, 1], [-1, -1, 0], [1, 1, 0]], dtype=np.float64)
+        expected = np.array([[0.2, 0.2, 0], [0, 0, 0], [0.5, 0.5, 0]])
+        result = closest_points_on_triangles(points, v0, v1, v2)
+        self.assert_numpy_arrays_equal(result, expected, precision=8)
+
+    @requires(scipy)
+    def test_nearest(self):
+        test = get_inside_test(self.verts, self.faces)
+        result = test.inside_by_nearest(self.points)
+        self.assertEqual(result.tolist(), self.expected)
+
+    def test_concave_face(self):
+        # prism over an L-shaped hexagon; fan triangulation of the top and
+        # bottom faces from their first vertices would cover the notch at (1.3, 1.3)
+        base = [(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)]
+        verts = [(x, y, 0) for x, y in base] + [(x, y, 1) for x, y in base]
+        bottom = [5, 4, 3, 2, 1, 0]
+        top = [8, 9, 10, 11, 6, 7]
+        sides = [(i, (i+1) % 6, (i+1) % 6 + 6, i + 6) for i in range(6)]
+        faces = [bottom, top] + sides
+
+        tris = triangulate_faces(np.array(verts, dtype=np.float64), [top])
+        v = np.array(verts)[tris]
+        area = np.linalg.norm(np.cross(v[:, 1] - v[:, 0], v[:, 2] - v[:, 0]), axis=1).sum() / 2
+        self.assertAlmostEqual(area, 3.0)
+
+        test = get_inside_test(verts, faces)
+        points = [(0.5, 0.5, 0.5), (1.5, 0.5, 0.5), (1.3, 1.3, 0.5), (0.5, 1.5, 0.5)]
+        result = test.inside_by_rays(points, [(0.01, 0.02, 1.0)], 1)
+        self.assertEqual(result.tolist(), [True, True, False, True])
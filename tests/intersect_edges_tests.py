@@ -1,5 +1,8 @@
+import numpy as np
+
 from sverchok.core.update_system import process_tree
 from sverchok.utils.testing import *
+from sverchok.utils.intersect_edges import bbox_overlapping_pairs, intersect_edges_2d, intersect_edges_3d
 
 
 class IntersectEdgesTest2(ReferenceTreeTestCase):
@@ -18,3 +21,39 @@ class IntersectEdgesTest2(ReferenceTreeTestCase):
         self.assert_sverchok_data_equals_file(result_verts, "intersecting_planes_result_verts.txt", precision=8)
         #self.store_reference_sverchok_data("intersecting_planes_result_faces.txt", result_edges)
         self.assert_sverchok_data_equals_file(result_edges, "intersecting_planes_result_faces.txt", precision=8)
+
+class IntersectEdgesBroadPhaseTest(SverchokTestCase):
+    "Bounding boxes broad phase gives the same result as checking all pairs of edges"
+
+    def setUp(self):
+        super().setUp()
+        rng = np.random.RandomState(42)
+        n = 200
+        starts = rng.uniform(0, 10, size=(n, 3))
+        ends = starts + rng.uniform(-1, 1, size=(n, 3))
+        self.verts = [tuple(v) for v in np.concatenate([starts, ends]).tolist()]
+        self.edges = [(i, i + n) for i in range(n)]
+
+    def test_bbox_overlapping_pairs(self):
+        rng = np.random.RandomState(1)
+        mins = np.round(rng.uniform(0, 1, size=(300, 2)), 2)
+        maxs = mins + np.round(rng.uniform(0, 0.2, size=(300, 2)), 2)
+        expected = [(i, j) for i in range(300) for j in range(i+1, 300)
+                    if np.all(mins[i] <= maxs[j]) and np.all(mins[j] <= maxs[i])]
+        pairs = bbox_overlapping_pairs(mins, maxs, chunk_size=100)
+        self.assertEqual([tuple(p) for p in pairs.tolist()], expected)
+
+    def test_intersect_edges_2d(self):
+        expected_verts, expected_edges = intersect_edges_2d(self.verts[:], self.edges, 1e-5, broad_phase=False)
+        verts, edges = intersect_edges_2d(self.verts[:], self.edges, 1e-5)
+        self.assertEqual(verts, expected_verts)
+        self.assertEqual(edges, expected_edges)
+
+    def test_intersect_edges_3d(self):
+        # make edges lie in a few planes, so that there are intersections
+        verts = [(x, y, round(z)) for x, y, z in self.verts]
+        edges = [(i, j) for i, j in self.edges if verts[i][2] == verts[j][2]]
+        expected_verts, expected_edges = intersect_edges_3d(verts, edges, 1e-5, broad_phase=False)
+        result_verts, result_edges = intersect_edges_3d(verts, edges, 1e-5)
+        self.assert_sverchok_data_equal(result_verts, expected_verts, precision=8)
+        self.assertEqual(result_edges, expected_edges)
@@ -0,0 +1,65 @@
+import numpy as np
+
+from sverchok.dependencies import scipy
+from sverchok.utils.testing import *
+from sverchok.utils.sv_KDT_utils import SvKdTree, get_kdtree
+
+class KdTreeTests(SverchokTestCase):
+
+    def setUp(self):
+        super().setUp()
+        rng = np.random.RandomState(13)
+        self.vertices = rng.uniform(-1.0, 1.0, size=(200, 3))
+        self.points = rng.uniform(-1.5, 1.5, size=(50, 3))
+
+    def brute_force(self, vertices, k):
+        distances = np.linalg.norm(self.points[:, np.newaxis] - vertices[np.newaxis], axis=2)
+        indices = np.argsort(distances, axis=1)[:, :k]
+        return indices, np.take_along_axis(distances, indices, axis=1)
+
+    def check(self, tree, vertices, k):
+        nearest, indices, distances = tree.query(self.points, k=k)
+        self.assertEqual(nearest.shape, (len(self.points), k, 3))
+        expected_indices, expected_distances = self.brute_force(vertices, k)
+        self.assertEqual(indices.tolist(), expected_indices.tolist())
+        # mathutils KD-tree keeps coordinates in single precision
+        self.assertLess(abs(distances - expected_distances).max(), 1e-5)
+        self.assertLess(abs(nearest - vertices[expected_indices]).max(), 1e-5)
+
+    def test_mathutils(self):
+        tree = SvKdTree(self.vertices, use_scipy=False)
+        self.assertIsNotNone(tree.kdt)
+        for k in [1, 5]:
+            with self.subTest(k=k):
+                self.check(tree, self.vertices, k)
+
+    @requires(scipy)
+    def test_scipy(self):
+        tree = SvKdTree(self.vertices)
+        self.assertIsNotNone(tree.cKDTree)
+        mathutils_tree = SvKdTree(self.vertices, use_scipy=False)
+        for k in [1, 5]:
+            with self.subTest(k=k):
+                self.check(tree, self.vertices, k)
+                nearest, indices, distances = tree.query(self.points, k=k)
+                expected_nearest, expected_indices, expected_distances = mathutils_tree.query(self.points, k=k)
+                self.assertEqual(indices.tolist(), expected_indices.tolist())
+                self.assertLess(abs(distances - expected_distances).max(), 1e-5)
+
+    def test_more_than_size(self):
+        tree = SvKdTree(self.vertices[:3], use_scipy=False)
+        _, indices, _ = tree.query(self.points, k=5)
+        self.assertEqual(indices.shape, (len(self.points), 3))
+
+    def test_cache(self):
+        vertices = self.vertices.copy()
+        tree = get_kdtree(vertices)
+        self.assertIs(get_kdtree(vertices.copy()), tree)
+
+        # the array is changed in place, the cached tree is not
+        vertices[:] = -vertices
+        self.assert_numpy_arrays_equal(tree.vertices, self.vertices)
+        self.check(tree, self.vertices, 3)
+        new_tree = get_kdtree(vertices)
+        self.assertIsNot(new_tree, tree)
+        self.check(new_tree, -self.vertices, 3)
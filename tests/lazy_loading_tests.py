@@ -0,0 +1,63 @@
+import os
+import subprocess
+import tempfile
+
+import bpy
+
+import sverchok
+from sverchok import nodes
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.logging import info
+from sverchok.utils.modules_inspection import iter_classes_from_module
+from sverchok.utils.sv_nodes_manifest import get_nodes_manifest
+from sverchok.dependencies import SvDependency, SvLazyModule
+
+
+class NodesManifestTests(SverchokTestCase):
+
+    def test_manifest_knows_all_nodes(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            manifest_path = os.path.join(cache_dir, "manifest.json")
+            manifest = get_nodes_manifest(nodes.nodes_dict, os.path.dirname(nodes.__file__), manifest_path)
+            # the second time it is read from the cache
+            self.assertEqual(get_nodes_manifest(nodes.nodes_dict, os.path.dirname(nodes.__file__), manifest_path), manifest)
+        for node_class in iter_classes_from_module(sverchok.nodes, [bpy.types.Node]):
+            with self.subTest(node=node_class.bl_idname):
+                self.assertIn(node_class.bl_idname, manifest)
+                module_name, _ = manifest[node_class.bl_idname]
+                self.assertEqual("sverchok.nodes." + module_name, node_class.__module__)
+
+    def test_startup_time(self):
+        # enable the add-on in fresh Blender processes, as in background workers
+        if not bpy.app.binary_path:
+            self.skipTest("Blender executable is not known")
+        script = ("import time, addon_utils; start = time.perf_counter(); "
+                  f"addon_utils.enable('{sverchok.__name__}', default_set=True); "
+                  "print('SV_ENABLE_TIME', time.perf_counter() - start)")
+
+        def enable_time(lazy):
+            env = dict(os.environ, SVERCHOK_LAZY_LOADING="1" if lazy else "0")
+            result = subprocess.run([bpy.app.binary_path, "--background", "--factory-startup", "--python-expr", script],
+                                    env=env, capture_output=True, text=True, timeout=600)
+            for line in result.stdout.splitlines():
+                if line.startswith('SV_ENABLE_TIME'):
+                    return float(line.split()[1])
+            self.fail(f"Can't enable the add-on: {result.stderr}")
+
+        # the first run also writes the nodes manifest cache
+        enable_time(True)
+        lazy_time = enable_time(True)
+        eager_time = enable_time(False)
+        info("Enabling the add-on: lazy loading %.3f s, importing all nodes %.3f s", lazy_time, eager_time)
+        self.assertLess(lazy_time, eager_time)
+
+
+class LazyModuleTests(SverchokTestCase):
+
+    def test_broken_module(self):
+        dependency = SvDependency("no_such_package", "https://example.com")
+        module = SvLazyModule("sverchok_no_such_module", dependency)
+        dependency.module = module
+        with self.assertRaises(ImportError):
+            module.some_function
+        self.assertIsNone(dependency.module)
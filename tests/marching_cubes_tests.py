@@ -0,0 +1,33 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.marching_cubes import isosurface_np, isosurface_np_slow
+
+class MarchingCubesTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        xs = np.linspace(-1, 1, num=9)
+        ys = np.linspace(-1, 1.2, num=11)
+        zs = np.linspace(-1, 1, num=7)
+        x, y, z = np.meshgrid(xs, ys, zs, indexing='ij')
+        self.data = x**2 + y**2 + z**2 + 0.1*np.sin(5*x*y)
+
+    def test_isosurface(self):
+        "Vectorized implementation gives the same mesh as cube-by-cube one"
+        expected_verts, expected_faces = isosurface_np_slow(self.data, 0.7)
+        verts, faces = isosurface_np(self.data, 0.7)
+        self.assert_numpy_arrays_equal(verts, expected_verts, precision=8)
+        self.assertEqual(faces, expected_faces)
+
+    def test_isosurface_on_grid_values(self):
+        "Field values equal to isolevel"
+        data = np.round(self.data, 1)
+        expected_verts, expected_faces = isosurface_np_slow(data, 0.5)
+        verts, faces = isosurface_np(data, 0.5)
+        self.assert_numpy_arrays_equal(verts, expected_verts, precision=8)
+        self.assertEqual(faces, expected_faces)
+
+    def test_empty(self):
+        verts, faces = isosurface_np(self.data, 100.0)
+        self.assertEqual(len(verts), 0)
+        self.assertEqual(faces, [])
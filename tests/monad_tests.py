@@ -0,0 +1,92 @@
+import threading
+from unittest.mock import patch
+
+import bpy
+
+from sverchok.utils.testing import *
+from sverchok.utils import get_node_class_reference
+from sverchok.utils.monad import monad_make
+from sverchok.core.monad import clear_monad_cache, iteration_timings
+
+class MonadVectorizeTests(EmptyTreeTestCase):
+    """
+    Vectorized monad: x + 1 for each input object, optionally followed by List Join.
+    """
+
+    def setUp(self):
+        super().setUp()
+        clear_monad_cache()
+        self.monad = monad_make("TestVectorizeMonad")
+        in_node = self.monad.input_node
+        out_node = self.monad.output_node
+        self.math = self.monad.nodes.new('SvScalarMathNodeMK4')
+        self.math.current_op = 'ADD'
+        self.math.y_ = 1.0
+        self.monad.links.new(in_node.outputs[-1], self.math.inputs['x'])
+        in_node.update()
+
+    def tearDown(self):
+        bpy.data.node_groups.remove(self.monad)
+        clear_monad_cache()
+        super().tearDown()
+
+    def make_instance(self, last_node):
+        out_node = self.monad.output_node
+        self.monad.links.new(last_node.outputs[0], out_node.inputs[-1])
+        out_node.update()
+        self.monad.update_cls()
+
+        instance = self.tree.nodes.new(self.monad.cls_bl_idname)
+        instance.vectorize = True
+        source = self.tree.nodes.new('SvNumberNode')
+        self.tree.links.new(source.outputs[0], instance.inputs[0])
+        note = self.tree.nodes.new('NoteNode')
+        self.tree.links.new(instance.outputs[0], note.inputs[0])
+        source.outputs[0].sv_set([[1.0], [2.0], [3.0]])
+        return instance
+
+    def test_batched(self):
+        instance = self.make_instance(self.math)
+        instance.process()
+        self.assertTrue(iteration_timings[instance.node_id][0])
+        self.assertEqual(instance.outputs[0].sv_get(), [[2.0], [3.0], [4.0]])
+
+    def test_count_mismatch_fallback(self):
+        join = self.monad.nodes.new('ListJoinNode')
+        self.monad.links.new(self.math.outputs[0], join.inputs[0])
+        instance = self.make_instance(join)
+
+        join_class = get_node_class_reference('ListJoinNode')
+        with patch.object(join_class, 'sv_batch_capable', True, create=True):
+            instance.process()
+            update_list = instance.get_update_list()
+            # List Join makes one object of all items, so the batch was dropped
+            self.assertFalse(update_list.batch_capable)
+            self.assertFalse(iteration_timings[instance.node_id][0])
+            self.assertEqual(len(instance.outputs[0].sv_get()), 3)
+            batched_off = instance.outputs[0].sv_get()
+
+        clear_monad_cache()
+        instance.process()
+        self.assertEqual(instance.outputs[0].sv_get(), batched_off)
+
+    def test_parallel_update_thread_safety(self):
+        join = self.monad.nodes.new('ListJoinNode')
+        self.monad.links.new(self.math.outputs[0], join.inputs[0])
+        instance = self.make_instance(join)
+        self.tree.sv_parallel_update = True
+
+        join_class = get_node_class_reference('ListJoinNode')
+        threads = []
+        original_process = join_class.process
+
+        def process(node):
+            threads.append(threading.current_thread())
+            original_process(node)
+
+        # a node which did not declare sv_thread_safe is processed in the main thread
+        with patch.object(join_class, 'sv_thread_safe', False), \
+                patch.object(join_class, 'process', process):
+            instance.process()
+        self.assertTrue(threads)
+        self.assertTrue(all(thread is threading.main_thread() for thread in threads))
@@ -0,0 +1,84 @@
+from math import pi
+
+import numpy as np
+
+from sverchok.dependencies import scipy
+from sverchok.utils.testing import *
+from sverchok.utils.curve.primitives import SvCircle
+from sverchok.utils.surface.primitives import SvPlane
+from sverchok.utils.surface.sphere import SvDefaultSphere
+from sverchok.utils.manifolds import (nearest_point_on_curve, nearest_point_on_surface,
+            _init_guess_kdt, _nearest_t_scipy, _nearest_uv_scipy)
+
+@requires(scipy)
+class NearestPointOnSurfaceTests(SverchokTestCase):
+    """
+    Compare batched Newton iterations with per point scipy minimization,
+    which was used for all points before.
+    """
+
+    def scipy_points(self, surface, src_points, samples=10):
+        init_us = np.linspace(surface.get_u_min(), surface.get_u_max(), num=samples)
+        init_vs = np.linspace(surface.get_v_min(), surface.get_v_max(), num=samples)
+        init_us, init_vs = np.meshgrid(init_us, init_vs)
+        init_us, init_vs = init_us.flatten(), init_vs.flatten()
+        idxs, _, _ = _init_guess_kdt(surface.evaluate_array(init_us, init_vs), src_points)
+        return np.array([surface.evaluate(*_nearest_uv_scipy(surface, point, init_us[i], init_vs[i], 'L-BFGS-B'))
+                            for point, i in zip(src_points, idxs)])
+
+    def check(self, surface, src_points):
+        src_points = np.array(src_points)
+        us, vs, points = nearest_point_on_surface(src_points, surface)
+        expected = self.scipy_points(surface, src_points)
+        # scipy stops at about 1e-4 from the exact point
+        self.assertLess(abs(points - expected).max(), 1e-3)
+        self.assert_numpy_arrays_equal(surface.evaluate_array(us, vs), points, precision=8)
+        distances = np.linalg.norm(points - src_points, axis=1)
+        expected_distances = np.linalg.norm(expected - src_points, axis=1)
+        self.assertTrue((distances <= expected_distances + 1e-6).all())
+        return us, vs
+
+    def test_plane(self):
+        plane = SvPlane(np.array([0.0, 0.0, 0.0]), np.array([2.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]))
+        us, vs = self.check(plane, [(0.3, 0.4, 1.0), (1.7, 0.2, -0.5), (1.0, 0.9, 0.0)])
+        self.assert_numpy_arrays_equal(us, np.array([0.15, 0.85, 0.5]), precision=6)
+        self.assert_numpy_arrays_equal(vs, np.array([0.4, 0.2, 0.9]), precision=6)
+
+    def test_plane_boundary(self):
+        plane = SvPlane(np.array([0.0, 0.0, 0.0]), np.array([2.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]))
+        # nearest points are on edges and in corners of the plane
+        us, vs = self.check(plane, [(3.0, 0.5, 1.0), (1.0, 2.0, 0.5), (-1.0, -1.0, 0.2), (2.5, 1.5, 0.0)])
+        self.assert_numpy_arrays_equal(us, np.array([1.0, 0.5, 0.0, 1.0]), precision=6)
+        self.assert_numpy_arrays_equal(vs, np.array([0.5, 1.0, 0.0, 1.0]), precision=6)
+
+    def test_sphere(self):
+        sphere = SvDefaultSphere(np.array([0.0, 0.0, 0.0]), 2.0)
+        src_points = np.array([(3.0, 1.0, 0.5), (0.5, -0.3, 0.8), (-1.0, 2.0, -2.0)])
+        self.check(sphere, src_points)
+        _, _, points = nearest_point_on_surface(src_points, sphere)
+        expected = 2.0 * src_points / np.linalg.norm(src_points, axis=1)[:, np.newaxis]
+        # derivatives of the sphere are calculated numerically
+        self.assertLess(abs(points - expected).max(), 1e-3)
+
+    def test_sphere_boundary(self):
+        # half of the sphere, y >= 0; for points with y < 0 the
+        # nearest points are on the boundary meridians
+        sphere = SvDefaultSphere(np.array([0.0, 0.0, 0.0]), 1.0)
+        sphere.u_bounds = (0.0, pi)
+        us, vs = self.check(sphere, [(1.0, -0.5, 0.3), (-2.0, -1.0, -0.5), (0.2, 1.5, 0.1)])
+        self.assert_numpy_arrays_equal(us[:2], np.array([0.0, pi]), precision=5)
+
+@requires(scipy)
+class NearestPointOnCurveTests(SverchokTestCase):
+
+    def test_arc(self):
+        arc = SvCircle(center=np.array([0.0, 0.0, 0.0]), normal=np.array([0.0, 0.0, 1.0]), vectorx=np.array([1.0, 0.0, 0.0]))
+        arc.u_bounds = (0.0, pi)
+        src_points = np.array([(2.0, 1.0, 0.0), (0.1, 0.5, 0.3), (1.0, -1.0, 0.0), (-2.0, -0.5, 0.0)])
+        ts, points = nearest_point_on_curve(src_points, arc)
+        self.assert_numpy_arrays_equal(ts, np.array([np.arctan2(1.0, 2.0), np.arctan2(0.5, 0.1), 0.0, pi]), precision=5)
+
+        init_ts = np.linspace(0.0, pi, num=50)
+        idxs, _, _ = _init_guess_kdt(arc.evaluate_array(init_ts), src_points)
+        expected = [_nearest_t_scipy(arc, point, init_ts[i], pi / 50, 'Bounded') for point, i in zip(src_points, idxs)]
+        self.assertLess(abs(ts - np.array(expected)).max(), 1e-4)
@@ -61,6 +61,20 @@ class NurbsCurveTests(SverchokTestCase):
 
         self.assert_numpy_arrays_equal(expected, d2s, precision=8)
 
+    def test_span_functions(self):
+        "Test that span-localized basis functions match full basis functions"
+        knotvector = [0, 0, 0, 0, 0.3, 0.5, 0.5, 1, 1, 1, 1]
+        k = len(knotvector) - self.degree - 1
+        ts = np.linspace(-0.1, 1.1, num=25)
+        functions = SvNurbsBasisFunctions(knotvector)
+        for order in range(self.degree + 2):
+            expected = np.array([np.broadcast_to(functions.derivative(i, self.degree, order)(ts), ts.shape) for i in range(k)]).T
+            idxs, values = functions.span_functions(self.degree, ts, order)
+            result = np.zeros((len(ts), k))
+            for r in range(self.degree + 1):
+                result[np.arange(len(ts)), idxs[:,r]] += values[:,r]
+            self.assert_numpy_arrays_equal(result, expected, precision=8)
+
     #@unittest.skip
     @requires(geomdl)
     def test_curve_eval(self):
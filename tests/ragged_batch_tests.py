@@ -0,0 +1,40 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.sv_ragged_batch import batch_apply, pack_objects
+
+class RaggedBatchTests(SverchokTestCase):
+    def test_pack(self):
+        values, lengths = pack_objects([[1, 2, 3], [4, 5]])
+        self.assert_numpy_arrays_equal(values, np.array([1, 2, 3, 4, 5]))
+        self.assert_numpy_arrays_equal(lengths, np.array([3, 2]))
+
+    def test_pack_irregular(self):
+        self.assertIsNone(pack_objects([[1, 2], []]))
+        self.assertIsNone(pack_objects([[1, [2, 3]]]))
+        self.assertIsNone(pack_objects([[(0, 0, 0)]], element_ndim=0))
+
+    def test_mixed_types(self):
+        # integer objects must stay integer, as the per-object code path keeps them
+        self.assertIsNone(pack_objects([[1, 2], [0.5]]))
+        self.assertIsNone(pack_objects([np.array([1, 2]), np.array([0.5])]))
+        self.assertIsNotNone(pack_objects([[1, 2.5], [0.5]]))
+        self.assertIsNotNone(pack_objects([[(0, 0, 1.0)], [(0.5, 0, 0)]], element_ndim=1))
+
+    def test_repeat(self):
+        result = batch_apply(lambda x, y: x + y, [[[1, 2, 3], [4]], [[10, 20]]])
+        self.assertEqual(result, [[11, 22, 23], [14, 24]])
+
+    def test_cycle(self):
+        result = batch_apply(lambda x, y: x + y, [[[1, 2, 3], [4]], [[10, 20]]], mode='CYCLE')
+        self.assertEqual(result, [[11, 22, 13], [14, 24]])
+
+    def test_short(self):
+        result = batch_apply(lambda x, y: x + y, [[[1, 2, 3], [4]], [[10, 20]]], mode='SHORT')
+        self.assertEqual(result, [[11, 22]])
+
+    def test_vectors(self):
+        vectors = [[(1, 0, 0), (0, 1, 0)], [(0, 0, 1)]]
+        scalars = [[2], [3, 4]]
+        result = batch_apply(lambda v, s: v * s[:, np.newaxis], [vectors, scalars], [1, 0])
+        self.assertEqual(result, [[[2, 0, 0], [0, 2, 0]], [[0, 0, 3], [0, 0, 4]]])
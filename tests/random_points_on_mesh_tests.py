@@ -0,0 +1,35 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.nodes.modifier_make.random_points_on_mesh import TriangulatedMesh, poisson_disk_mask
+
+class RandomPointsOnMeshTests(SverchokTestCase):
+    verts = [(0, 0, 0), (2, 0, 0), (2, 1, 0), (0, 1, 0), (3, 0, 0), (5, 0, 0), (5, 2, 0), (4, 1, 0), (3, 2, 0)]
+    faces = [[0, 1, 2, 3], [4, 5, 6, 7, 8]]
+
+    def test_triangulation(self):
+        me = TriangulatedMesh(self.verts, self.faces)
+        self.assertEqual(me._old_face_indexes_per_tri.tolist(), [0, 0, 1, 1, 1])
+        self.assertAlmostEqual(me.tri_face_areas.sum(), 5.0)
+
+    def test_seed(self):
+        me = TriangulatedMesh(self.verts, self.faces)
+        me.use_even_points_distribution()
+        points, face_idxs = me.generate_random_points(100, 3)
+        self.assertEqual(len(points), 100)
+        self.assertEqual((points, face_idxs), me.generate_random_points(100, 3))
+
+    def test_face_weights(self):
+        me = TriangulatedMesh(self.verts, self.faces)
+        me.set_custom_face_weights([0, 1])
+        points, face_idxs = me.generate_random_points(50, 1)
+        self.assertEqual(set(face_idxs), {1})
+
+    def test_poisson_disk(self):
+        points = np.random.default_rng(0).random((500, 3))
+        mask = poisson_disk_mask(points, 0.2)
+        expected = []
+        for i, point in enumerate(points):
+            if all(np.linalg.norm(point - points[j]) >= 0.2 for j in expected):
+                expected.append(i)
+        self.assertEqual(np.flatnonzero(mask).tolist(), expected)
@@ -1,6 +1,6 @@
 
-from mathutils import Matrix
-from sverchok.core.socket_conversions import ImplicitConversionProhibited
+from mathutils import Matrix, Quaternion
+from sverchok.core.socket_conversions import ImplicitConversionProhibited, get_matrices_from_quaternions
 from sverchok.utils.testing import *
 from sverchok.utils.logging import debug, info, error
 
@@ -44,6 +44,29 @@ class SocketConversionTests(EmptyTreeTestCase):
 
         self.assert_sverchok_data_equal(data, expected_data, precision=8)
 
+    def test_conversion_is_cached(self):
+        """
+        Test that data converted for one input is reused until the output gets new data.
+        """
+        ngon = create_node("SvNGonNode")
+        matrix_apply = create_node("MatrixApplyNode")
+        self.tree.links.new(ngon.outputs['Vertices'], matrix_apply.inputs['Matrixes'])
+
+        ngon.process()
+        socket = matrix_apply.inputs['Matrixes']
+        first = socket.sv_get(deepcopy=False)
+        self.assertIs(socket.sv_get(deepcopy=False), first)
+
+        ngon.sides_ = 5
+        ngon.process()
+        self.assertEqual(len(socket.sv_get(deepcopy=False)), 5)
+
+    def test_quaternions_to_matrices(self):
+        quaternions = [[(1, 0, 0, 0), (0.5, 0.5, -0.5, 0.5), (0.9, 0.1, 0.3, -0.2)]]
+        expected = [[v[:] for v in Quaternion(q).to_matrix().to_4x4()] for q in quaternions[0]]
+        result = [[v[:] for v in m] for m in get_matrices_from_quaternions(quaternions)]
+        self.assert_sverchok_data_equal(result, expected, precision=6)
+
     # def test_no_edges_to_verts(self):
     #     """
     #     Test that edges -> vertices conversion raises an exception.
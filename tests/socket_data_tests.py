@@ -0,0 +1,122 @@
+import numpy as np
+
+from sverchok import data_structure
+from sverchok.utils.testing import *
+from sverchok.core.socket_data import SvFrozenList, freeze_data, readonly_array
+from sverchok.core.sv_custom_exceptions import SvInputMutationError
+
+class FrozenListTests(SverchokTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.data = [[1, 2, 3], [4, 5], [[6, 7], [8]]]
+        self.frozen = SvFrozenList(self.data)
+
+    def test_mutators(self):
+        calls = [
+            lambda l: l.append(1),
+            lambda l: l.extend([1]),
+            lambda l: l.insert(0, 1),
+            lambda l: l.remove([4, 5]),
+            lambda l: l.pop(),
+            lambda l: l.clear(),
+            lambda l: l.sort(),
+            lambda l: l.reverse(),
+            lambda l: l.__setitem__(0, 1),
+            lambda l: l.__setitem__(slice(0, 1), [1]),
+            lambda l: l.__delitem__(0),
+            lambda l: l.__iadd__([1]),
+            lambda l: l.__imul__(2),
+        ]
+        for i, call in enumerate(calls):
+            with self.subTest(call=i):
+                with self.assertRaises(SvInputMutationError):
+                    call(self.frozen)
+        self.assertEqual(self.frozen, [[1, 2, 3], [4, 5], [[6, 7], [8]]])
+
+    def test_nested_lists(self):
+        with self.assertRaises(SvInputMutationError):
+            self.frozen[0].append(4)
+        with self.assertRaises(SvInputMutationError):
+            self.frozen[2][0][0] = 0
+        for item in self.frozen:
+            self.assertIsInstance(item, SvFrozenList)
+        self.assertEqual(self.data[0], [1, 2, 3])
+
+    def test_augmented_assignment(self):
+        data = self.frozen
+        with self.assertRaises(SvInputMutationError):
+            data += [[9]]
+        with self.assertRaises(SvInputMutationError):
+            data *= 2
+
+    def test_readable_results(self):
+        # slices, iteration and concatenation give plain lists which can be changed
+        results = [self.frozen[:2], self.frozen[::-1], list(self.frozen), list(reversed(self.frozen)),
+                   self.frozen + [[9]], [[9]] + self.frozen, self.frozen * 2, self.frozen.copy()]
+        for result in results:
+            with self.subTest(result=result):
+                self.assertIs(type(result), list)
+                result.append([10])
+        self.assertEqual(self.frozen[:2], [[1, 2, 3], [4, 5]])
+        self.assertEqual(self.frozen[::-1], [[[6, 7], [8]], [4, 5], [1, 2, 3]])
+        self.assertEqual(self.frozen + [[9]], [[1, 2, 3], [4, 5], [[6, 7], [8]], [9]])
+        self.assertEqual(self.frozen * 2, self.data * 2)
+        self.assertEqual(sum(len(l) for l in self.frozen), 7)
+        self.assertEqual(len(self.frozen), 3)
+
+    def test_arrays(self):
+        array = np.arange(6.0)
+        frozen = SvFrozenList([[array]])
+        view = frozen[0][0]
+        with self.assertRaises(ValueError):
+            view[0] = 10
+        self.assert_numpy_arrays_equal(view, np.arange(6.0))
+        # the original array can still be changed by its owner
+        self.assertTrue(array.flags.writeable)
+
+class ReadonlyArrayTests(SverchokTestCase):
+
+    def test_write(self):
+        array = np.zeros((2, 3))
+        view = readonly_array(array)
+        with self.assertRaises(ValueError):
+            view[0, 0] = 1
+        with self.assertRaises(ValueError):
+            view += 1
+        # operations which make new arrays are fine
+        self.assert_numpy_arrays_equal(view + 1, np.ones((2, 3)))
+        array[0, 0] = 5
+        self.assertEqual(view[0, 0], 5)
+
+    def test_freeze_data(self):
+        array = np.zeros(3)
+        self.assertFalse(freeze_data(array).flags.writeable)
+        self.assertIsInstance(freeze_data([[1]]), SvFrozenList)
+        self.assertEqual(freeze_data(5), 5)
+
+class InputMutationCheckTests(EmptyTreeTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.check_input_mutation = data_structure.CHECK_INPUT_MUTATION
+        data_structure.CHECK_INPUT_MUTATION = True
+        self.number = create_node("SvNumberNode", self.tree.name)
+        self.note = create_node("NoteNode", self.tree.name)
+        self.tree.links.new(self.number.outputs[0], self.note.inputs[0])
+        self.number.outputs[0].sv_set([[1.0, 2.0]])
+
+    def tearDown(self):
+        data_structure.CHECK_INPUT_MUTATION = self.check_input_mutation
+        super().tearDown()
+
+    def test_shared_data(self):
+        data = self.note.inputs[0].sv_get(deepcopy=False)
+        with self.assertRaises(SvInputMutationError):
+            data[0].append(3.0)
+        self.assertEqual(data, [[1.0, 2.0]])
+
+    def test_copied_data(self):
+        data = self.note.inputs[0].sv_get(deepcopy=True)
+        data[0].append(3.0)
+        self.assertEqual(self.note.inputs[0].sv_get(deepcopy=False), [[1.0, 2.0]])
@@ -0,0 +1,45 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.modules import texture_lattice
+from sverchok.utils.modules.texture_lattice import evaluate_textures_baked, color_channel_values
+
+class LinearTexture():
+    """Texture which colors are linear functions of coordinates, so interpolation is exact"""
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate(self, vec):
+        self.calls += 1
+        x, y, z = vec
+        return (0.5 + 0.1*x, 0.3 + 0.05*y - 0.02*z, 0.2 + 0.01*z, 1.0)
+
+class TextureLatticeTests(SverchokTestCase):
+    def tearDown(self):
+        texture_lattice.baked_textures.clear()
+
+    def test_interpolation(self):
+        texture = LinearTexture()
+        points = np.random.default_rng(0).random((100, 3))
+        expected = np.array([texture.evaluate(p) for p in points.tolist()])
+        self.assert_numpy_arrays_equal(evaluate_textures_baked(texture, points, 4), expected, precision=8)
+
+    def test_cache(self):
+        texture = LinearTexture()
+        points = np.random.default_rng(0).random((100, 3))
+        evaluate_textures_baked(texture, points, 4)
+        calls = texture.calls
+        evaluate_textures_baked(texture, points[:50], 4)
+        self.assertEqual(texture.calls, calls)
+
+    def test_flat_lattice(self):
+        texture = LinearTexture()
+        points = np.random.default_rng(0).random((100, 3))
+        points[:, 2] = 0.0
+        evaluate_textures_baked(texture, points, 4)
+        self.assertEqual(texture.calls, 16)
+
+    def test_channels(self):
+        rgba = np.array([[0.5, 0.5, 0.5, 1.0], [1.0, 0.0, 0.0, 0.5]])
+        self.assert_numpy_arrays_equal(color_channel_values(rgba, 'Hue'), np.array([0.0, 0.0]))
+        self.assert_numpy_arrays_equal(color_channel_values(rgba, 'Alpha'), np.array([1.0, 0.5]))
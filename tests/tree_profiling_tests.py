@@ -0,0 +1,62 @@
+import tracemalloc
+from types import SimpleNamespace
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils import tree_profiling
+from sverchok.utils.tree_profiling import data_size, process_node, get_statistics
+
+class FakeNode():
+    """Object with the attributes process_node needs, allocating memory in process()"""
+    def __init__(self, name, allocate, nested=None):
+        self.name = name
+        self.bl_idname = "FakeNode"
+        self.id_data = SimpleNamespace(name="ProfilingTestTree")
+        self.outputs = []
+        self.allocate = allocate
+        self.nested = nested
+
+    def process(self):
+        data = bytearray(self.allocate)
+        del data
+        if self.nested is not None:
+            process_node(self.nested)
+
+class TreeProfilingTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        tree_profiling.reset()
+        tree_profiling.start(memory=True)
+
+    def tearDown(self):
+        tree_profiling.stop()
+        tree_profiling.reset()
+        super().tearDown()
+
+    def test_data_size(self):
+        self.assertEqual(data_size(np.zeros(10)), 80)
+        small = [[1.0, 2.0]] * 4
+        self.assertGreater(data_size(small), data_size(small[0]) * 4)
+        # long lists are sampled, the estimate stays close
+        big = [[float(i)] for i in range(1000)]
+        exact = sum(data_size(item) for item in big)
+        self.assertAlmostEqual(data_size(big) - data_size([]) - 8 * 1000, exact, delta=exact * 0.1)
+
+    def test_statistics(self):
+        node = FakeNode("Node", 10)
+        for i in range(3):
+            process_node(node)
+        stats = get_statistics("ProfilingTestTree")
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0]['count'], 3)
+
+    def test_nested_peak_memory(self):
+        if not hasattr(tracemalloc, 'reset_peak'):
+            self.skipTest("tracemalloc.reset_peak is not available")
+        inner = FakeNode("Inner", 1000)
+        outer = FakeNode("Outer", 1000000, nested=inner)
+        process_node(outer)
+        stats = {s['node']: s for s in get_statistics("ProfilingTestTree")}
+        self.assertGreaterEqual(stats["Outer"]['last_peak_memory'], 1000000)
+        self.assertLess(stats["Inner"]['last_peak_memory'], 1000000)
@@ -1,10 +1,19 @@
 
 import collections
+import inspect
 import unittest
 
+import bpy
+
 from sverchok.utils.testing import *
 from sverchok.utils.logging import debug, info
-from sverchok.core.update_system import make_dep_dict, make_update_list
+from sverchok.core.update_system import (make_dep_dict, make_update_list, get_node_signature,
+            get_link_dependencies, clear_link_dependencies)
+from sverchok.core.links import SvLink, SvLinksSnapshot, get_new_linked_nodes, get_new_unlinked_nodes
+from sverchok.utils import get_node_class_reference
+from sverchok.utils.modules_inspection import iter_classes_from_module
+import sverchok
+from sverchok.core.socket_data import SvGetSocketVersion, _is_same_data
 #from sverchok.tests.mocks import *
 
 class UpdateSystemTests(ReferenceTreeTestCase):
@@ -36,3 +45,151 @@ class UpdateSystemTests(ReferenceTreeTestCase):
                 dep_idx = result.index(dep)
                 self.assertTrue(dep_idx < node_idx)
 
+
+class SocketDataVersionTests(NodeProcessTestCase):
+    node_bl_idname = "SvBoxNodeMk2"
+    connect_output_sockets = ["Vers"]
+
+    def test_data_version(self):
+        self.node.Divx = 1
+        self.node.process()
+        version = SvGetSocketVersion(self.node.outputs["Vers"])
+        self.assertIsNotNone(version)
+
+        # the same data should not change the version
+        self.node.process()
+        self.assertEqual(SvGetSocketVersion(self.node.outputs["Vers"]), version)
+
+        self.node.Divx = 2
+        self.node.process()
+        self.assertNotEqual(SvGetSocketVersion(self.node.outputs["Vers"]), version)
+
+
+class IncrementalUpdateTests(NodeProcessTestCase):
+    # reads the current frame of the scene
+    node_bl_idname = "SvCacheNode"
+
+    def test_scene_reading_node_not_skipped(self):
+        self.assertFalse(self.tree.sv_incremental_update)
+        source = self.tree.nodes.new("SvNumberNode")
+        self.tree.links.new(source.outputs[0], self.node.inputs[0])
+        source.outputs[0].sv_set([[1]])
+        self.assertIsNone(get_node_signature(self.node))
+
+
+class SameDataTests(SverchokTestCase):
+    def test_equal_data(self):
+        self.assertTrue(_is_same_data([[1, 2.0, (0, 0, 1)]], [[1, 2.0, (0, 0, 1)]]))
+        self.assertFalse(_is_same_data([[1, 2]], [[1, 2.0]]))
+
+    def test_mutated_in_place(self):
+        vertices = [(0, 0, 0)]
+        data = [vertices]
+        self.assertFalse(_is_same_data(data, data))
+        # a new outer list sharing the nested one, which could be changed in place
+        self.assertFalse(_is_same_data(data, [vertices]))
+
+    def test_big_data(self):
+        data = [list(range(2000))]
+        self.assertFalse(_is_same_data(data, [list(range(2000))]))
+
+
+class LinksSnapshotTests(SverchokTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.a_b = SvLink("A", "B", "A.out", "B.in")
+        self.b_c = SvLink("B", "C", "B.out", "C.in")
+        self.before = SvLinksSnapshot([self.a_b, self.b_c])
+        self.nodes = {"A": None, "B": None, "C": None, "D": None}
+
+    def changed_nodes(self, after):
+        linked = get_new_linked_nodes(after.links, self.before.links, self.before.output_sockets)
+        unlinked = get_new_unlinked_nodes(self.before.input_sockets, after.input_sockets, self.nodes)
+        return linked, unlinked
+
+    def test_same(self):
+        after = SvLinksSnapshot([self.b_c, self.a_b])
+        self.assertEqual(after, self.before)
+        self.assertEqual(self.changed_nodes(after), ([], []))
+
+    def test_added(self):
+        after = SvLinksSnapshot([self.a_b, self.b_c, SvLink("D", "C", "D.out", "C.in2")])
+        self.assertNotEqual(after, self.before)
+        # the new output is linked, so D is processed too
+        self.assertEqual(self.changed_nodes(after), (["D", "C"], []))
+
+    def test_removed(self):
+        after = self.before.without(self.b_c)
+        self.assertNotEqual(after, self.before)
+        self.assertNotIn(self.b_c, after)
+        self.assertEqual(after.input_sockets, {"B.in": "B"})
+        self.assertEqual(self.changed_nodes(after), ([], ["C"]))
+
+    def test_relinked(self):
+        # C gets data from A instead of B; output of A was already linked
+        after = SvLinksSnapshot([self.a_b, SvLink("A", "C", "A.out", "C.in")])
+        self.assertNotEqual(after, self.before)
+        self.assertEqual(after.output_sockets, {"A.out"})
+        self.assertEqual(self.changed_nodes(after), (["C"], []))
+
+    def test_empty(self):
+        self.assertFalse(SvLinksSnapshot())
+        self.assertTrue(self.before)
+
+
+class LinkDependenciesTests(EmptyTreeTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.number = create_node("SvNumberNode", self.tree.name)
+        self.note = create_node("NoteNode", self.tree.name)
+        self.other = create_node("SvNumberNode", self.tree.name)
+        self.tree.links.new(self.number.outputs[0], self.note.inputs[0])
+        self.copies = []
+
+    def tearDown(self):
+        for tree in self.copies:
+            clear_link_dependencies(tree)
+            bpy.data.node_groups.remove(tree)
+        super().tearDown()
+
+    def test_relink(self):
+        up, down = get_link_dependencies(self.tree)
+        self.assertEqual(up, {self.note.name: {self.number.name}})
+        self.assertEqual(down, {self.number.name: {self.note.name}})
+
+        self.tree.links.new(self.other.outputs[0], self.note.inputs[0])
+        up, down = get_link_dependencies(self.tree)
+        self.assertEqual(up, {self.note.name: {self.other.name}})
+        self.assertEqual(down, {self.other.name: {self.note.name}})
+
+    def test_copied_tree(self):
+        get_link_dependencies(self.tree)
+        copy = self.tree.copy()
+        self.copies.append(copy)
+        # the copy has the same tree_id and node names, but different links
+        self.assertEqual(copy.tree_id, self.tree.tree_id)
+        copy.links.new(copy.nodes[self.other.name].outputs[0], copy.nodes[self.note.name].inputs[0])
+
+        self.assertEqual(get_link_dependencies(copy)[0], {self.note.name: {self.other.name}})
+        self.assertEqual(get_link_dependencies(self.tree)[0], {self.note.name: {self.number.name}})
+
+
+class ThreadSafetyTests(SverchokTestCase):
+    # nodes which read or write Blender data in their process method
+    blender_data_nodes = ["SvOBJInsolationNode", "SvMultiCacheNode", "SvScriptNodeLite",
+                          "SvDisplaceNodeMk2", "SvTextureEvaluateNodeMk2", "SvCurveMapperNode"]
+
+    def test_blender_data_nodes_are_not_thread_safe(self):
+        for bl_idname in self.blender_data_nodes:
+            with self.subTest(node=bl_idname):
+                self.assertFalse(get_node_class_reference(bl_idname).sv_thread_safe)
+
+    def test_thread_safe_nodes_do_not_access_blender_data(self):
+        for node_class in iter_classes_from_module(sverchok.nodes, [bpy.types.Node]):
+            if getattr(node_class, "sv_thread_safe", False) is not True:
+                continue
+            source = inspect.getsource(node_class.process)
+            for api in ["bpy.data", "bpy.context", "bpy.ops", ".evaluate("]:
+                self.assertNotIn(api, source, f"{node_class.__name__} is marked as thread safe but uses {api}")
@@ -0,0 +1,63 @@
+from itertools import product
+
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.utils.wfc_algorithm import WaveFunctionCollapse, bitmask_indices
+
+class WaveFunctionCollapseTests(SverchokTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # RGBA image of 8x8 pixels: a thin cross on white, a red square in the corner
+        white, black, red = (1, 1, 1, 1), (0, 0, 0, 1), (1, 0, 0, 1)
+        image = np.full((8, 8, 4), white, dtype=np.float64)
+        image[3, :] = black
+        image[:, 3] = black
+        image[5:7, 5:7] = red
+        self.image = image
+
+    def solve(self, rotate, tiling, seed=3, size=(12, 10)):
+        wave = WaveFunctionCollapse(self.image, patter_size=3, rotate_patterns=rotate)
+        output = wave.solve(output_size=size, seed=seed, tiling_output=tiling, max_number_contradiction_tries=20)
+        return wave, output
+
+    def test_deterministic(self):
+        for rotate, tiling in product([False, True], [False, True]):
+            with self.subTest(rotate=rotate, tiling=tiling):
+                wave, output = self.solve(rotate, tiling)
+                _, same_output = self.solve(rotate, tiling)
+                self.assertEqual(output, same_output)
+                # solving again with the same instance gives the same result
+                self.assertEqual(wave.solve(output_size=(12, 10), seed=3, tiling_output=tiling,
+                                            max_number_contradiction_tries=20), output)
+
+    def test_output_size(self):
+        _, output = self.solve(False, False)
+        self.assertEqual(len(output), 10)
+        self.assertTrue(all(len(row) == 12 for row in output))
+
+    def test_adjacency_rules(self):
+        for rotate, tiling in product([False, True], [False, True]):
+            with self.subTest(rotate=rotate, tiling=tiling):
+                wave, output = self.solve(rotate, tiling)
+                width, height = wave.output_grid_size
+                size = wave.pattern_size
+                patterns = [np.array(pattern).reshape((size, size, 4)) for pattern in wave.patterns]
+                cell_patterns = [bitmask_indices(cell) for cell in wave.output_grid]
+                self.assertTrue(all(len(indices) == 1 for indices in cell_patterns))
+
+                for cell, (y, x) in enumerate(product(range(height), range(width))):
+                    index = cell_patterns[cell][0]
+                    self.assertEqual(output[y][x], tuple(patterns[index][0, 0]))
+                    for direction, (dx, dy) in enumerate(wave.nbr_directions):
+                        nx, ny = x + dx, y + dy
+                        if not tiling and not (0 <= nx < width and 0 <= ny < height):
+                            continue
+                        neighbor = bitmask_indices(wave.output_grid[(nx % width) + (ny % height) * width])[0]
+                        self.assertTrue(wave.allowed_pattern_adjacencies[direction, index, neighbor])
+                        # patterns of neighbour cells are equal where they overlap
+                        pattern, other = patterns[index], patterns[neighbor]
+                        overlap = pattern[max(dy, 0) : size + min(dy, 0), max(dx, 0) : size + min(dx, 0)]
+                        other_overlap = other[max(-dy, 0) : size + min(-dy, 0), max(-dx, 0) : size + min(-dx, 0)]
+                        self.assert_numpy_arrays_equal(overlap, other_overlap)
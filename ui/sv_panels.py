@@ -19,7 +19,7 @@
 import bpy
 
 import sverchok
-from sverchok.utils import profile
+from sverchok.utils import profile, tree_profiling
 from sverchok.utils.sv_update_utils import version_and_sha
 from sverchok.ui.development import displaying_sverchok_nodes
 from sverchok.core.update_system import process_tree, build_update_list
@@ -85,6 +85,8 @@ class SV_PT_ActiveTreePanel(SverchokPanels, bpy.types.Panel):
         if ng.sv_show_error_in_tree:
             col.prop(ng, "sv_show_error_details")
         col.prop(ng, "sv_show_socket_menus")
+        col.prop(ng, "sv_incremental_update")
+        col.prop(ng, "sv_parallel_update")
 
 
 class SV_PT_ProfilingPanel(SverchokPanels, bpy.types.Panel):
@@ -121,6 +123,18 @@ class SV_PT_ProfilingPanel(SverchokPanels, bpy.types.Panel):
         col_save.operator("node.sverchok_profile_save", text="Save data", icon="FILE_TICK")
         col_save.operator("node.sverchok_profile_reset", text="Reset data", icon="X")
 
+        col.separator()
+        col.label(text="Nodes statistics:")
+        if tree_profiling.is_collecting:
+            col.operator("node.sverchok_node_stats_toggle", text="Stop collecting", icon="CANCEL")
+        else:
+            row = col.row(align=True)
+            row.operator("node.sverchok_node_stats_toggle", text="Collect", icon="TIME").memory = False
+            row.operator("node.sverchok_node_stats_toggle", text="Collect with memory", icon="MEMORY").memory = True
+        col.operator("node.sverchok_node_stats_save", text="Save CSV", icon="FILE_TICK").format = "CSV"
+        col.operator("node.sverchok_node_stats_save", text="Save trace", icon="FILE_TICK").format = "TRACE"
+        col.operator("node.sverchok_node_stats_reset", text="Reset statistics", icon="X")
+
 
 class SV_PT_SverchokUtilsPanel(SverchokPanels, bpy.types.Panel):
     bl_idname = "SV_PT_SverchokUtilsPanel"
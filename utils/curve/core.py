@@ -13,6 +13,7 @@ from mathutils import Vector, Matrix
 from sverchok.utils.geom import LineEquation, CubicSpline
 from sverchok.utils.integrate import TrapezoidIntegral
 from sverchok.utils.logging import info, error
+from sverchok.utils.modules.eval_formula import SvNotVectorizableError
 from sverchok.utils.math import binomial
 from sverchok.utils.nurbs_common import SvNurbsMaths
 from sverchok.utils.curve import knotvector as sv_knotvector
@@ -611,10 +612,10 @@ class SvReparametrizeCurve(SvCurve):
         ts = m + ts*(M-m)
         return self.curve.third_derivative_array(ts)
 
-    def derivatives_array(self, ts):
+    def derivatives_array(self, n, ts):
         m, M = self.curve.get_u_bounds()
         ts = m + ts*(M-m)
-        return self.curve.derivatives_array(ts)
+        return self.curve.derivatives_array(n, ts)
 
 class SvCurveSegment(SvCurve):
     def __init__(self, curve, u_min, u_max, rescale=False):
@@ -678,11 +679,11 @@ class SvCurveSegment(SvCurve):
             ts = (M - m)*ts + m
         return self.curve.third_derivative_array(ts)
 
-    def derivatives_array(self, ts):
+    def derivatives_array(self, n, ts):
         if self.rescale:
             m,M = self.target_u_bounds
             ts = (M - m)*ts + m
-        return self.curve.derivatives_array(ts)
+        return self.curve.derivatives_array(n, ts)
 
 class SvLambdaCurve(SvCurve):
     __description__ = "Formula"
@@ -701,9 +702,13 @@ class SvLambdaCurve(SvCurve):
 
     def evaluate_array(self, ts):
         if self.function_numpy is not None:
-            return self.function_numpy(ts)
-        else:
-            return np.vectorize(self.function, signature='()->(3)')(ts)
+            try:
+                return self.function_numpy(ts)
+            except SvNotVectorizableError:
+                # evaluate per element this time; this can depend on the
+                # values, so vectorized evaluation is tried again next time
+                pass
+        return np.vectorize(self.function, signature='()->(3)')(ts)
 
     def tangent(self, t):
         point = self.function(t)
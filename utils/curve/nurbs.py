@@ -680,26 +680,25 @@ class SvNativeNurbsCurve(SvNurbsCurve):
             return numerator / denominator
 
     def fraction(self, deriv_order, ts):
-        n = len(ts)
         p = self.degree
-        k = len(self.control_points)
-        ns = np.array([self.basis.derivative(i, p, deriv_order)(ts) for i in range(k)]) # (k, n)
-        coeffs = ns * self.weights[np.newaxis].T # (k, n)
-        coeffs_t = coeffs[np.newaxis].T # (n, k, 1)
-        numerator = (coeffs_t * self.control_points) # (n, k, 3)
+        # Only p+1 basis functions are non-zero at each t
+        idxs, ns = self.basis.span_functions(p, ts, deriv_order) # (n, p+1)
+        coeffs = ns * self.weights[idxs] # (n, p+1)
+        coeffs_t = coeffs[:,:,np.newaxis] # (n, p+1, 1)
+        numerator = (coeffs_t * self.control_points[idxs]) # (n, p+1, 3)
         numerator = numerator.sum(axis=1) # (n, 3)
-        denominator = coeffs.sum(axis=0) # (n,)
+        denominator = coeffs.sum(axis=1) # (n,)
 
         return numerator, denominator[np.newaxis].T
 
     def fraction_single(self, deriv_order, t):
         p = self.degree
-        k = len(self.control_points)
         ts = np.array([t])
-        ns = np.array([self.basis.derivative(i, p, deriv_order)(ts)[0] for i in range(k)]) # (k,)
-        coeffs = ns * self.weights # (k, )
+        idxs, ns = self.basis.span_functions(p, ts, deriv_order)
+        idxs, ns = idxs[0], ns[0] # (p+1,)
+        coeffs = ns * self.weights[idxs] # (p+1, )
         coeffs_t = coeffs[np.newaxis].T
-        numerator = (coeffs_t * self.control_points) # (k, 3)
+        numerator = (coeffs_t * self.control_points[idxs]) # (p+1, 3)
         numerator = numerator.sum(axis=0) # (3,)
         denominator = coeffs.sum(axis=0) # ()
 
@@ -0,0 +1,154 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Integration of lines following a vector field (dP/dt = F(P)) from many
+start points at once. Each field evaluation is one evaluate_grid call
+for all lines which are still running.
+"""
+
+import numpy as np
+
+# lines stop where the field is weaker than this
+ZERO_FIELD = 1e-12
+
+# smaller tolerance of the adaptive method would make it reject all steps
+MIN_TOLERANCE = 1e-12
+
+# Dormand - Prince 5(4) coefficients
+DOPRI_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84]
+]
+DOPRI_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+DOPRI_B_LOW = np.array([5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+
+def field_velocity(field, normalize=True):
+    """
+    Right-hand side of the field line equation: function of (n, 3) points,
+    returning field vectors (unit vectors if normalize is True) and a mask
+    of points where the field is zero.
+    """
+    def velocity(points):
+        xs, ys, zs = field.evaluate_grid(points[:,0], points[:,1], points[:,2])
+        vectors = np.stack((xs, ys, zs), axis=1)
+        norms = np.linalg.norm(vectors, axis=1)
+        vanishing = norms < ZERO_FIELD
+        if normalize:
+            vectors = vectors / np.where(vanishing, 1.0, norms)[:, np.newaxis]
+        vectors[vanishing] = 0.0
+        return vectors, vanishing
+    return velocity
+
+def integrate_fixed(field, points, step, iterations, method='RK4', normalize=True):
+    """
+    Integrate with fixed step by forward Euler ('EULER') or classic
+    Runge - Kutta ('RK4') method.
+    Returns (n, iterations, 3) array of points after each step (start points are not included).
+    Lines which reach a point where the field is zero stay there.
+    """
+    velocity = field_velocity(field, normalize)
+    # a copy, points are updated in place
+    points = np.array(points, dtype=np.float64)
+    n = len(points)
+    result = np.empty((n, iterations, 3))
+    active = np.ones(n, dtype=bool)
+    for i in range(iterations):
+        idxs = np.flatnonzero(active)
+        if len(idxs):
+            p = points[idxs]
+            k1, stop = velocity(p)
+            if method == 'EULER':
+                delta = step * k1
+            else:
+                k2, _ = velocity(p + 0.5 * step * k1)
+                k3, _ = velocity(p + 0.5 * step * k2)
+                k4, _ = velocity(p + step * k3)
+                delta = step / 6.0 * (k1 + 2*k2 + 2*k3 + k4)
+            points[idxs] = p + delta
+            active[idxs[stop]] = False
+        result[:, i, :] = points
+    return result
+
+def integrate_adaptive(field, points, length, tolerance=1e-4, step=None, max_steps=1000, normalize=True):
+    """
+    Integrate by adaptive Dormand - Prince 5(4) method, until the parameter
+    reaches `length` (path length, when normalize is True), with separate
+    step control for each line.
+    Returns a list of (k_i, 3) arrays: points of each line after each accepted step;
+    lines stop earlier when the field is zero or after max_steps steps.
+    """
+    velocity = field_velocity(field, normalize)
+    points = np.array(points, dtype=np.float64)
+    n = len(points)
+    if n == 0:
+        return []
+    tolerance = max(tolerance, MIN_TOLERANCE)
+    if length <= 0:
+        return [np.zeros((0, 3)) for i in range(n)]
+    if step is None:
+        step = length / 10.0
+    hs = np.full(n, min(step, length))
+    ts = np.zeros(n)
+    steps_done = np.zeros(n, dtype=int)
+    active = np.ones(n, dtype=bool)
+    ks1, vanishing = velocity(points)
+    active[vanishing] = False
+
+    out_idxs = []
+    out_points = []
+    while active.any():
+        idxs = np.flatnonzero(active)
+        p = points[idxs]
+        h = hs[idxs][:, np.newaxis]
+        ks = [ks1[idxs]]
+        for a in DOPRI_A[1:]:
+            dp = sum(coef * k for coef, k in zip(a, ks) if coef != 0)
+            k, _ = velocity(p + h * dp)
+            ks.append(k)
+        ks = np.array(ks)
+        new_p = p + h * np.einsum('s,sni->ni', DOPRI_B, ks)
+        error = h * np.einsum('s,sni->ni', DOPRI_B - DOPRI_B_LOW, ks)
+        scale = tolerance * (1.0 + np.maximum(abs(p), abs(new_p)))
+        error = np.max(abs(error) / scale, axis=1)
+
+        accepted = error <= 1.0
+        acc_idxs = idxs[accepted]
+        points[acc_idxs] = new_p[accepted]
+        ts[acc_idxs] += hs[acc_idxs]
+        # FSAL: the last stage is the derivative at the new point
+        ks1[acc_idxs] = ks[-1][accepted]
+        steps_done[idxs] += 1
+        out_idxs.append(acc_idxs)
+        out_points.append(new_p[accepted])
+
+        factor = np.clip(0.9 * np.power(np.maximum(error, 1e-10), -0.2), 0.2, 5.0)
+        hs[idxs] = hs[idxs] * factor
+        remaining = length - ts
+        done = remaining <= 1e-9 * length
+        hs = np.minimum(hs, np.maximum(remaining, 0.0))
+
+        # velocity() returns zero vectors where the field vanishes
+        stopped = np.linalg.norm(ks1[acc_idxs], axis=1) == 0.0
+        active[acc_idxs[stopped]] = False
+        active[done] = False
+        active[steps_done >= max_steps] = False
+
+    if out_idxs:
+        all_idxs = np.concatenate(out_idxs)
+        all_points = np.concatenate(out_points)
+    else:
+        all_idxs = np.zeros(0, dtype=int)
+        all_points = np.zeros((0, 3))
+    order = np.argsort(all_idxs, kind='stable')
+    counts = np.bincount(all_idxs, minlength=n)
+    return np.split(all_points[order], np.cumsum(counts)[:-1])
@@ -14,6 +14,8 @@ from mathutils import bvhtree
 
 from sverchok.utils.math import from_cylindrical, from_spherical, to_cylindrical, to_spherical
 from sverchok.utils.geom import LineEquation, CircleEquation3D
+from sverchok.utils.sv_KDT_utils import SvKdTree, get_kdtree
+from sverchok.utils.modules.eval_formula import SvNotVectorizableError
 
 ##################
 #                #
@@ -123,9 +125,13 @@ class SvScalarFieldLambda(SvScalarField):
         else:
             Vs = self.in_field.evaluate_grid(xs, ys, zs)
         if self.function_numpy is not None:
-            return self.function_numpy(xs, ys, zs, Vs)
-        else:
-            return np.vectorize(self.function)(xs, ys, zs, Vs)
+            try:
+                return self.function_numpy(xs, ys, zs, Vs)
+            except SvNotVectorizableError:
+                # evaluate per element this time; this can depend on the
+                # values, so vectorized evaluation is tried again next time
+                pass
+        return np.vectorize(self.function)(xs, ys, zs, Vs)
 
     def evaluate(self, x, y, z):
         if self.in_field is None:
@@ -346,40 +352,34 @@ class SvMergedScalarField(SvScalarField):
         return value
 
 class SvKdtScalarField(SvScalarField):
+    """
+    Distance to nearest of vertices; with falloff provided, the falloff
+    of that distance. If k > 1, the values for k nearest vertices are averaged.
+    """
     __description__ = "KDT"
 
-    def __init__(self, vertices=None, kdt=None, falloff=None):
+    def __init__(self, vertices=None, kdt=None, falloff=None, k=1):
         self.falloff = falloff
-        if kdt is not None:
-            self.kdt = kdt
-        elif vertices is not None:
-            self.kdt = kdtree.KDTree(len(vertices))
-            for i, v in enumerate(vertices):
-                self.kdt.insert(v, i)
-            self.kdt.balance()
+        self.k = k
+        if vertices is not None:
+            self.kdt = get_kdtree(vertices)
+        elif kdt is not None:
+            self.kdt = SvKdTree(kdt=kdt)
         else:
             raise Exception("Either kdt or vertices must be provided")
 
     def evaluate(self, x, y, z):
-        nearest, i, distance = self.kdt.find((x, y, z))
-        if self.falloff is not None:
-            value = self.falloff(np.array([distance]))[0]
-            return value
-        else:
-            return distance
+        return self.evaluate_grid(np.array([x]), np.array([y]), np.array([z]))[0]
 
     def evaluate_grid(self, xs, ys, zs):
-        def find(v):
-            nearest, i, distance = self.kdt.find(v)
-            return distance
-
-        points = np.stack((xs, ys, zs)).T
-        norms = np.vectorize(find, signature='(3)->()')(points)
+        xs, ys, zs = np.asarray(xs), np.asarray(ys), np.asarray(zs)
+        points = np.stack((xs, ys, zs), axis=-1).reshape((-1, 3))
+        nearest, idxs, distances = self.kdt.query(points, self.k)
         if self.falloff is not None:
-            result = self.falloff(norms)
-            return result
+            values = self.falloff(distances)
         else:
-            return norms
+            values = distances
+        return values.mean(axis=1).reshape(xs.shape)
 
 class SvLineAttractorScalarField(SvScalarField):
     __description__ = "Line Attractor"
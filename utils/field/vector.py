@@ -15,6 +15,8 @@ from mathutils import noise
 from sverchok.utils.curve import SvCurveLengthSolver, SvNormalTrack, MathutilsRotationCalculator
 from sverchok.utils.geom import LineEquation, CircleEquation3D
 from sverchok.utils.math import from_cylindrical, from_spherical
+from sverchok.utils.sv_KDT_utils import SvKdTree, get_kdtree
+from sverchok.utils.modules.eval_formula import SvNotVectorizableError
 
 
 ##################
@@ -147,11 +149,15 @@ class SvVectorFieldLambda(SvVectorField):
         else:
             vx, vy, vz = self.in_field.evaluate_grid(xs, ys, zs)
             Vs = np.stack((vx, vy, vz)).T
-        if self.function_numpy is None:
-            return np.vectorize(self.function,
-                        signature = "(),(),(),(3)->(),(),()")(xs, ys, zs, Vs)
-        else:
-            return self.function_numpy(xs, ys, zs, Vs)
+        if self.function_numpy is not None:
+            try:
+                return self.function_numpy(xs, ys, zs, Vs)
+            except SvNotVectorizableError:
+                # evaluate per element this time; this can depend on the
+                # values, so vectorized evaluation is tried again next time
+                pass
+        return np.vectorize(self.function,
+                    signature = "(),(),(),(3)->(),(),()")(xs, ys, zs, Vs)
 
     def evaluate(self, x, y, z):
         if self.in_field is None:
@@ -281,58 +287,42 @@ class SvNoiseVectorField(SvVectorField):
         return np.vectorize(mk_noise, signature="(3)->(),(),()")(vectors)
 
 class SvKdtVectorField(SvVectorField):
+    """
+    Vector to nearest of vertices; with falloff provided, its length is
+    the falloff of distance. If k > 1, the vectors for k nearest vertices are averaged.
+    """
 
-    def __init__(self, vertices=None, kdt=None, falloff=None, negate=False):
+    def __init__(self, vertices=None, kdt=None, falloff=None, negate=False, k=1):
         self.falloff = falloff
         self.negate = negate
-        if kdt is not None:
-            self.kdt = kdt
-        elif vertices is not None:
-            self.kdt = kdtree.KDTree(len(vertices))
-            for i, v in enumerate(vertices):
-                self.kdt.insert(v, i)
-            self.kdt.balance()
+        self.k = k
+        if vertices is not None:
+            self.kdt = get_kdtree(vertices)
+        elif kdt is not None:
+            self.kdt = SvKdTree(kdt=kdt)
         else:
             raise Exception("Either kdt or vertices must be provided")
         self.__description__ = "KDT Attractor"
 
     def evaluate(self, x, y, z):
-        nearest, i, distance = self.kdt.find((x, y, z))
-        vector = np.array(nearest) - np.array([x, y, z])
-        if self.falloff is not None:
-            value = self.falloff(np.array([distance]))[0]
-            if self.negate:
-                value = - value
-            norm = np.linalg.norm(vector)
-            return value * vector / norm
-        else:
-            if self.negate:
-                return - vector
-            else:
-                return vector
+        vx, vy, vz = self.evaluate_grid(np.array([x]), np.array([y]), np.array([z]))
+        return np.array([vx[0], vy[0], vz[0]])
 
     def evaluate_grid(self, xs, ys, zs):
-        def find(v):
-            nearest, i, distance = self.kdt.find(v)
-            dv = np.array(nearest) - np.array(v)
-            if self.negate:
-                return - dv
-            else:
-                return dv
-
-        points = np.stack((xs, ys, zs)).T
-        vectors = np.vectorize(find, signature='(3)->(3)')(points)
+        xs, ys, zs = np.asarray(xs), np.asarray(ys), np.asarray(zs)
+        points = np.stack((xs, ys, zs), axis=-1).reshape((-1, 3))
+        nearest, idxs, distances = self.kdt.query(points, self.k)
+        vectors = nearest - points[:, np.newaxis, :]
+        if self.negate:
+            vectors = - vectors
         if self.falloff is not None:
-            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
-            lens = self.falloff(norms)
-            nonzero = (norms > 0)[:,0]
+            norms = np.linalg.norm(vectors, axis=2, keepdims=True)
             lens = self.falloff(norms)
+            nonzero = (norms > 0)[:,:,0]
             vectors[nonzero] = vectors[nonzero] / norms[nonzero]
-            R = (lens * vectors).T
-            return R[0], R[1], R[2]
-        else:
-            R = vectors.T
-            return R[0], R[1], R[2]
+            vectors = lens * vectors
+        R = vectors.mean(axis=1).T
+        return R[0].reshape(xs.shape), R[1].reshape(xs.shape), R[2].reshape(xs.shape)
 
 class SvVectorFieldPointDistance(SvVectorField):
     def __init__(self, center, metric='EUCLIDEAN', falloff=None):
@@ -0,0 +1,276 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Shared storage for nodes which keep data between updates (e.g. one item
+per frame of animation), such as Cache and Multi Cache nodes.
+
+Entries are identified by owner (usually node_id) and key (frame number,
+bucket index...). All owners share one memory budget; when it is exceeded,
+least recently used entries are evicted. When spilling is enabled, evicted
+entries are written to a temporary directory instead of being dropped, and
+are read back on access: objects which are regular numeric arrays are
+stored as .npy segments of one .npz file, together with the kinds of
+objects which are needed to restore them with the same python types (tuples,
+Vectors, Matrices, integers); anything else is pickled. If an entry can not
+be written, it is kept in memory.
+"""
+
+import os
+import sys
+import shutil
+import pickle
+import tempfile
+from itertools import chain
+from collections import OrderedDict
+
+import numpy as np
+
+from mathutils import Matrix, Vector
+
+from sverchok.utils.logging import debug, exception
+
+DEFAULT_BUDGET = 512 * 1024 * 1024
+
+# objects of longer lists are not inspected one by one to estimate data size
+SIZE_SAMPLES = 32
+
+
+def estimate_size(data):
+    """Approximate number of bytes taken by (nested) socket data"""
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+    if isinstance(data, (list, tuple)):
+        size = sys.getsizeof(data)
+        n = len(data)
+        if n <= SIZE_SAMPLES:
+            return size + sum(estimate_size(item) for item in data)
+        step = n // SIZE_SAMPLES
+        sample = data[::step][:SIZE_SAMPLES]
+        return size + sum(estimate_size(item) for item in sample) * n // len(sample)
+    if isinstance(data, dict):
+        return sys.getsizeof(data) + sum(estimate_size(k) + estimate_size(v) for k, v in data.items())
+    return sys.getsizeof(data)
+
+
+ARRAY, SCALAR, LIST, LIST_OF_TUPLES, LIST_OF_LISTS, LIST_OF_VECTORS, LIST_OF_MATRICES = range(7)
+
+ITEM_KINDS = {tuple: LIST_OF_TUPLES, list: LIST_OF_LISTS, Vector: LIST_OF_VECTORS, Matrix: LIST_OF_MATRICES}
+
+
+def leaves_kind(leaves):
+    """numpy dtype kind which keeps python types of all the numbers, or None"""
+    types = set(map(type, leaves))
+    if types == {bool}:
+        return 'b'
+    if types and all(issubclass(t, int) and t is not bool for t in types):
+        return 'i'
+    if types and all(issubclass(t, float) for t in types):
+        return 'f'
+    return None
+
+
+def object_kind(obj):
+    """
+    Kind of an object of socket data, which tells how to restore it
+    from a numpy array, or None if it can not be stored as an array
+    """
+    if isinstance(obj, np.ndarray):
+        return ARRAY if obj.dtype != object else None
+    if isinstance(obj, (bool, int, float)):
+        return SCALAR
+    if not isinstance(obj, list):
+        return None
+    item_types = set(map(type, obj))
+    if all(issubclass(t, (bool, int, float)) for t in item_types):
+        return LIST
+    if len(item_types) == 1:
+        return ITEM_KINDS.get(item_types.pop())
+    return None
+
+
+OBJECT_NDIMS = {SCALAR: 0, LIST: 1, LIST_OF_TUPLES: 2, LIST_OF_LISTS: 2, LIST_OF_VECTORS: 2, LIST_OF_MATRICES: 3}
+
+def to_segment(obj, kind):
+    """numpy array for a regular numeric object of socket data, or None"""
+    if kind == ARRAY:
+        return obj
+    try:
+        array = np.array(obj)
+    except ValueError:
+        return None
+    if array.dtype.kind not in 'biuf' or array.ndim != OBJECT_NDIMS[kind]:
+        return None
+    if kind in (SCALAR, LIST, LIST_OF_TUPLES, LIST_OF_LISTS) and array.size:
+        # python numbers of the same type, so that integers are not restored as floats
+        if kind == SCALAR:
+            leaves = [obj]
+        elif kind == LIST:
+            leaves = obj
+        else:
+            leaves = chain.from_iterable(obj)
+        if leaves_kind(leaves) != array.dtype.kind:
+            return None
+    return array
+
+
+def restore_object(array, kind):
+    if kind == ARRAY:
+        return array
+    if kind == SCALAR:
+        return array.item()
+    if kind == LIST_OF_TUPLES:
+        return [tuple(item) for item in array.tolist()]
+    if kind == LIST_OF_VECTORS:
+        return [Vector(item) for item in array.tolist()]
+    if kind == LIST_OF_MATRICES:
+        return [Matrix(item) for item in array.tolist()]
+    return array.tolist()
+
+
+def write_entry(path, data):
+    """
+    Write socket data to the file; returns the path actually written,
+    with .npz or .pickle extension depending on what format was used
+    """
+    if isinstance(data, list) and data:
+        kinds = [object_kind(obj) for obj in data]
+        if None not in kinds:
+            segments = [to_segment(obj, kind) for obj, kind in zip(data, kinds)]
+            if all(segment is not None for segment in segments):
+                path = path + '.npz'
+                np.savez(path, kinds=np.array(kinds, dtype=np.int8), **{str(i): s for i, s in enumerate(segments)})
+                return path
+    path = path + '.pickle'
+    with open(path, 'wb') as file:
+        pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def read_entry(path):
+    if path.endswith('.npz'):
+        with np.load(path) as arrays:
+            return [restore_object(arrays[str(i)], kind) for i, kind in enumerate(arrays['kinds'])]
+    with open(path, 'rb') as file:
+        return pickle.load(file)
+
+
+class SvFrameCache:
+    """
+    Memory-bounded key-value storage, see the module description.
+    """
+    def __init__(self, budget=DEFAULT_BUDGET, spill=False):
+        self.budget = budget
+        self.spill = spill
+        self.size = 0
+        # (owner, key) -> (data, size), in order of use
+        self._entries = OrderedDict()
+        # (owner, key) -> file path
+        self._spilled = dict()
+        self._spill_count = 0
+        self._directory = None
+
+    def set_limits(self, budget, spill):
+        self.budget = budget
+        self.spill = spill
+        if not spill:
+            self._clear_spilled()
+        self._evict()
+
+    def put(self, owner, key, data):
+        self._discard(owner, key)
+        size = estimate_size(data)
+        self._entries[(owner, key)] = (data, size)
+        self.size += size
+        self._evict(keep=(owner, key))
+
+    def get(self, owner, key, default=None):
+        entry = self._entries.get((owner, key))
+        if entry is not None:
+            self._entries.move_to_end((owner, key))
+            return entry[0]
+        path = self._spilled.pop((owner, key), None)
+        if path is None:
+            return default
+        try:
+            data = read_entry(path)
+        except Exception as err:
+            exception(err)
+            return default
+        finally:
+            os.remove(path)
+        self.put(owner, key, data)
+        return data
+
+    def __contains__(self, item):
+        return item in self._entries or item in self._spilled
+
+    def keys(self, owner):
+        """Keys of all entries of the owner, both in memory and spilled"""
+        return [key for o, key in self._entries if o == owner] + [key for o, key in self._spilled if o == owner]
+
+    def clear(self, owner=None):
+        """Remove all entries of the owner, or all entries at all"""
+        if owner is None:
+            self._entries.clear()
+            self.size = 0
+            self._clear_spilled()
+            return
+        for item in [item for item in self._entries if item[0] == owner]:
+            self._discard(*item)
+        for item in [item for item in self._spilled if item[0] == owner]:
+            self._discard(*item)
+
+    def _discard(self, owner, key):
+        entry = self._entries.pop((owner, key), None)
+        if entry is not None:
+            self.size -= entry[1]
+        path = self._spilled.pop((owner, key), None)
+        if path is not None and os.path.exists(path):
+            os.remove(path)
+
+    def _evict(self, keep=None):
+        # entries which are kept in memory even when the budget is exceeded
+        kept = set() if keep is None else {keep}
+        while self.size > self.budget and len(kept) < len(self._entries):
+            item, (data, size) = next(iter(self._entries.items()))
+            if item in kept:
+                self._entries.move_to_end(item)
+                continue
+            if self.spill and not self._spill(item, data):
+                kept.add(item)
+                self._entries.move_to_end(item)
+                continue
+            del self._entries[item]
+            self.size -= size
+
+    def _spill(self, item, data):
+        """Write the entry to disk; returns False if it could not be written"""
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix="sverchok_cache_")
+        owner, key = item
+        self._spill_count += 1
+        path = os.path.join(self._directory, str(self._spill_count))
+        try:
+            self._spilled[item] = write_entry(path, data)
+        except Exception as err:
+            exception(err)
+            for extension in ('.npz', '.pickle'):
+                if os.path.exists(path + extension):
+                    os.remove(path + extension)
+            return False
+        debug("Frame cache: spilled %s of %s to disk", key, owner)
+        return True
+
+    def _clear_spilled(self):
+        self._spilled.clear()
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+
+frame_cache = SvFrameCache()
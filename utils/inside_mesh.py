@@ -0,0 +1,350 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Vectorized classification of points as inside / outside of a mesh.
+
+SvMeshInsideTest keeps triangulated mesh in numpy arrays and answers
+queries for whole arrays of points at once:
+
+* cast_rays() - for each point, cast a ray in the given direction and find
+  the nearest hit; this is the same as BVHTree.ray_cast called per point.
+  Broad phase is a uniform 2D grid in the plane perpendicular to the ray
+  direction, narrow phase is vectorized Moller-Trumbore test.
+* nearest() - for each point, find the nearest point on the mesh and the
+  normal of the face it lies on; this is the same as BVHTree.find_nearest
+  called per point. Candidate faces are selected by KD-trees (requires scipy).
+
+Use get_inside_test() to create instances, it caches them, so that the
+acceleration structures are not rebuilt while the mesh does not change.
+"""
+
+from collections import OrderedDict
+from itertools import chain
+
+import numpy as np
+from mathutils import Vector
+from mathutils.geometry import tessellate_polygon
+
+from sverchok.dependencies import scipy
+
+if scipy is not None:
+    from scipy.spatial import cKDTree
+
+def concave_faces(verts, faces):
+    """
+    Mask of faces which are not convex: at some corner such face turns
+    against its normal (found by Newell's method). Triangles are never concave.
+    """
+    totals = np.array([len(face) for face in faces], dtype=np.int64)
+    n_faces = len(totals)
+    if not n_faces or not totals.sum():
+        return np.zeros(n_faces, dtype=bool)
+    loops = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=totals.sum())
+    starts = np.cumsum(totals) - totals
+    used = totals > 0
+    face_of_loop = np.repeat(np.arange(n_faces), totals)
+    next_loop = np.arange(1, len(loops) + 1)
+    next_loop[(starts + totals - 1)[used]] = starts[used]
+    prev_loop = np.arange(-1, len(loops) - 1)
+    prev_loop[starts[used]] = (starts + totals - 1)[used]
+
+    co = verts[loops]
+    co_next = co[next_loop]
+    crosses = np.cross(co, co_next)
+    normals = np.stack([np.bincount(face_of_loop, crosses[:, k], minlength=n_faces) for k in range(3)], axis=1)
+    corners = np.cross(co - co[prev_loop], co_next - co)
+    loop_normals = normals[face_of_loop]
+    turns = np.einsum('ij,ij->i', corners, loop_normals)
+    scale = np.linalg.norm(corners, axis=1) * np.linalg.norm(loop_normals, axis=1)
+    concave_loops = turns < -1e-6 * scale
+    return (np.bincount(face_of_loop, concave_loops, minlength=n_faces) > 0) & (totals > 3)
+
+def triangulate_faces(verts, faces):
+    """
+    Triangulation of faces; returns array of shape (n, 3).
+    Convex faces are triangulated as fans, concave ones by tessellate_polygon,
+    so that triangles cover exactly the same area as the faces.
+    """
+    concave = concave_faces(verts, faces)
+    tris = []
+    for face, is_concave in zip(faces, concave.tolist()):
+        if is_concave:
+            polygon = [[Vector(verts[i]) for i in face]]
+            tris.extend((face[a], face[b], face[c]) for a, b, c in tessellate_polygon(polygon))
+        else:
+            tris.extend((face[0], face[i], face[i+1]) for i in range(1, len(face)-1))
+    return np.array(tris, dtype=np.int64).reshape((-1, 3))
+
+def closest_points_on_triangles(ps, v0, v1, v2):
+    """
+    Closest points on triangles (v0, v1, v2) to points ps; all arguments
+    are arrays of shape (n, 3). Vectorized version of the algorithm from
+    C. Ericson, "Real-Time Collision Detection", 5.1.5.
+    """
+    def dot(a, b):
+        return np.einsum('ij,ij->i', a, b)
+
+    ab = v1 - v0
+    ac = v2 - v0
+    ap = ps - v0
+    d1 = dot(ab, ap)
+    d2 = dot(ac, ap)
+    bp = ps - v1
+    d3 = dot(ab, bp)
+    d4 = dot(ac, bp)
+    cp = ps - v2
+    d5 = dot(ab, cp)
+    d6 = dot(ac, cp)
+    va = d3*d6 - d5*d4
+    vb = d5*d2 - d1*d6
+    vc = d1*d4 - d3*d2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # inside face region
+        denom = va + vb + vc
+        v = vb / denom
+        w = vc / denom
+        result = v0 + ab * v[:, np.newaxis] + ac * w[:, np.newaxis]
+        done = np.zeros(len(ps), dtype=bool)
+
+        def assign(condition, values):
+            nonlocal done
+            condition = condition & ~done
+            result[condition] = values[condition]
+            done |= condition
+
+        # vertex regions
+        assign((d1 <= 0) & (d2 <= 0), v0)
+        assign((d3 >= 0) & (d4 <= d3), v1)
+        assign((d6 >= 0) & (d5 <= d6), v2)
+        # edge regions
+        t = d1 / (d1 - d3)
+        assign((vc <= 0) & (d1 >= 0) & (d3 <= 0), v0 + ab * t[:, np.newaxis])
+        t = d2 / (d2 - d6)
+        assign((vb <= 0) & (d2 >= 0) & (d6 <= 0), v0 + ac * t[:, np.newaxis])
+        t = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        assign((va <= 0) & ((d4 - d3) >= 0) & ((d5 - d6) >= 0), v1 + (v2 - v1) * t[:, np.newaxis])
+        # degenerate triangles
+        assign(~np.isfinite(result).all(axis=1), v0)
+    return result
+
+def _perpendicular_basis(direction):
+    direction = direction / np.linalg.norm(direction)
+    if abs(direction[0]) < 0.9:
+        other = np.array([1.0, 0.0, 0.0])
+    else:
+        other = np.array([0.0, 1.0, 0.0])
+    a = np.cross(direction, other)
+    a /= np.linalg.norm(a)
+    b = np.cross(direction, a)
+    return a, b
+
+def _first_per_group(groups, keys):
+    """
+    Indexes of items with minimal key in each group,
+    and group numbers themselves.
+    """
+    order = np.lexsort((keys, groups))
+    groups_sorted = groups[order]
+    unique, first = np.unique(groups_sorted, return_index=True)
+    return order[first], unique
+
+class SvMeshInsideTest(object):
+    def __init__(self, verts, faces):
+        self.verts = np.asarray(verts, dtype=np.float64)
+        self.tris = triangulate_faces(self.verts, faces)
+        self.v0 = self.verts[self.tris[:, 0]]
+        self.v1 = self.verts[self.tris[:, 1]]
+        self.v2 = self.verts[self.tris[:, 2]]
+        self.e1 = self.v1 - self.v0
+        self.e2 = self.v2 - self.v0
+        self.normals = np.cross(self.e1, self.e2)
+        self._grids = dict()
+        self._nearest_trees = None
+
+    def _get_grid(self, direction):
+        key = tuple(direction)
+        grid = self._grids.get(key)
+        if grid is not None:
+            return grid
+
+        a, b = _perpendicular_basis(direction)
+        corners = np.stack((self.v0, self.v1, self.v2))
+        us, vs = corners @ a, corners @ b
+        tri_min = np.stack((us.min(axis=0), vs.min(axis=0)), axis=1)
+        tri_max = np.stack((us.max(axis=0), vs.max(axis=0)), axis=1)
+        n_tris = len(self.tris)
+        origin = tri_min.min(axis=0)
+        size = np.maximum(tri_max.max(axis=0) - origin, 1e-12)
+        # about one triangle per cell, but cells are not smaller than
+        # the average triangle, so that each triangle covers few cells
+        resolution = max(1, int(np.sqrt(n_tris)))
+        cell_size = np.maximum(size / resolution, (tri_max - tri_min).mean(axis=0))
+        cell_size = np.maximum(cell_size, 1e-12)
+        shape = np.ceil(size / cell_size).astype(np.int64) + 1
+
+        lo = np.floor((tri_min - origin) / cell_size).astype(np.int64)
+        hi = np.floor((tri_max - origin) / cell_size).astype(np.int64)
+        spans = hi - lo + 1
+        counts = spans[:, 0] * spans[:, 1]
+        tri_idxs = np.repeat(np.arange(n_tris), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cx = lo[tri_idxs, 0] + local // spans[tri_idxs, 1]
+        cy = lo[tri_idxs, 1] + local % spans[tri_idxs, 1]
+        cells = cx * shape[1] + cy
+        order = np.argsort(cells, kind='stable')
+
+        grid = (a, b, origin, cell_size, shape, cells[order], tri_idxs[order])
+        self._grids[key] = grid
+        return grid
+
+    def cast_rays(self, points, direction, chunk_size=1000000):
+        """
+        Cast a ray from each point in specified direction.
+        Returns tuple of arrays: whether the ray hit the mesh,
+        distances to nearest hits, and normals (not normalized)
+        of faces hit; for points without hit, distance is inf
+        and normal is zero.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        direction = np.asarray(direction, dtype=np.float64)
+        n = len(points)
+        distances = np.full(n, np.inf)
+        hit_normals = np.zeros((n, 3))
+        if n == 0 or len(self.tris) == 0:
+            return np.zeros(n, dtype=bool), distances, hit_normals
+
+        a, b, origin, cell_size, shape, cells, cell_tris = self._get_grid(direction)
+        uv = np.stack((points @ a, points @ b), axis=1)
+        ij = np.floor((uv - origin) / cell_size).astype(np.int64)
+        valid = np.all((ij >= 0) & (ij < shape), axis=1)
+        point_cells = ij[:, 0] * shape[1] + ij[:, 1]
+        starts = np.searchsorted(cells, point_cells, side='left')
+        ends = np.searchsorted(cells, point_cells, side='right')
+        counts = np.where(valid, ends - starts, 0)
+
+        # h = direction x e2 does not depend on the point
+        hs = np.cross(direction, self.e2)
+        dets = np.einsum('ij,ij->i', self.e1, hs)
+
+        cumulative = np.cumsum(counts)
+        chunk_start = 0
+        while chunk_start < n:
+            done = cumulative[chunk_start] - counts[chunk_start]
+            chunk_end = np.searchsorted(cumulative, done + chunk_size, side='right')
+            chunk_end = min(max(chunk_end, chunk_start + 1), n)
+            chunk_counts = counts[chunk_start : chunk_end]
+            total = chunk_counts.sum()
+            if total > 0:
+                point_idxs = np.repeat(np.arange(chunk_start, chunk_end), chunk_counts)
+                local = np.arange(total) - np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+                tri_idxs = cell_tris[starts[point_idxs] + local]
+                self._ray_triangle(points, direction, point_idxs, tri_idxs, hs, dets, distances, hit_normals)
+            chunk_start = chunk_end
+
+        return np.isfinite(distances), distances, hit_normals
+
+    def _ray_triangle(self, points, direction, point_idxs, tri_idxs, hs, dets, distances, hit_normals):
+        det = dets[tri_idxs]
+        good = np.abs(det) > 1e-12
+        point_idxs, tri_idxs, det = point_idxs[good], tri_idxs[good], det[good]
+        inv_det = 1.0 / det
+        s = points[point_idxs] - self.v0[tri_idxs]
+        u = inv_det * np.einsum('ij,ij->i', s, hs[tri_idxs])
+        q = np.cross(s, self.e1[tri_idxs])
+        v = inv_det * (q @ direction)
+        t = inv_det * np.einsum('ij,ij->i', self.e2[tri_idxs], q)
+        hit = (u >= 0) & (v >= 0) & (u + v <= 1) & (t >= 0)
+        point_idxs, tri_idxs, t = point_idxs[hit], tri_idxs[hit], t[hit]
+        if not len(t):
+            return
+        first, group_points = _first_per_group(point_idxs, t)
+        t, tri_idxs = t[first], tri_idxs[first]
+        closer = t < distances[group_points]
+        group_points = group_points[closer]
+        distances[group_points] = t[closer]
+        hit_normals[group_points] = self.normals[tri_idxs[closer]]
+
+    def nearest(self, points):
+        """
+        For each point, find nearest point on the mesh.
+        Returns tuple of arrays: nearest points and normals (not normalized)
+        of faces they lie on. Requires scipy.
+        """
+        if scipy is None:
+            raise Exception("SciPy is required to search nearest points on mesh")
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        n = len(points)
+        if self._nearest_trees is None:
+            centers = (self.v0 + self.v1 + self.v2) / 3.0
+            radiuses = np.max([np.linalg.norm(v - centers, axis=1) for v in (self.v0, self.v1, self.v2)], axis=0)
+            self._nearest_trees = (cKDTree(self.verts[np.unique(self.tris)]), cKDTree(centers), radiuses.max())
+        verts_tree, centers_tree, max_radius = self._nearest_trees
+
+        # distance to nearest vertex is an upper bound of distance to the mesh;
+        # a face can be nearer only if its center is not farther than this
+        # distance plus the radius of the face
+        upper, _ = verts_tree.query(points)
+        candidates = centers_tree.query_ball_point(points, upper * (1 + 1e-9) + max_radius + 1e-12)
+        counts = np.array([len(c) for c in candidates], dtype=np.int64)
+        point_idxs = np.repeat(np.arange(n), counts)
+        tri_idxs = np.fromiter((i for c in candidates for i in c), dtype=np.int64, count=counts.sum())
+
+        closest = closest_points_on_triangles(points[point_idxs], self.v0[tri_idxs], self.v1[tri_idxs], self.v2[tri_idxs])
+        distances = np.linalg.norm(closest - points[point_idxs], axis=1)
+        # ties are resolved to the face with smallest index
+        order = np.lexsort((tri_idxs, distances, point_idxs))
+        _, first = np.unique(point_idxs[order], return_index=True)
+        first = order[first]
+        return closest[first], self.normals[tri_idxs[first]]
+
+    def inside_by_rays(self, points, directions, threshold=None):
+        """
+        Points are considered to be inside if a ray cast from the point
+        hits a face from its back side. With several directions, a point is
+        inside if at least threshold rays say so.
+        """
+        votes = np.zeros(len(points), dtype=np.int64)
+        for direction in directions:
+            hit, distances, normals = self.cast_rays(points, direction)
+            votes += hit & ~(normals @ np.asarray(direction, dtype=np.float64) < 0.0)
+        if threshold is None:
+            threshold = len(directions)
+        return votes >= threshold
+
+    def inside_by_nearest(self, points):
+        """
+        Points are considered to be inside if they are behind
+        the nearest face.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        closest, normals = self.nearest(points)
+        return ~(np.einsum('ij,ij->i', closest - points, normals) < 0.0)
+
+_cache = OrderedDict()
+_cache_size = 8
+
+def get_inside_test(verts, faces):
+    """
+    Get SvMeshInsideTest for the mesh. Recently used instances are cached,
+    keyed on contents of verts and faces.
+    """
+    verts = np.ascontiguousarray(verts, dtype=np.float64)
+    faces_key = tuple(tuple(face) for face in faces)
+    key = (verts.shape, hash(verts.tobytes()), hash(faces_key))
+    item = _cache.get(key)
+    if item is not None:
+        cached_verts, cached_faces, test = item
+        if np.array_equal(cached_verts, verts) and cached_faces == faces_key:
+            _cache.move_to_end(key)
+            return test
+    test = SvMeshInsideTest(verts, faces)
+    _cache[key] = (verts, faces_key, test)
+    while len(_cache) > _cache_size:
+        _cache.popitem(last=False)
+    return test
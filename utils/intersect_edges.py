@@ -19,6 +19,8 @@
 import itertools
 from collections import defaultdict
 
+import numpy as np
+
 import bmesh
 from mathutils import Vector
 
@@ -54,10 +56,76 @@ def remove_permutations_that_share_a_vertex(cm, bm, permutations):
 
     return final_permutations
 
-def get_valid_permutations(cm, bm, edge_indices):
-    raw_permutations = itertools.permutations(edge_indices, 2)
-    permutations = [r for r in raw_permutations if r[0] < r[1]]
-    return remove_permutations_that_share_a_vertex(cm, bm, permutations)
+def bbox_overlapping_pairs(mins, maxs, tolerance=0.0, chunk_size=1000000):
+    '''
+    Broad phase of edges intersection: find all pairs of axis-aligned
+    bounding boxes that overlap (touching boxes are considered overlapping).
+    Sweep and prune along the axis of largest extent, then check other axes.
+
+    > mins, maxs:   arrays of shape (n, dim) - bounding box corners
+    > tolerance:    boxes are extended by this value in each direction
+    < returns array of shape (m, 2) of index pairs (i, j), i < j,
+      sorted lexicographically.
+    '''
+    mins = np.asarray(mins, dtype=np.float64) - tolerance
+    maxs = np.asarray(maxs, dtype=np.float64) + tolerance
+    n = len(mins)
+    if n < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    axis = np.argmax(maxs.max(axis=0) - mins.min(axis=0))
+    order = np.argsort(mins[:, axis], kind='stable')
+    sorted_mins = mins[order, axis]
+    # for each box, candidates are the boxes that start after it
+    # but not later than it ends
+    ends = np.searchsorted(sorted_mins, maxs[order, axis], side='right')
+    counts = np.maximum(ends - np.arange(n) - 1, 0)
+    cumulative = np.cumsum(counts)
+
+    # candidate pairs are checked in chunks, not to allocate
+    # too much memory when there are a lot of them
+    result = []
+    chunk_start = 0
+    while chunk_start < n:
+        done = cumulative[chunk_start] - counts[chunk_start]
+        chunk_end = np.searchsorted(cumulative, done + chunk_size, side='right')
+        chunk_end = min(max(chunk_end, chunk_start + 1), n)
+        chunk_counts = counts[chunk_start : chunk_end]
+        total = chunk_counts.sum()
+        if total > 0:
+            first = np.repeat(np.arange(chunk_start, chunk_end), chunk_counts)
+            offsets = np.arange(total) - np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+            second = order[first + 1 + offsets]
+            first = order[first]
+            good = np.all((mins[first] <= maxs[second]) & (mins[second] <= maxs[first]), axis=1)
+            result.append(np.stack((first[good], second[good]), axis=1))
+        chunk_start = chunk_end
+
+    if not result:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.sort(np.concatenate(result), axis=1)
+    pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+    return pairs
+
+def get_valid_permutations(cm, bm, edge_indices, broad_phase=True):
+    if not broad_phase:
+        raw_permutations = itertools.permutations(edge_indices, 2)
+        permutations = [r for r in raw_permutations if r[0] < r[1]]
+        return remove_permutations_that_share_a_vertex(cm, bm, permutations)
+
+    edge_indices = np.array(sorted(edge_indices), dtype=np.int64)
+    if len(edge_indices) < 2:
+        return []
+    vert_indices = np.array([cm.vert_idxs_from_edge_idx(bm, idx) for idx in edge_indices], dtype=np.int64)
+    verts = np.array([v.co[:] for v in bm.verts], dtype=np.float64)
+    edge_verts = verts[vert_indices]
+    pairs = bbox_overlapping_pairs(edge_verts.min(axis=1), edge_verts.max(axis=1))
+
+    # Edges that share a vertex are not intersected
+    v1, v2 = vert_indices[pairs[:, 0]], vert_indices[pairs[:, 1]]
+    share = (v1[:, :1] == v2).any(axis=1) | (v1[:, 1:] == v2).any(axis=1) | (v1[:, 0] == v1[:, 1]) | (v2[:, 0] == v2[:, 1])
+    pairs = edge_indices[pairs[~share]]
+    return [(int(i), int(j)) for i, j in pairs]
 
 def can_skip(cm, closest_points, vert_vectors):
     '''this checks if the intersection lies on both edges, returns True
@@ -73,12 +141,15 @@ def can_skip(cm, closest_points, vert_vectors):
     cpa, cpb = closest_points
     return (cpa-cpb).length > cm.VTX_PRECISION
 
-def get_intersection_dictionary(cm, bm, edge_indices):
+def get_intersection_dictionary(cm, bm, edge_indices, broad_phase=True):
 
     bm.verts.ensure_lookup_table()
     bm.edges.ensure_lookup_table()
 
-    permutations = get_valid_permutations(cm, bm, edge_indices)
+    # Only pairs of edges with overlapping bounding boxes are returned
+    # (unless broad_phase is disabled), because edges obviously
+    # can not intersect if their bounding boxes do not intersect
+    permutations = get_valid_permutations(cm, bm, edge_indices, broad_phase)
 
     k = defaultdict(list)
     d = defaultdict(list)
@@ -87,16 +158,15 @@ def get_intersection_dictionary(cm, bm, edge_indices):
         vert_vectors = cm.vectors_from_edges_tuple(bm, edges)
         v1, v2, v3, v4 = vert_vectors
 
-        # Edges obviously can not intersect if their bounding
-        # boxes do not intersect
-        if (max(v1.x, v2.x) < min(v3.x, v4.x) or
-            max(v1.y, v2.y) < min(v3.y, v4.y) or
-            max(v1.z, v2.z) < min(v3.z, v4.z)):
-                continue
-        if (max(v3.x, v4.x) < min(v1.x, v2.x) or
-            max(v3.y, v4.y) < min(v1.y, v2.y) or
-            max(v3.z, v4.z) < min(v1.z, v2.z)):
-                continue
+        if not broad_phase:
+            if (max(v1.x, v2.x) < min(v3.x, v4.x) or
+                max(v1.y, v2.y) < min(v3.y, v4.y) or
+                max(v1.z, v2.z) < min(v3.z, v4.z)):
+                    continue
+            if (max(v3.x, v4.x) < min(v1.x, v2.x) or
+                max(v3.y, v4.y) < min(v1.y, v2.y) or
+                max(v3.z, v4.z) < min(v1.z, v2.z)):
+                    continue
 
         # Edges can not intersect if they do not lie in
         # the same plane
@@ -144,7 +214,7 @@ def unselect_nonintersecting(bm, d_edges, edge_indices):
             bm.edges[edge].select = False
         # print("unselected {}, non intersecting edges".format(reserved_edges))
 
-def bmesh_intersect_edges_3d(bm, s_epsilon):
+def bmesh_intersect_edges_3d(bm, s_epsilon, broad_phase=True):
     edge_indices = [e.index for e in bm.edges]
     trim_indices = len(edge_indices)
     for edge in bm.edges:
@@ -152,7 +222,7 @@ def bmesh_intersect_edges_3d(bm, s_epsilon):
 
     cm = CAD_ops(epsilon=s_epsilon)
 
-    d = get_intersection_dictionary(cm, bm, edge_indices)
+    d = get_intersection_dictionary(cm, bm, edge_indices, broad_phase)
     unselect_nonintersecting(bm, d.keys(), edge_indices)
 
     # store non_intersecting edge sequencer
@@ -161,12 +231,12 @@ def bmesh_intersect_edges_3d(bm, s_epsilon):
     update_mesh(bm, d)
     return add_back
 
-def intersect_edges_3d(verts_in, edges_in, s_epsilon):
+def intersect_edges_3d(verts_in, edges_in, s_epsilon, broad_phase=True):
     bm = bmesh_from_pydata(verts_in, edges_in, [])
 
     trim_indices = len(bm.edges[:])
 
-    add_back = bmesh_intersect_edges_3d(bm, s_epsilon)
+    add_back = bmesh_intersect_edges_3d(bm, s_epsilon, broad_phase)
 
     verts_out = [v.co.to_tuple() for v in bm.verts]
     edges_out = [[j.index for j in i.verts] for i in bm.edges]
@@ -179,18 +249,53 @@ def intersect_edges_3d(verts_in, edges_in, s_epsilon):
 def edges_from_ed_inter(ed_inter):
     '''create edges from intersections library'''
     edges_out = []
+    added = set()
     for e in ed_inter:
         # sort by first element of tuple (distances)
         e_s = sorted(e)
         e_s = [e for i,e in enumerate(e_s) if e[1]!= e_s[i-1][1]] 
         for i in range(1, len(e_s)):
             # if e_s[i-1][1] != e_s[i][1]:
-            if(e_s[i-1][1], e_s[i][1])not in edges_out:
-                edges_out.append((e_s[i-1][1], e_s[i][1]))
+            edge = (e_s[i-1][1], e_s[i][1])
+            if edge not in added:
+                added.add(edge)
+                edges_out.append(edge)
     return edges_out
 
-def intersect_edges_2d(verts, edges, epsilon):
-    '''Iterate through edges  and expose them to intersect_line_line_2d'''
+def get_candidate_pairs_2d(verts, edges, ed_lengths, epsilon, broad_phase=True):
+    '''
+    Pairs of edge indices (i, j), j < i, which are to be checked for
+    intersection, in the order of (i, j). Degenerate edges and edges that
+    share a vertex are excluded.
+    '''
+    n = len(edges)
+    if not broad_phase:
+        return [(i, j) for i in range(n) for j in range(i)
+                if ed_lengths[i] != 0 and ed_lengths[j] != 0
+                and edges[j][0] not in edges[i] and edges[j][1] not in edges[i]]
+
+    if n < 2:
+        return []
+    edges_np = np.array([e[:2] for e in edges], dtype=np.int64)
+    verts_np = np.array([v[:2] for v in verts], dtype=np.float64)
+    edge_verts = verts_np[edges_np]
+    # mathutils calculates in single precision, so boxes are slightly
+    # extended not to lose intersections found at the boundaries
+    tolerance = max(epsilon, 1e-6 * max(1.0, np.abs(edge_verts).max()))
+    pairs = bbox_overlapping_pairs(edge_verts.min(axis=1), edge_verts.max(axis=1), tolerance)
+    # bbox_overlapping_pairs returns pairs with first < second; here we need i > j.
+    j, i = pairs[:, 0], pairs[:, 1]
+    lengths = np.array(ed_lengths)
+    e_i, e_j = edges_np[i], edges_np[j]
+    good = (lengths[i] != 0) & (lengths[j] != 0)
+    good &= ~((e_j[:, :1] == e_i).any(axis=1) | (e_j[:, 1:] == e_i).any(axis=1))
+    i, j = i[good], j[good]
+    order = np.lexsort((j, i))
+    return list(zip(i[order].tolist(), j[order].tolist()))
+
+def intersect_edges_2d(verts, edges, epsilon, broad_phase=True):
+    '''Iterate through pairs of edges which can intersect and expose them to intersect_line_line_2d.
+    If broad_phase is False, all pairs of edges are checked (slow).'''
     verts_in = [Vector(v) for v in verts]
     ed_lengths = [(verts_in[e[1]] - verts_in[e[0]]).length for e in edges]
     verts_out = verts
@@ -200,44 +305,45 @@ def intersect_edges_2d(verts, edges, epsilon):
         # if there is no intersections this will create a normal edge
         ed_inter[i].append([0.0, e[0]])
         ed_inter[i].append([d, e[1]])
-        v1 = verts_in[e[0]]
-        v2 = verts_in[e[1]]
-        if d == 0:
-            continue
 
-        for e2, d2, j in zip(edges, ed_lengths, range(len(edges))):
-
-            if i <= j or d2 == 0:
-                continue
-            if (e2[0] in e) or (e2[1] in e):
-                continue
-
-            v3 = verts_in[e2[0]]
-            v4 = verts_in[e2[1]]
-            vx = intersect_line_line_2d(v1, v2, v3, v4)
-            if vx:
-                d_to_1 = (vx - v1.to_2d()).length
-                d_to_2 = (vx - v3.to_2d()).length
-
-                new_id = len(verts_out)
-                if ((vx.x, vx.y, v1.z)) in verts_out:
-                    new_id = verts_out.index((vx.x, vx.y, v1.z))
-                else:
-                    if d_to_1 < epsilon:
-                        new_id = e[0]
-                    elif d_to_1 > d - epsilon:
-                        new_id = e[1]
-                    elif d_to_2 < epsilon:
-                        new_id = e2[0]
-                    elif d_to_2 > d2 - epsilon:
-                        new_id = e2[1]
-                    if new_id == len(verts_out):
-                        verts_out.append((vx.x, vx.y, v1.z))
-                
-                # first item stores distance to origin, second the vertex id
-                ed_inter[i].append([d_to_1, new_id])
-                ed_inter[j].append([d_to_2, new_id])
+    # index of first occurrence of each vertex, to not add duplicates
+    vert_index = dict()
+    for idx in reversed(range(len(verts_out))):
+        if isinstance(verts_out[idx], tuple):
+            vert_index[verts_out[idx]] = idx
 
+    for i, j in get_candidate_pairs_2d(verts, edges, ed_lengths, epsilon, broad_phase):
+        e, d = edges[i], ed_lengths[i]
+        e2, d2 = edges[j], ed_lengths[j]
+        v1 = verts_in[e[0]]
+        v2 = verts_in[e[1]]
+        v3 = verts_in[e2[0]]
+        v4 = verts_in[e2[1]]
+        vx = intersect_line_line_2d(v1, v2, v3, v4)
+        if vx:
+            d_to_1 = (vx - v1.to_2d()).length
+            d_to_2 = (vx - v3.to_2d()).length
+
+            new_id = len(verts_out)
+            new_vert = (vx.x, vx.y, v1.z)
+            if new_vert in vert_index:
+                new_id = vert_index[new_vert]
+            else:
+                if d_to_1 < epsilon:
+                    new_id = e[0]
+                elif d_to_1 > d - epsilon:
+                    new_id = e[1]
+                elif d_to_2 < epsilon:
+                    new_id = e2[0]
+                elif d_to_2 > d2 - epsilon:
+                    new_id = e2[1]
+                if new_id == len(verts_out):
+                    verts_out.append(new_vert)
+                    vert_index[new_vert] = new_id
+
+            # first item stores distance to origin, second the vertex id
+            ed_inter[i].append([d_to_1, new_id])
+            ed_inter[j].append([d_to_2, new_id])
 
     edges_out = edges_from_ed_inter(ed_inter)
 
@@ -7,10 +7,11 @@ from mathutils.bvhtree import BVHTree
 from sverchok.utils.curve import SvCurve, SvIsoUvCurve
 from sverchok.utils.logging import debug, info
 from sverchok.utils.geom import PlaneEquation, LineEquation
+from sverchok.utils.sv_KDT_utils import SvKdTree
 from sverchok.dependencies import scipy
 
 if scipy is not None:
-    from scipy.optimize import root_scalar, root
+    from scipy.optimize import root_scalar, root, minimize_scalar, minimize
 
 SKIP = 'skip'
 FAIL = 'fail'
@@ -134,6 +135,324 @@ def ortho_project_surface(src_point, surface, init_samples=10, maxiter=30, toler
 
     return u, v, point
 
+def _init_guess_kdt(samples, src_points):
+    kdt = SvKdTree(samples)
+    nearest, idxs, distances = kdt.query(src_points, k=1)
+    return idxs[:,0], nearest[:,0], distances[:,0]
+
+def nearest_point_on_curve(src_points, curve, samples=50, precise=True, method='Brent', maxiter=30, tolerance=1e-6):
+    """
+    Find nearest points on the curve for several source points at once.
+    inputs:
+    * src_points: list or np.array of shape (n, 3)
+    * curve: SvCurve
+    * samples: number of curve samples used for initial guess
+    * precise: if False, just return the nearest of samples
+    * method: scipy's minimize_scalar method, used for points for which
+      Newton iterations do not converge.
+    outputs: tuple (ts, points), np.arrays of shapes (n,) and (n, 3).
+
+    Initial guesses are found by KD-tree built from curve samples; they
+    are refined by simultaneous Newton iterations for all points.
+    dependencies: scipy (only for points where Newton method fails)
+    """
+    src_points = np.asarray(src_points, dtype=np.float64).reshape((-1, 3))
+    t_min, t_max = curve.get_u_bounds()
+    init_ts = np.linspace(t_min, t_max, num=samples)
+    init_points = curve.evaluate_array(init_ts)
+
+    idxs, nearest, init_distances = _init_guess_kdt(init_points, src_points)
+    ts = init_ts[idxs]
+    if not precise or not len(ts):
+        return ts, nearest
+
+    delta_t = (t_max - t_min) / samples
+    tolerance_t = tolerance * (t_max - t_min)
+    # distances are compared with tolerance relative to the size of the curve
+    tolerance_distance = tolerance * np.linalg.norm(np.ptp(init_points, axis=0))
+    converged = np.zeros(len(ts), dtype=bool)
+    active = np.arange(len(ts))
+    for i in range(maxiter):
+        t = ts[active]
+        first, second = curve.derivatives_array(2, t)
+        dv = curve.evaluate_array(t) - src_points[active]
+        # Minimize |C(t) - P|^2: solve (C(t) - P) . C'(t) = 0
+        f = (dv * first).sum(axis=1)
+        gauss_newton = (first * first).sum(axis=1)
+        newton = gauss_newton + (dv * second).sum(axis=1)
+        df = np.where(newton > 0, newton, gauss_newton)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = np.clip(- f / df, -delta_t, delta_t)
+        new_t = np.clip(t + step, t_min, t_max)
+        ts[active] = new_t
+        finite = np.isfinite(new_t)
+        done = finite & (abs(new_t - t) < tolerance_t)
+        converged[active[done]] = True
+        active = active[finite & ~done]
+        if not len(active):
+            break
+
+    # Newton method could leave the initial point towards another local
+    # minimum, which is farther than initial one
+    points = curve.evaluate_array(np.where(converged, ts, t_min))
+    distances = np.linalg.norm(points - src_points, axis=1)
+    converged &= distances <= init_distances + tolerance_distance
+    failed = np.where(~converged)[0]
+    if len(failed):
+        if scipy is None:
+            raise Exception("Can't find nearest points for {}".format(src_points[failed]))
+        for i in failed:
+            ts[i] = _nearest_t_scipy(curve, src_points[i], init_ts[idxs[i]], delta_t, method)
+        points[failed] = curve.evaluate_array(ts[failed])
+    return ts, points
+
+def _nearest_t_scipy(curve, src_point, init_t, delta_t, method):
+    def goal(t):
+        dv = curve.evaluate(t) - src_point
+        return np.linalg.norm(dv)
+
+    t_min, t_max = curve.get_u_bounds()
+    if init_t <= t_min:
+        if init_t - delta_t >= t_min:
+            bracket = (init_t - delta_t, init_t, t_max)
+        else:
+            bracket = None # (t_min, t_min + delta_t, t_min + 2*delta_t)
+    elif init_t >= t_max:
+        if init_t + delta_t <= t_max:
+            bracket = (t_min, init_t, init_t + delta_t)
+        else:
+            bracket = None # (t_max - 2*delta_t, t_max - delta_t, t_max)
+    else:
+        bracket = (t_min, init_t, t_max)
+    result = minimize_scalar(goal,
+                bounds = (t_min, t_max),
+                bracket = bracket,
+                method = method
+            )
+    if not result.success:
+        if hasattr(result, 'message'):
+            message = result.message
+        else:
+            message = repr(result)
+        raise Exception("Can't find the nearest point for {}: {}".format(src_point, message))
+    return min(max(result.x, t_min), t_max)
+
+def nearest_point_on_surface(src_points, surface, samples=10, precise=True, method='L-BFGS-B', maxiter=50, tolerance=1e-6):
+    """
+    Find nearest points on the surface for several source points at once.
+    inputs:
+    * src_points: list or np.array of shape (n, 3)
+    * surface: SvSurface
+    * samples: number of surface samples along each of U, V directions used for initial guess
+    * precise: if False, just return the nearest of samples
+    * method: scipy's minimize method, used for points for which
+      Newton iterations do not converge.
+    outputs: tuple (us, vs, points), np.arrays of shapes (n,), (n,) and (n, 3).
+
+    Initial guesses are found by KD-tree built from surface samples; they
+    are refined by simultaneous Newton iterations for all points.
+    dependencies: scipy (only for points where Newton method fails)
+    """
+    src_points = np.asarray(src_points, dtype=np.float64).reshape((-1, 3))
+    u_min, u_max = surface.get_u_min(), surface.get_u_max()
+    v_min, v_max = surface.get_v_min(), surface.get_v_max()
+    init_us = np.linspace(u_min, u_max, num=samples)
+    init_vs = np.linspace(v_min, v_max, num=samples)
+    init_us, init_vs = np.meshgrid(init_us, init_vs)
+    init_us = init_us.flatten()
+    init_vs = init_vs.flatten()
+    init_points = surface.evaluate_array(init_us, init_vs)
+
+    idxs, nearest, init_distances = _init_guess_kdt(init_points, src_points)
+    us, vs = init_us[idxs], init_vs[idxs]
+    if not precise or not len(us):
+        return us, vs, nearest
+
+    delta_u = (u_max - u_min) / samples
+    delta_v = (v_max - v_min) / samples
+    if hasattr(surface, 'normal_delta'):
+        h = surface.normal_delta
+    else:
+        h = 0.0001
+    tolerance_u = tolerance * (u_max - u_min)
+    tolerance_v = tolerance * (v_max - v_min)
+    # distances are compared with tolerance relative to the size of the surface
+    tolerance_distance = tolerance * np.linalg.norm(np.ptp(init_points, axis=0))
+    converged = np.zeros(len(us), dtype=bool)
+    active = np.arange(len(us))
+    for i in range(maxiter):
+        u, v = us[active], vs[active]
+        data = surface.derivatives_data_array(u, v)
+        dv = data.points - src_points[active]
+        # Newton step for minimization of |S(u,v) - P|^2:
+        # solve H step = - J^T dv, where J = [du dv], and H = J^T J plus
+        # second derivatives terms; second derivatives are calculated
+        # from first ones numerically (by backward differences near the
+        # upper bounds of the domain). Where H is not positive definite,
+        # it is replaced by J^T J (Gauss-Newton step).
+        h_u = np.where(u + h > u_max, -h, h)
+        h_v = np.where(v + h > v_max, -h, h)
+        data_u = surface.derivatives_data_array(u + h_u, v)
+        data_v = surface.derivatives_data_array(u, v + h_v)
+        a = (data.du * data.du).sum(axis=1)
+        b = (data.du * data.dv).sum(axis=1)
+        c = (data.dv * data.dv).sum(axis=1)
+        h_uu = a + (dv * (data_u.du - data.du)).sum(axis=1) / h_u
+        h_uv = b + (dv * (data_u.dv - data.dv)).sum(axis=1) / h_u
+        h_vv = c + (dv * (data_v.dv - data.dv)).sum(axis=1) / h_v
+        positive = (h_uu > 0) & (h_uu*h_vv - h_uv*h_uv > 0)
+        a = np.where(positive, h_uu, a)
+        b = np.where(positive, h_uv, b)
+        c = np.where(positive, h_vv, c)
+        f_u = (data.du * dv).sum(axis=1)
+        f_v = (data.dv * dv).sum(axis=1)
+        det = a*c - b*b
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step_u = np.clip(- (c*f_u - b*f_v) / det, -delta_u, delta_u)
+            step_v = np.clip(- (a*f_v - b*f_u) / det, -delta_v, delta_v)
+            # on the boundary of surface domain, move along the boundary
+            u_fixed = ((u <= u_min) & (step_u < 0)) | ((u >= u_max) & (step_u > 0))
+            v_fixed = ((v <= v_min) & (step_v < 0)) | ((v >= v_max) & (step_v > 0))
+            step_u = np.where(v_fixed & ~u_fixed, np.clip(- f_u / a, -delta_u, delta_u), step_u)
+            step_v = np.where(u_fixed & ~v_fixed, np.clip(- f_v / c, -delta_v, delta_v), step_v)
+        new_u = np.clip(u + step_u, u_min, u_max)
+        new_v = np.clip(v + step_v, v_min, v_max)
+        us[active] = new_u
+        vs[active] = new_v
+        finite = np.isfinite(new_u) & np.isfinite(new_v)
+        done = finite & (abs(new_u - u) < tolerance_u) & (abs(new_v - v) < tolerance_v)
+        converged[active[done]] = True
+        active = active[finite & ~done]
+        if not len(active):
+            break
+
+    points = surface.evaluate_array(np.where(converged, us, u_min), np.where(converged, vs, v_min))
+    distances = np.linalg.norm(points - src_points, axis=1)
+    converged &= distances <= init_distances + tolerance_distance
+    failed = np.where(~converged)[0]
+    if len(failed):
+        if scipy is None:
+            raise Exception("Can't find nearest points for {}".format(src_points[failed]))
+        for i in failed:
+            us[i], vs[i] = _nearest_uv_scipy(surface, src_points[i], init_us[idxs[i]], init_vs[idxs[i]], method)
+        points[failed] = surface.evaluate_array(us[failed], vs[failed])
+    return us, vs, points
+
+def _nearest_uv_scipy(surface, src_point, init_u, init_v, method):
+    def goal(p):
+        dv = surface.evaluate(p[0], p[1]) - src_point
+        return np.linalg.norm(dv)
+
+    u_min, u_max = surface.get_u_min(), surface.get_u_max()
+    v_min, v_max = surface.get_v_min(), surface.get_v_max()
+    result = minimize(goal,
+                x0 = np.array([init_u, init_v]),
+                bounds = [(u_min, u_max), (v_min, v_max)],
+                method = method
+            )
+    if not result.success:
+        raise Exception("Can't find the nearest point for {}: {}".format(src_point, result.message))
+    return result.x
+
+def raycast_implicit_surface(field, src_points, directions, iso_values, max_distances, samples=50, tolerance=1e-9, maxiter=50):
+    """
+    Raycast onto implicit surface defined by field == iso_value,
+    for several rays at once.
+    inputs:
+    * field: SvScalarField
+    * src_points, directions: np.arrays of shape (n, 3); directions must be normalized
+    * iso_values, max_distances: np.arrays of shape (n,)
+    * samples: number of steps of marching along rays
+    * tolerance: target tolerance for distance along the ray
+    outputs: tuple (distances, points), np.arrays of shapes (n,) and (n, 3).
+
+    All rays are marched simultaneously with uniform steps (and also
+    checked at max_distance / 2^k), until the field jumps over iso_value;
+    then the root is refined within found ranges by vectorized Illinois
+    (modified regula falsi) method.
+    """
+    src_points = np.asarray(src_points, dtype=np.float64).reshape((-1, 3))
+    directions = np.asarray(directions, dtype=np.float64).reshape((-1, 3))
+    iso_values = np.asarray(iso_values, dtype=np.float64)
+    max_distances = np.asarray(max_distances, dtype=np.float64)
+    n = len(src_points)
+
+    def goal(idxs, ts):
+        ps = src_points[idxs] + ts[:, np.newaxis] * directions[idxs]
+        values = field.evaluate_grid(ps[:,0], ps[:,1], ps[:,2])
+        return np.asarray(values, dtype=np.float64).reshape(-1) - iso_values[idxs]
+
+    all_idxs = np.arange(n)
+    init_values = goal(all_idxs, np.zeros(n))
+
+    # relative positions along rays, where the field is checked
+    steps = np.concatenate((np.linspace(0.0, 1.0, num=samples+1)[1:], 0.5 ** np.arange(1, 10)))
+    steps = np.unique(steps)
+
+    t_lo = np.zeros(n)
+    t_hi = np.zeros(n)
+    f_lo = init_values.copy()
+    f_hi = init_values.copy()
+    found = init_values == 0
+    active = all_idxs[~found]
+    for step in steps:
+        if not len(active):
+            break
+        ts = step * max_distances[active]
+        values = goal(active, ts)
+        jump = values * f_lo[active] <= 0
+        jumped = active[jump]
+        t_hi[jumped] = ts[jump]
+        f_hi[jumped] = values[jump]
+        found[jumped] = True
+        not_jumped = active[~jump]
+        t_lo[not_jumped] = ts[~jump]
+        f_lo[not_jumped] = values[~jump]
+        active = not_jumped
+
+    if not found.all():
+        i = np.where(~found)[0][0]
+        raise Exception(f"Can not find range where the field jumps over iso_value: init value at {src_points[i]} = {init_values[i] + iso_values[i]}")
+
+    result = t_hi.copy()
+    tolerance = tolerance * np.maximum(max_distances, 1.0)
+    active = all_idxs[(f_hi != 0) & (t_hi > 0)]
+    # side which was kept at the previous iteration, for Illinois modification
+    prev_side = np.zeros(n, dtype=np.int64)
+    for i in range(maxiter):
+        if not len(active):
+            break
+        a, b = t_lo[active], t_hi[active]
+        fa, fb = f_lo[active], f_hi[active]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ts = (a*fb - b*fa) / (fb - fa)
+        bad = ~np.isfinite(ts) | (ts <= np.minimum(a, b)) | (ts >= np.maximum(a, b))
+        ts = np.where(bad, (a + b) / 2.0, ts)
+        values = goal(active, ts)
+        result[active] = ts
+
+        # keep the bracket around the root
+        replace_hi = values * fa <= 0
+        hi_idxs = active[replace_hi]
+        lo_idxs = active[~replace_hi]
+        t_hi[hi_idxs] = ts[replace_hi]
+        f_hi[hi_idxs] = values[replace_hi]
+        t_lo[lo_idxs] = ts[~replace_hi]
+        f_lo[lo_idxs] = values[~replace_hi]
+        # if the same end of the bracket is kept twice, halve its value
+        stale_lo = hi_idxs[prev_side[hi_idxs] == 1]
+        f_lo[stale_lo] /= 2.0
+        stale_hi = lo_idxs[prev_side[lo_idxs] == -1]
+        f_hi[stale_hi] /= 2.0
+        prev_side[hi_idxs] = 1
+        prev_side[lo_idxs] = -1
+
+        done = (values == 0) | (abs(t_hi[active] - t_lo[active]) < tolerance[active])
+        active = active[~done]
+
+    points = src_points + result[:, np.newaxis] * directions
+    return result, points
+
 class RaycastResult(object):
     def __init__(self):
         self.init_us = None
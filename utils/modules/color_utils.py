@@ -92,7 +92,6 @@ def rgb_to_hsv(rgb_col):
     max_comp = np.amax(rgb_col[:,:3], axis=1)
     min_comp = np.amin(rgb_col[:,:3], axis=1)
     delta = max_comp - min_comp
-    hsv_col[delta == 0, 0] = 0
     mask1 = max_comp == rgb_col[:, 0]
     mask2 = rgb_col[:, 1] >= rgb_col[:, 2]
     mask3 = rgb_col[:, 1] < rgb_col[:, 2]
@@ -104,6 +103,7 @@ def rgb_to_hsv(rgb_col):
     hsv_col[mask_g2, 0] = (rgb_col[mask_g2, 1] - rgb_col[mask_g2, 2])/(delta[mask_g2] * 6) + 1
     hsv_col[mask_g3, 0] = (rgb_col[mask_g3, 2] - rgb_col[mask_g3, 0])/(delta[mask_g3] * 6) + 1/3
     hsv_col[mask_g4, 0] = (rgb_col[mask_g4, 0] - rgb_col[mask_g4, 1])/(delta[mask_g4] * 6) + 2/3
+    hsv_col[delta == 0, 0] = 0
 
     mask_s = max_comp == 0
     mask_other = np.invert(mask_s)
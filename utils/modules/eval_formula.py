@@ -17,10 +17,20 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import ast
+from functools import lru_cache
 
-from sverchok.utils.script_importhelper import safe_names
+import numpy as np
+
+from sverchok.utils.script_importhelper import safe_names, safe_names_np
 from sverchok.utils import logging
 
+class SvNotVectorizableError(Exception):
+    """
+    Raised by safe_eval_vectorized() when the expression can not be
+    evaluated over whole arrays at once.
+    """
+    pass
+
 class VariableCollector(ast.NodeVisitor):
     """
     Visitor class to collect free variable names from the expression.
@@ -98,6 +108,13 @@ class VariableCollector(ast.NodeVisitor):
 
         self.generic_visit(node)
 
+@lru_cache(maxsize=1024)
+def _get_variables(string):
+    root = ast.parse(string, mode='eval')
+    visitor = VariableCollector()
+    visitor.visit(root)
+    return frozenset(visitor.variables.difference(safe_names.keys()))
+
 def get_variables(string):
     """
     Get set of free variables used by formula
@@ -105,16 +122,21 @@ def get_variables(string):
     string = string.strip()
     if not len(string):
         return set()
+    return set(_get_variables(string))
+
+@lru_cache(maxsize=1024)
+def _compile(string):
     root = ast.parse(string, mode='eval')
-    visitor = VariableCollector()
-    visitor.visit(root)
-    result = visitor.variables
-    return result.difference(safe_names.keys())
+    return compile(root, "<expression>", 'eval')
 
 def sv_compile(string):
+    """
+    Compile the expression. Compiled code objects are cached, so
+    compiling the same formula again (for each element, or on each
+    update of the tree) does not parse it again.
+    """
     try:
-        root = ast.parse(string, mode='eval')
-        return compile(root, "<expression>", 'eval')
+        return _compile(string)
     except SyntaxError as e:
         logging.exception(e)
         raise Exception("Invalid expression syntax: " + str(e))
@@ -136,20 +158,49 @@ def safe_eval_compiled(compiled, variables, allowed_names = None):
         logging.exception(e)
         raise Exception("Invalid expression syntax: " + str(e))
 
+def safe_eval_vectorized(compiled, variables, like, allowed_names = None):
+    """
+    Evaluate expression once over whole numpy arrays of variable values.
+    Numpy versions of "safe" functions are used.
+
+    like: numpy array of expected result shape, or the shape itself.
+    Constant results are expanded to this shape.
+
+    Raises SvNotVectorizableError if the expression can not be evaluated
+    this way (for example, it contains conditional expressions, or
+    returns lists); the caller should evaluate it per element then.
+    Other errors of the expression are raised as is.
+    """
+    if allowed_names is None:
+        allowed_names = safe_names_np
+    try:
+        result = safe_eval_compiled(compiled, variables, allowed_names)
+    except (TypeError, ValueError) as e:
+        # arrays where scalars are expected ("truth value of an array is ambiguous",
+        # "only size-1 arrays can be converted") or arrays of different shapes
+        raise SvNotVectorizableError(str(e)) from e
+    except FloatingPointError as e:
+        # raised under np.errstate(...='raise') of the caller;
+        # per element evaluation raises or handles the error as usual
+        raise SvNotVectorizableError(str(e)) from e
+
+    shape = like.shape if isinstance(like, np.ndarray) else like
+    if isinstance(result, np.ndarray):
+        if result.shape != shape or result.dtype.kind not in 'biufc':
+            raise SvNotVectorizableError("Unexpected result of shape {} ({})".format(result.shape, result.dtype))
+        return result
+    elif np.isscalar(result) and isinstance(result, (bool, int, float, complex, np.number, np.bool_)):
+        if isinstance(like, np.ndarray):
+            return np.full_like(like, result)
+        else:
+            return np.full(shape, result)
+    else:
+        raise SvNotVectorizableError("Unexpected result type: {}".format(type(result)))
+
 # It could be safer...
 def safe_eval(string, variables):
     """
     Evaluate expression, allowing only functions known to be "safe"
     to be used.
     """
-    try:
-        env = dict()
-        env.update(safe_names)
-        env.update(variables)
-        env["__builtins__"] = {}
-        root = ast.parse(string, mode='eval')
-        return eval(compile(root, "<expression>", 'eval'), env)
-    except SyntaxError as e:
-        logging.exception(e)
-        raise Exception("Invalid expression syntax: " + str(e))
-
+    return safe_eval_compiled(sv_compile(string), variables)
@@ -16,12 +16,15 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 from colorsys import rgb_to_hls
-from itertools import repeat
+from itertools import repeat, islice
+import numpy as np
 from mathutils import Vector, Color
 
 from sverchok.data_structure import  iter_list_match_func
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
 from sverchok.utils.modules.color_utils import color_channels
+from sverchok.utils.modules.texture_lattice import (
+    evaluate_textures_baked, color_channel_values, rgb_to_hsv_vectors, rgb_to_hls_vectors)
 
 mapper_funcs = {
     'UV': lambda v, v_uv: Vector((v_uv[0]*2-1, v_uv[1]*2-1, v_uv[2])),
@@ -115,6 +118,55 @@ def apply_texture_displace_normal(verts, pols, m_prop, channel, mapper_func, res
     result.append([func(v_prop, mapper_func, extract_func) for v_prop in zip(verts, *m_prop, normals)])
     bm.free()
 
+def texture_coords_array(verts, matrix, mapping_mode):
+    """NumPy version of mapper_funcs for all vertices at once"""
+    if mapping_mode == 'UV':
+        return np.array(matrix, dtype=np.float64) * (2, 2, 1) - (1, 1, 0)
+    if all(m is matrix[0] for m in matrix):
+        m = np.array(matrix[0])
+        return verts @ m[:3, :3].T + m[:3, 3]
+    m = np.array(matrix)
+    return np.einsum('nij,nj->ni', m[:, :3, :3], verts) + m[:, :3, 3]
+
+baked_vector_funcs = {
+    'RGB to XYZ': lambda rgba: rgba[:, :3],
+    'HSV to XYZ': rgb_to_hsv_vectors,
+    'HLS to XYZ': rgb_to_hls_vectors
+}
+
+def apply_texture_displace_baked(verts, pols, m_prop, displace_mode, channel, mapping_mode, resolution, result):
+    """
+    Same as the apply_texture_displace_* functions, but for all vertices at once,
+    with the texture evaluated through a baked lattice (see texture_lattice module)
+    """
+    per_vertex = [list(islice(p, len(verts))) for p in m_prop]
+    n = min(map(len, [verts] + per_vertex))
+    texture, scale_out, matrix, mid_level, strength = [p[:n] for p in per_vertex[:5]]
+    np_verts = np.array(verts[:n], dtype=np.float64).reshape((-1, 3))
+    if not n:
+        result.append([])
+        return
+    scale_out = np.array(scale_out, dtype=np.float64)
+    mid_level = np.array(mid_level, dtype=np.float64)[:, np.newaxis]
+    strength = np.array(strength, dtype=np.float64)[:, np.newaxis]
+    rgba = evaluate_textures_baked(texture, texture_coords_array(np_verts, matrix, mapping_mode), resolution)
+
+    if displace_mode in baked_vector_funcs:
+        eval_v = baked_vector_funcs[displace_mode](rgba)
+        result.append((np_verts + (eval_v - mid_level) * strength * scale_out).tolist())
+        return
+
+    if displace_mode == 'NORMAL':
+        bm = bmesh_from_pydata(verts, [], pols, normal_update=True)
+        direction = np.array([v.normal[:] for v in bm.verts][:n])
+        bm.free()
+    elif displace_mode == 'Custom Axis':
+        direction = np.array(per_vertex[5][:n], dtype=np.float64)
+    else:
+        direction = np.array({'X': (1, 0, 0), 'Y': (0, 1, 0), 'Z': (0, 0, 1)}[displace_mode], dtype=np.float64)
+    eval_s = (color_channel_values(rgba, channel)[:, np.newaxis] - mid_level) * strength
+    result.append((np_verts + direction * eval_s * scale_out).tolist())
+
 def meshes_texture_diplace(params, constant, matching_f):
     '''
     This function prepares the data to pass to the different displace functions.
@@ -127,11 +179,13 @@ def meshes_texture_diplace(params, constant, matching_f):
             in case of UV Coors in mapping_mode it should be [[[float, float, float],],] (Level 3)
     mid_level and strength should be list as [[float, float, ..], [float, ..], ..] (Level 2)
     desired_levels = [3, 3, 2, 3, 2 or 3, 2, 2, 3]
-    constant are the function options (data that does not need to be matched)
+    constant are the function options (data that does not need to be matched),
+    optional last one is the resolution of the lattice to bake textures on (0 to evaluate per vertex)
     matching_f stands for list matching formula to use
     '''
     result = []
-    displace_mode, displace_function, color_channel, match_mode, mapping_mode = constant
+    displace_mode, displace_function, color_channel, match_mode, mapping_mode = constant[:5]
+    lattice_resolution = constant[5] if len(constant) > 5 else 0
     params = matching_f(params)
     local_match = iter_list_match_func[match_mode]
     mapper_func = mapper_funcs[mapping_mode]
@@ -153,7 +207,11 @@ def meshes_texture_diplace(params, constant, matching_f):
             m_prop = local_match([texture, scale_out, matrix, mid_level, strength, axis_n])
         else:
             m_prop = local_match([texture, scale_out, matrix, mid_level, strength])
-        displace_function(verts, pols, m_prop, color_channel, mapper_func, result)
+        if lattice_resolution:
+            apply_texture_displace_baked(verts, pols, m_prop, displace_mode, color_channel,
+                                         mapping_mode, lattice_resolution, result)
+        else:
+            displace_function(verts, pols, m_prop, color_channel, mapper_func, result)
 
     return result
 
@@ -0,0 +1,186 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Baked evaluation of scene textures: the texture is evaluated once on a
+regular lattice around the requested points, and the points get colors
+interpolated from the lattice (trilinear, or bilinear when all points lie
+in a plane parallel to coordinate axes, as UV coordinates do).
+
+Lattices are cached by the texture settings, so as long as the texture is
+not changed and the points stay inside the lattice, texture.evaluate is not
+called at all. The result is an approximation: details of the texture
+smaller than the lattice step are lost.
+"""
+
+from itertools import product
+
+import numpy as np
+
+import bpy
+
+from sverchok.utils.modules.color_utils import rgb_to_hsv, rgb_to_hsl
+
+# number of baked lattices kept in memory, older ones are dropped
+MAX_BAKED_TEXTURES = 16
+
+# the lattice is made this much (relative to the size of the points bounding box)
+# bigger than needed, so that slightly moved points can use the same lattice
+LATTICE_PADDING = 0.05
+
+# properties which don't change the result of texture.evaluate
+SKIP_PROPERTIES = {'rna_type', 'name_full', 'users', 'use_fake_user', 'use_extra_user',
+                   'is_embedded_data', 'is_evaluated', 'original', 'session_uid', 'tag',
+                   'is_runtime_data', 'is_library_indirect', 'preview', 'pixels', 'bindcode'}
+
+CHANNEL_COLUMNS = {'Red': 0, 'Green': 1, 'Blue': 2, 'Alpha': 3}
+HSV_COLUMNS = {'Hue': 0, 'Saturation': 1, 'Value': 2}
+
+baked_textures = dict()
+
+
+def settings_key(data, depth=2):
+    """
+    Hashable value of all properties of the Blender data which can change the
+    texture: simple properties, nested structures (like color ramp) up to the
+    depth, and names of referenced ID data blocks (like images).
+    """
+    values = []
+    for prop in data.bl_rna.properties:
+        name = prop.identifier
+        if name in SKIP_PROPERTIES:
+            continue
+        value = getattr(data, name, None)
+        if prop.type == 'POINTER':
+            if value is None or isinstance(value, bpy.types.ID) or depth == 0:
+                value = getattr(value, 'name', None)
+            else:
+                value = settings_key(value, depth - 1)
+        elif prop.type == 'COLLECTION':
+            if depth == 0:
+                continue
+            value = tuple(settings_key(item, depth - 1) for item in value)
+        elif prop.type == 'ENUM' and prop.is_enum_flag:
+            value = frozenset(value)
+        elif getattr(prop, 'is_array', False):
+            value = tuple(value)
+        values.append((name, value))
+    return tuple(values)
+
+
+def texture_key(texture):
+    if hasattr(texture, 'bl_rna'):
+        return ('TEXTURE', texture.name, settings_key(texture))
+    # not a Blender texture (EmptyTexture of the nodes), never changes
+    return ('OBJECT', id(texture))
+
+
+class SvBakedTexture:
+    """
+    Colors of a texture at the nodes of a regular lattice in the box
+    [bounds_min, bounds_max]. Axes of zero size get only one node.
+    """
+    def __init__(self, texture, bounds_min, bounds_max, resolution):
+        self.bounds_min = np.asarray(bounds_min, dtype=np.float64)
+        self.bounds_max = np.asarray(bounds_max, dtype=np.float64)
+        self.resolution = resolution
+        self.counts = np.where(self.bounds_max > self.bounds_min, resolution, 1)
+        axes = [np.linspace(lo, hi, n) for lo, hi, n in zip(self.bounds_min, self.bounds_max, self.counts)]
+        grid = np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape((-1, 3))
+        colors = [texture.evaluate(co)[:] for co in grid.tolist()]
+        self.values = np.array(colors, dtype=np.float64).reshape(tuple(self.counts) + (4,))
+
+    def covers(self, points_min, points_max, resolution):
+        return (self.resolution == resolution
+                and (self.bounds_min <= points_min).all()
+                and (self.bounds_max >= points_max).all())
+
+    def evaluate(self, points):
+        """RGBA colors at (n, 3) points, as (n, 4) array"""
+        steps = np.where(self.counts > 1, (self.bounds_max - self.bounds_min) / np.maximum(self.counts - 1, 1), 1.0)
+        t = (np.asarray(points, dtype=np.float64) - self.bounds_min) / steps
+        i0 = np.clip(np.floor(t).astype(np.int64), 0, np.maximum(self.counts - 2, 0))
+        i1 = np.minimum(i0 + 1, self.counts - 1)
+        frac = np.clip(t - i0, 0.0, 1.0)
+        frac[:, self.counts == 1] = 0.0
+
+        result = np.zeros((len(t), 4))
+        for corner in product((0, 1), repeat=3):
+            idx = [i1[:, k] if c else i0[:, k] for k, c in enumerate(corner)]
+            weight = np.prod([frac[:, k] if c else 1 - frac[:, k] for k, c in enumerate(corner)], axis=0)
+            result += weight[:, np.newaxis] * self.values[idx[0], idx[1], idx[2]]
+        return result
+
+
+def get_baked_texture(texture, points_min, points_max, resolution):
+    key = texture_key(texture)
+    baked = baked_textures.get(key)
+    if baked is None or not baked.covers(points_min, points_max, resolution):
+        padding = (points_max - points_min) * LATTICE_PADDING
+        baked = SvBakedTexture(texture, points_min - padding, points_max + padding, resolution)
+        baked_textures.pop(key, None)
+        baked_textures[key] = baked
+        while len(baked_textures) > MAX_BAKED_TEXTURES:
+            del baked_textures[next(iter(baked_textures))]
+    return baked
+
+
+def evaluate_textures_baked(textures, points, resolution):
+    """
+    RGBA colors of textures at points through baked lattices.
+    textures: one texture or list of textures (one per point);
+    points: (n, 3) array.
+    Returns (n, 4) array.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+    if not isinstance(textures, (list, tuple)):
+        textures = [textures]
+    result = np.zeros((len(points), 4))
+    if not len(points):
+        return result
+    if len(textures) == 1 or all(t is textures[0] for t in textures):
+        groups = [(textures[0], slice(None))]
+    else:
+        texture_idxs = dict()
+        for i, texture in enumerate(textures[:len(points)]):
+            texture_idxs.setdefault(id(texture), (texture, []))[1].append(i)
+        groups = [(texture, np.array(idxs)) for texture, idxs in texture_idxs.values()]
+    for texture, idxs in groups:
+        group_points = points[idxs]
+        baked = get_baked_texture(texture, group_points.min(axis=0), group_points.max(axis=0), resolution)
+        result[idxs] = baked.evaluate(group_points)
+    return result
+
+
+def color_channel_values(rgba, channel):
+    """
+    NumPy version of color_channels functions: values of the channel for (n, 4) colors,
+    (n,) array for scalar channels, (n, 3) for 'Color' and (n, 4) for 'RGBA'
+    """
+    if channel in HSV_COLUMNS:
+        return rgb_to_hsv_vectors(rgba)[:, HSV_COLUMNS[channel]]
+    if channel == 'RGB Average':
+        return rgba[:, :3].sum(axis=1) / 3
+    if channel == 'Luminosity':
+        return 0.21*rgba[:, 0] + 0.72*rgba[:, 1] + 0.07*rgba[:, 2]
+    if channel == 'Color':
+        return rgba[:, :3]
+    if channel == 'RGBA':
+        return rgba
+    return rgba[:, CHANNEL_COLUMNS[channel]]
+
+
+def rgb_to_hsv_vectors(rgba):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return rgb_to_hsv(rgba[:, :3])
+
+
+def rgb_to_hls_vectors(rgba):
+    """(h, l, s) as colorsys.rgb_to_hls gives"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hsl = rgb_to_hsl(rgba[:, :3])
+    return hsl[:, [0, 2, 1]]
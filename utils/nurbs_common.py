@@ -216,3 +216,96 @@ class SvNurbsBasisFunctions(object):
         
         return calc
 
+
+    def find_spans(self, p, ts):
+        """
+        Find knot span indexes for an array of parameter values.
+
+        For each t, returns index j such that u[j] <= t < u[j+1]; the last
+        non-degenerate span is considered to be closed, i.e. t == u[-1] is
+        included in it. Parameters outside of knotvector bounds are
+        reported by the second returned array.
+
+        output: tuple (spans, in_range): integer array of shape (n,) and boolean array of shape (n,).
+        """
+        u = self.knotvector
+        ts = np.asarray(ts)
+        u_min, u_max = u[0], u[-1]
+        last_span = np.searchsorted(u, u_max, side='left') - 1
+        spans = np.searchsorted(u, ts, side='right') - 1
+        spans = np.minimum(spans, last_span)
+        in_range = (ts >= u_min) & (ts <= u_max)
+        spans[~in_range] = max(p, 0)
+        return spans, in_range
+
+    def span_functions(self, p, ts, k=0):
+        """
+        Calculate k'th derivatives of only those basis functions of degree p
+        which are non-zero at each of parameter values, i.e. functions
+        N[j-p], ..., N[j] for span j containing t.
+        This gives the same values as derivative(i, p, k), but evaluation costs
+        O(p^2 * n) instead of O(p^2 * n * number_of_functions).
+
+        input:
+            * p - degree
+            * ts - array of parameter values, shape (n,)
+            * k - derivative order; 0 for functions themselves.
+
+        output: tuple (indexes, values):
+            * indexes - indexes of basis functions (i.e. indexes of control points), shape (n, p+1);
+            * values - values of corresponding functions (or their derivatives), shape (n, p+1).
+            Indexes which are out of range of [0; len(knotvector)-p-2] are
+            clipped, and corresponding values are set to zero.
+        """
+        ts = np.asarray(ts)
+        n = len(ts)
+        spans, in_range = self.find_spans(p, ts)
+        r = np.arange(p+1)
+        indexes = spans[np.newaxis].T - p + r # (n, p+1)
+
+        if k > p:
+            values = np.zeros((n, p+1))
+        else:
+            # Pad the knotvector from both sides, so that the recursion
+            # never goes out of bounds; padded functions are discarded below.
+            u = self.knotvector
+            pad = p + 1
+            u = np.concatenate((np.full(pad, u[0]), u, np.full(pad, u[-1])))
+            spans_p = spans + pad
+            ts_t = ts[np.newaxis].T # (n, 1)
+
+            def ratio(numerator, denominator):
+                good = (denominator != 0)
+                safe = np.where(good, denominator, 1.0)
+                return np.where(good, numerator / safe, 0.0)
+
+            # Degree-0 functions: the only non-zero one is N[j,0] == 1.
+            ns = np.ones((n, 1))
+            # Cox - de Boor recursion, restricted to the functions
+            # N[j-q], ..., N[j] of each degree q.
+            for q in range(1, p-k+1):
+                i = spans_p[np.newaxis].T - q + np.arange(q+1) # (n, q+1)
+                zero = np.zeros((n, 1))
+                n1 = np.concatenate((zero, ns), axis=1) # N[i, q-1]
+                n2 = np.concatenate((ns, zero), axis=1) # N[i+1, q-1]
+                c1 = ratio(ts_t - u[i], u[i+q] - u[i])
+                c2 = ratio(u[i+q+1] - ts_t, u[i+q+1] - u[i+1])
+                ns = c1 * n1 + c2 * n2
+            # Derivatives recursion:
+            # N^(m)[i,q] = q * (N^(m-1)[i,q-1] / (u[i+q] - u[i]) - N^(m-1)[i+1,q-1] / (u[i+q+1] - u[i+1]))
+            for q in range(p-k+1, p+1):
+                i = spans_p[np.newaxis].T - q + np.arange(q+1) # (n, q+1)
+                zero = np.zeros((n, 1))
+                n1 = np.concatenate((zero, ns), axis=1)
+                n2 = np.concatenate((ns, zero), axis=1)
+                s1 = ratio(n1, u[i+q] - u[i])
+                s2 = ratio(n2, u[i+q+1] - u[i+1])
+                ns = q * (s1 - s2)
+            values = ns
+
+        n_functions = len(self.knotvector) - p - 1
+        good = (indexes >= 0) & (indexes < n_functions) & in_range[np.newaxis].T
+        values = np.where(good, values, 0.0)
+        indexes = np.clip(indexes, 0, max(n_functions-1, 0))
+        return indexes, values
+
@@ -10,6 +10,7 @@ from math import pi, cos, sin, atan, sqrt
 from collections import defaultdict
 
 from sverchok.utils.logging import info, exception
+from sverchok.utils.modules.eval_formula import SvNotVectorizableError
 from sverchok.utils.surface.data import *
 
 class UnsupportedSurfaceTypeException(TypeError):
@@ -383,10 +384,14 @@ class SvLambdaSurface(SvSurface):
         return self.function(u, v)
 
     def evaluate_array(self, us, vs):
-        if self.function_numpy is None:
-            return np.vectorize(self.function, signature='(),()->(3)')(us, vs)
-        else:
-            return self.function_numpy(us, vs)
+        if self.function_numpy is not None:
+            try:
+                return self.function_numpy(us, vs)
+            except SvNotVectorizableError:
+                # evaluate per element this time; this can depend on the
+                # values, so vectorized evaluation is tried again next time
+                pass
+        return np.vectorize(self.function, signature='(),()->(3)')(us, vs)
 
     def normal(self, u, v):
         return self.normal_array(np.array([u]), np.array([v]))[0]
@@ -568,18 +568,17 @@ class SvNativeNurbsSurface(SvNurbsSurface):
     def fraction(self, deriv_order_u, deriv_order_v, us, vs):
         pu = self.degree_u
         pv = self.degree_v
-        ku, kv, _ = self.control_points.shape
-        nsu = np.array([self.basis_u.derivative(i, pu, deriv_order_u)(us) for i in range(ku)]) # (ku, n)
-        nsv = np.array([self.basis_v.derivative(i, pv, deriv_order_v)(vs) for i in range(kv)]) # (kv, n)
-        nsu = np.transpose(nsu[np.newaxis], axes=(1,0,2)) # (ku, 1, n)
-        nsv = nsv[np.newaxis] # (1, kv, n)
-        ns = nsu * nsv # (ku, kv, n)
-        weights = np.transpose(self.weights[np.newaxis], axes=(1,2,0)) # (ku, kv, 1)
-        coeffs = ns * weights # (ku, kv, n)
-        coeffs = np.transpose(coeffs[np.newaxis], axes=(3,1,2,0)) # (n,ku,kv,1)
-        controls = self.control_points # (ku,kv,3)
-
-        numerator = coeffs * controls # (n,ku,kv,3)
+        # Only (pu+1) x (pv+1) basis functions are non-zero at each (u, v)
+        idxs_u, nsu = self.basis_u.span_functions(pu, us, deriv_order_u) # (n, pu+1)
+        idxs_v, nsv = self.basis_v.span_functions(pv, vs, deriv_order_v) # (n, pv+1)
+        idxs_u = idxs_u[:,:,np.newaxis] # (n, pu+1, 1)
+        idxs_v = idxs_v[:,np.newaxis,:] # (n, 1, pv+1)
+        ns = nsu[:,:,np.newaxis] * nsv[:,np.newaxis,:] # (n, pu+1, pv+1)
+        weights = self.weights[idxs_u, idxs_v] # (n, pu+1, pv+1)
+        coeffs = (ns * weights)[:,:,:,np.newaxis] # (n, pu+1, pv+1, 1)
+        controls = self.control_points[idxs_u, idxs_v] # (n, pu+1, pv+1, 3)
+
+        numerator = coeffs * controls # (n,pu+1,pv+1,3)
         numerator = numerator.sum(axis=1).sum(axis=1) # (n,3)
         denominator = coeffs.sum(axis=1).sum(axis=1)
 
@@ -5,8 +5,16 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+from collections import OrderedDict
+
+import numpy as np
+
 from mathutils import kdtree
 from sverchok.data_structure import match_long_repeat as mlr
+from sverchok.dependencies import scipy
+
+if scipy is not None:
+    from scipy.spatial import cKDTree
 
 # documentation/blender_python_api_2_70_release/mathutils.kdtree.html
 def create_kdt(verts):
@@ -20,6 +28,94 @@ def create_kdt(verts):
     return kd
 
 
+class SvKdTree(object):
+    '''
+    KD-tree with batched nearest neighbours search. Uses scipy's cKDTree
+    when it is available, otherwise falls back to mathutils.kdtree.
+    Use get_kdtree() to create instances, it caches built trees.
+    '''
+    def __init__(self, vertices=None, kdt=None, use_scipy=True):
+        if vertices is not None:
+            self.vertices = np.asarray(vertices, dtype=np.float64)
+            if self.vertices.ndim != 2 or self.vertices.shape[1] != 3:
+                raise Exception("Vertices must be an array of shape (n, 3)")
+        elif kdt is None:
+            raise Exception("Either kdt or vertices must be provided")
+        else:
+            self.vertices = None
+
+        if use_scipy and scipy is not None and self.vertices is not None:
+            self.cKDTree = cKDTree(self.vertices)
+            self.kdt = None
+        else:
+            self.cKDTree = None
+            self.kdt = kdt if kdt is not None else create_kdt(self.vertices)
+
+    @property
+    def size(self):
+        if self.cKDTree is not None:
+            return self.cKDTree.n
+        else:
+            return len(self.vertices) if self.vertices is not None else None
+
+    def query(self, points, k=1):
+        '''
+        Search for k nearest vertices of each point.
+
+        > points:   array of shape (n, 3)
+        < returns tuple of arrays: nearest vertices of shape (n, k, 3),
+          their indices of shape (n, k) and distances of shape (n, k).
+        '''
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        size = self.size
+        if size is not None:
+            k = min(k, size)
+        if self.cKDTree is not None:
+            try:
+                distances, indices = self.cKDTree.query(points, k=[i+1 for i in range(k)], workers=-1)
+            except TypeError:
+                # scipy < 1.6
+                distances, indices = self.cKDTree.query(points, k=[i+1 for i in range(k)], n_jobs=-1)
+            nearest = self.vertices[indices]
+        else:
+            n = len(points)
+            nearest = np.empty((n, k, 3))
+            indices = np.empty((n, k), dtype=np.int64)
+            distances = np.empty((n, k))
+            find_n = self.kdt.find_n
+            for i, point in enumerate(points):
+                found = find_n(point, k)
+                if len(found) != k:
+                    raise Exception("KD-tree contains less than {} vertices".format(k))
+                for j, (co, index, distance) in enumerate(found):
+                    nearest[i, j] = co
+                    indices[i, j] = index
+                    distances[i, j] = distance
+        return nearest, indices, distances
+
+_kdtree_cache = OrderedDict()
+_kdtree_cache_size = 16
+
+def get_kdtree(vertices):
+    '''
+    Get SvKdTree for specified vertices. Recently built trees are cached,
+    keyed on the contents of vertices array, so evaluating the same
+    field again (for example, on the next frame) does not rebuild the tree.
+    '''
+    vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+    key = (vertices.shape, hash(vertices.tobytes()))
+    tree = _kdtree_cache.get(key)
+    if tree is not None and np.array_equal(tree.vertices, vertices):
+        _kdtree_cache.move_to_end(key)
+        return tree
+    # the caller can change its array in place later
+    tree = SvKdTree(vertices.copy())
+    _kdtree_cache[key] = tree
+    while len(_kdtree_cache) > _kdtree_cache_size:
+        _kdtree_cache.popitem(last=False)
+    return tree
+
+
 def kdt_closest_verts_range(verts, v_find, dists, out):
     '''Find vertices in desired distance'''
     kd = create_kdt(verts)
@@ -18,11 +18,13 @@
 
 from contextlib import contextmanager
 import math
+import threading
 from operator import setitem, getitem
-from itertools import count
+from itertools import count, chain
 
 import numpy as np
 
+import bpy
 import bmesh
 from bmesh.types import BMVert, BMEdge, BMFace
 import mathutils
@@ -51,6 +53,197 @@ def empty_bmesh(use_operators=True):
         raise error
 
 
+# Meshes with at least this number of vertices are passed between python data and
+# BMesh through a scratch mesh datablock with foreach_set / foreach_get,
+# smaller ones are built element by element
+BULK_MIN_VERTS = 256
+SCRATCH_MESH_NAME = "__sv_bmesh_scratch__"
+
+
+def scratch_mesh():
+    """
+    Empty mesh datablock for bulk conversions, or None if it can't be used now:
+    outside of the main thread or when bpy.data is not available
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return None
+    try:
+        mesh = bpy.data.meshes.get(SCRATCH_MESH_NAME)
+        if mesh is None:
+            mesh = bpy.data.meshes.new(SCRATCH_MESH_NAME)
+        mesh.clear_geometry()
+    except (AttributeError, RuntimeError):
+        return None
+    return mesh
+
+
+def faces_to_loops(faces):
+    """
+    Faces as flat arrays: (loop_start, loop_total, vertex index of each loop)
+    """
+    if isinstance(faces, np.ndarray) and faces.ndim == 2:
+        n_faces, n_sides = faces.shape
+        loop_total = np.full(n_faces, n_sides, dtype=np.int64)
+        loop_verts = faces.ravel().astype(np.int64)
+    else:
+        loop_total = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+        loop_verts = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=loop_total.sum())
+    loop_start = np.cumsum(loop_total) - loop_total
+    return loop_start, loop_total, loop_verts
+
+
+def loops_to_faces(loop_start, loop_total, loop_verts):
+    """Faces as lists of vertex indexes from flat arrays"""
+    flat = loop_verts.tolist()
+    return [flat[start : start + total] for start, total in zip(loop_start.tolist(), loop_total.tolist())]
+
+
+def valid_bulk_faces(n_verts, loop_start, loop_total, loop_verts):
+    """
+    Whether the faces can be put into a mesh datablock directly:
+    bm.faces.new raises an error for the faces which are not
+    """
+    if not len(loop_total):
+        return True
+    if loop_total.min() < 3:
+        return False
+    if loop_verts.min() < 0 or loop_verts.max() >= n_verts:
+        return False
+    # the same vertex twice in one face
+    face_idx = np.repeat(np.arange(len(loop_total)), loop_total)
+    order = np.lexsort((loop_verts, face_idx))
+    sorted_verts = loop_verts[order]
+    if np.any((sorted_verts[1:] == sorted_verts[:-1]) & (face_idx[1:] == face_idx[:-1])):
+        return False
+    # two faces with the same vertices
+    for total in np.unique(loop_total):
+        selected = np.repeat(loop_total == total, loop_total)
+        rows = sorted_verts[selected].reshape(-1, total)
+        if len(np.unique(rows, axis=0)) < len(rows):
+            return False
+    return True
+
+
+def face_edge_pairs(loop_start, loop_total, loop_verts):
+    """
+    Edges of faces in the order bm.faces.new creates them: for each face
+    the edge from last vertex to the first one, then the edges along the face.
+    Returns (n_loops, 2) array of vertex pairs, and for each loop
+    the index of the pair of its edge (from the loop vertex to the next one).
+    """
+    n_loops = len(loop_verts)
+    prev = np.arange(-1, n_loops - 1)
+    prev[loop_start] = loop_start + loop_total - 1
+    pairs = np.stack((loop_verts[prev], loop_verts), axis=1)
+    loop_pair = np.empty(n_loops, dtype=np.int64)
+    loop_pair[prev] = np.arange(n_loops)
+    return pairs, loop_pair
+
+
+def unique_edges(pairs, n_verts):
+    """
+    Unique undirected edges of the pairs in order of first occurrence.
+    Returns the edges and index of edge for each pair.
+    """
+    keys = np.sort(pairs, axis=1)
+    keys = keys[:, 0] * n_verts + keys[:, 1]
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return pairs[first[order]], rank[inverse.ravel()]
+
+
+def set_int_layer(mesh, name, domain, values):
+    """
+    Add integer attribute to the mesh, it becomes int layer of BMesh loaded from it.
+    Returns False if this version of Blender has no mesh attributes.
+    """
+    if not hasattr(mesh, 'attributes'):
+        return False
+    attribute = mesh.attributes.new(name, 'INT', domain)
+    attribute.data.foreach_set('value', np.asarray(values, dtype=np.int32))
+    return True
+
+
+def bulk_bmesh(bm, verts, edges, faces, edges_first=False, markup_face_data=False,
+               markup_edge_data=False, markup_vert_data=False):
+    """
+    Load mesh into the (empty) bmesh via scratch mesh datablock, with the same order
+    of elements as when they are created one by one.
+    Faces are created before edges unless edges_first is True.
+    Returns False, without changing bm, when the mesh has to be built element by element.
+    """
+    try:
+        verts = np.asarray(verts, dtype=np.float32)
+        edges = np.asarray(edges if edges is not None and len(edges) else np.zeros((0, 2)), dtype=np.int64)
+        loop_start, loop_total, loop_verts = faces_to_loops(faces if faces is not None else [])
+    except (ValueError, TypeError):
+        return False
+    n_verts = len(verts)
+    if verts.ndim != 2 or verts.shape[1] != 3:
+        return False
+    if edges.ndim != 2 or edges.shape[1] != 2:
+        return False
+    if len(edges) and (edges.min() < 0 or edges.max() >= n_verts or np.any(edges[:, 0] == edges[:, 1])):
+        return False
+    if not valid_bulk_faces(n_verts, loop_start, loop_total, loop_verts):
+        return False
+
+    face_pairs, loop_pair = face_edge_pairs(loop_start, loop_total, loop_verts)
+    n_loops = len(loop_verts)
+    if edges_first:
+        if len(unique_edges(edges, n_verts)[0]) < len(edges):
+            # bm.edges.new raises an error for existing edges
+            return False
+        mesh_edges, edge_of_pair = unique_edges(np.concatenate((edges, face_pairs)), n_verts)
+        loop_edges = edge_of_pair[len(edges):][loop_pair]
+        input_edges = edge_of_pair[:len(edges)]
+    else:
+        mesh_edges, edge_of_pair = unique_edges(np.concatenate((face_pairs, edges)), n_verts)
+        loop_edges = edge_of_pair[:n_loops][loop_pair]
+        input_edges = edge_of_pair[n_loops:]
+
+    mesh = scratch_mesh()
+    if mesh is None:
+        return False
+    mesh.vertices.add(n_verts)
+    mesh.vertices.foreach_set('co', verts.ravel())
+    mesh.edges.add(len(mesh_edges))
+    mesh.edges.foreach_set('vertices', mesh_edges.ravel().astype(np.int32))
+    mesh.loops.add(n_loops)
+    mesh.loops.foreach_set('vertex_index', loop_verts.astype(np.int32))
+    mesh.loops.foreach_set('edge_index', loop_edges.astype(np.int32))
+    mesh.polygons.add(len(loop_total))
+    mesh.polygons.foreach_set('loop_start', loop_start.astype(np.int32))
+    try:
+        mesh.polygons.foreach_set('loop_total', loop_total.astype(np.int32))
+    except (AttributeError, TypeError):
+        # read-only in newer Blender versions, where it follows from loop_start
+        pass
+
+    layers = []
+    if markup_vert_data:
+        layers.append(('POINT', bm.verts, np.arange(n_verts)))
+    if markup_edge_data and len(edges):
+        values = np.zeros(len(mesh_edges), dtype=np.int64)
+        values[input_edges] = np.arange(len(edges))
+        layers.append(('EDGE', bm.edges, values))
+    if markup_face_data:
+        layers.append(('FACE', bm.faces, np.arange(len(loop_total))))
+    unset_layers = [(sequence, values) for domain, sequence, values in layers
+                    if not set_int_layer(mesh, "initial_index", domain, values)]
+
+    bm.from_mesh(mesh)
+    mesh.clear_geometry()
+
+    for sequence, values in unset_layers:
+        layer = sequence.layers.int.new("initial_index")
+        for element, value in zip(sequence, values.tolist()):
+            element[layer] = value
+    return True
+
+
 def bmesh_from_pydata(verts=None, edges=[], faces=[], markup_face_data=False, markup_edge_data=False,
                       markup_vert_data=False, normal_update=False):
     ''' verts is necessary, edges/faces are optional
@@ -58,6 +251,18 @@ def bmesh_from_pydata(verts=None, edges=[], faces=[], markup_face_data=False, ma
     '''
 
     bm = bmesh.new()
+    if len(verts) >= BULK_MIN_VERTS and bulk_bmesh(bm, verts, edges, faces,
+                                                   markup_face_data=markup_face_data,
+                                                   markup_edge_data=markup_edge_data,
+                                                   markup_vert_data=markup_vert_data):
+        bm.verts.index_update()
+        bm.edges.index_update()
+        bm.faces.index_update()
+        bm.verts.ensure_lookup_table()
+        if normal_update:
+            bm.normal_update()
+        return bm
+
     bm_verts = bm.verts
     add_vert = bm_verts.new
 
@@ -112,9 +317,11 @@ def bmesh_from_pydata(verts=None, edges=[], faces=[], markup_face_data=False, ma
 
 
 def add_mesh_to_bmesh(bm, verts, edges=None, faces=None, sv_index_name=None, update_indexes=True, update_normals=True):
-    bm_verts = [bm.verts.new(co) for co in verts]
-    [bm.edges.new((bm_verts[i1], bm_verts[i2])) for i1, i2 in edges or []]
-    [bm.faces.new([bm_verts[i] for i in face]) for face in faces or []]
+    bulk = len(verts) >= BULK_MIN_VERTS and not bm.verts and bulk_bmesh(bm, verts, edges, faces, edges_first=True)
+    if not bulk:
+        bm_verts = [bm.verts.new(co) for co in verts]
+        [bm.edges.new((bm_verts[i1], bm_verts[i2])) for i1, i2 in edges or []]
+        [bm.faces.new([bm_verts[i] for i in face]) for face in faces or []]
 
     if update_normals:
         bm.normal_update()
@@ -137,34 +344,80 @@ def add_mesh_to_bmesh(bm, verts, edges=None, faces=None, sv_index_name=None, upd
         bm.faces.index_update()
 
 
+def bmesh_to_arrays(bm):
+    """
+    Read mesh from bmesh through scratch mesh datablock.
+    Returns (verts, edges, loop_start, loop_total, loop_verts) arrays, or None
+    if the mesh is small or the datablock can't be used.
+    """
+    if len(bm.verts) < BULK_MIN_VERTS:
+        return None
+    mesh = scratch_mesh()
+    if mesh is None:
+        return None
+    bm.to_mesh(mesh)
+    verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', verts)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', edges)
+    loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', loop_start)
+    loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_total)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    mesh.clear_geometry()
+    return verts.reshape(-1, 3).astype(np.float64), edges.reshape(-1, 2), loop_start, loop_total, loop_verts
+
+
 def numpy_data_from_bmesh(bm, out_np, face_data=None):
-    if out_np[0]:
-        verts = np.array([v.co[:] for v in bm.verts])
-    else:
-        verts = [v.co[:] for v in bm.verts]
-    if out_np[1]:
-        edges = np.array([[e.verts[0].index, e.verts[1].index] for e in bm.edges])
-    else:
-        edges = [[e.verts[0].index, e.verts[1].index] for e in bm.edges]
-    if out_np[2]:
-        faces = np.array([[i.index for i in p.verts] for p in bm.faces])
+    arrays = bmesh_to_arrays(bm)
+    if arrays is not None:
+        verts, edges, loop_start, loop_total, loop_verts = arrays
+        if not out_np[0]:
+            verts = list(map(tuple, verts.tolist()))
+        if not out_np[1]:
+            edges = edges.tolist()
+        if out_np[2] and len(loop_total) and np.all(loop_total == loop_total[0]):
+            faces = loop_verts.reshape(-1, loop_total[0])
+        else:
+            faces = loops_to_faces(loop_start, loop_total, loop_verts)
+            if out_np[2]:
+                faces = np.array(faces, dtype=object)
     else:
-        faces = [[i.index for i in p.verts] for p in bm.faces]
+        if out_np[0]:
+            verts = np.array([v.co[:] for v in bm.verts])
+        else:
+            verts = [v.co[:] for v in bm.verts]
+        if out_np[1]:
+            edges = np.array([[e.verts[0].index, e.verts[1].index] for e in bm.edges])
+        else:
+            edges = [[e.verts[0].index, e.verts[1].index] for e in bm.edges]
+        if out_np[2]:
+            faces = np.array([[i.index for i in p.verts] for p in bm.faces])
+        else:
+            faces = [[i.index for i in p.verts] for p in bm.faces]
 
     if face_data:
+        face_data_out = face_data_from_bmesh_faces(bm, face_data)
         if out_np[3]:
-            face_data_out = np.array(face_data_from_bmesh_faces(bm, face_data))
-        else:
-            face_data_out = face_data_from_bmesh_faces(bm, face_data)
-            return verts, edges, faces, face_data_out
+            face_data_out = np.array(face_data_out)
+        return verts, edges, faces, face_data_out
     else:
         return verts, edges, faces, []
 
 def pydata_from_bmesh(bm, face_data=None):
 
-    verts = [v.co[:] for v in bm.verts]
-    edges = [[e.verts[0].index, e.verts[1].index] for e in bm.edges]
-    faces = [[i.index for i in p.verts] for p in bm.faces]
+    arrays = bmesh_to_arrays(bm)
+    if arrays is not None:
+        verts, edges, loop_start, loop_total, loop_verts = arrays
+        verts = list(map(tuple, verts.tolist()))
+        edges = edges.tolist()
+        faces = loops_to_faces(loop_start, loop_total, loop_verts)
+    else:
+        verts = [v.co[:] for v in bm.verts]
+        edges = [[e.verts[0].index, e.verts[1].index] for e in bm.edges]
+        faces = [[i.index for i in p.verts] for p in bm.faces]
 
     if face_data is None:
         return verts, edges, faces
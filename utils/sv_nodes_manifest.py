@@ -0,0 +1,115 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Manifest of node modules: which module defines which node class.
+It is built by parsing node files, without importing them, so that node
+modules can be imported only when they are needed (see lazy loading in
+sverchok.core). Parsed data is cached in a JSON file in Blender's user
+data files directory, and files are parsed again only if they were changed since.
+"""
+
+import os
+import ast
+import json
+
+import bpy
+
+from sverchok.utils.logging import debug, error
+
+MANIFEST_FILE_NAME = ".nodes_manifest.json"
+
+
+def is_node_class(class_def):
+    for base in class_def.bases:
+        if isinstance(base, ast.Name) and base.id in {'Node', 'SverchCustomTreeNode'}:
+            return True
+        if isinstance(base, ast.Attribute) and base.attr == 'Node':
+            return True
+    return False
+
+
+def get_class_string(class_def, name):
+    for statement in class_def.body:
+        if isinstance(statement, ast.Assign):
+            if any(isinstance(target, ast.Name) and target.id == name for target in statement.targets):
+                try:
+                    return ast.literal_eval(statement.value)
+                except ValueError:
+                    return None
+    return None
+
+
+def get_node_classes(file_path):
+    """
+    [(bl_idname, bl_label)] of node classes defined in the file.
+    Classes defined under conditions (e.g. when a dependency is available) are included.
+    """
+    with open(file_path, errors='replace') as file:
+        tree = ast.parse(file.read())
+    classes = []
+    for class_def in ast.walk(tree):
+        if isinstance(class_def, ast.ClassDef) and is_node_class(class_def):
+            bl_idname = get_class_string(class_def, 'bl_idname')
+            if isinstance(bl_idname, str):
+                label = get_class_string(class_def, 'bl_label')
+                classes.append((bl_idname, label if isinstance(label, str) else bl_idname))
+    return classes
+
+
+def get_manifest_path():
+    datafiles = bpy.utils.user_resource('DATAFILES', path='sverchok', create=True)
+    return os.path.join(datafiles, MANIFEST_FILE_NAME)
+
+
+def get_nodes_manifest(nodes_dict, nodes_dir, manifest_path=None):
+    """
+    {bl_idname: (module name relative to sverchok.nodes, bl_label)}
+    nodes_dict: {category: [module names]}, as in sverchok.nodes.nodes_dict
+    manifest_path: cache file, by default in the user data files directory
+    """
+    if manifest_path is None:
+        manifest_path = get_manifest_path()
+    try:
+        with open(manifest_path) as file:
+            data = json.load(file)
+        # the cache is valid only for the same installation of the add-on
+        cached = data['modules'] if data.get('nodes_dir') == nodes_dir else dict()
+    except (OSError, ValueError, KeyError, AttributeError):
+        cached = dict()
+
+    modules = dict()
+    changed = False
+    for category, names in nodes_dict.items():
+        for name in names:
+            module_name = f"{category}.{name}"
+            file_path = os.path.join(nodes_dir, category, name + '.py')
+            stat = os.stat(file_path)
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            record = cached.get(module_name)
+            if record is None or record['stamp'] != stamp:
+                try:
+                    classes = get_node_classes(file_path)
+                except SyntaxError as err:
+                    error("Can't parse node module %s: %s", module_name, err)
+                    classes = []
+                record = dict(stamp=stamp, classes=classes)
+                changed = True
+            modules[module_name] = record
+
+    if changed or len(modules) != len(cached):
+        try:
+            with open(manifest_path, 'w') as file:
+                json.dump(dict(nodes_dir=nodes_dir, modules=modules), file)
+        except OSError as err:
+            debug("Can't write nodes manifest: %s", err)
+
+    manifest = dict()
+    for module_name, record in modules.items():
+        for bl_idname, label in record['classes']:
+            manifest[bl_idname] = (module_name, label)
+    return manifest
@@ -0,0 +1,182 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Batched application of element-wise numpy functions to "ragged" data,
+i.e. to lists of objects of different lengths, such as
+
+    [[1, 2, 3], [4, 5]]                    (level 2 data, elements are numbers)
+    [[(0,0,0), (1,0,0)], [(0,1,0)]]        (level 2 data, elements are vectors)
+
+Instead of calling the function for each object (which is slow when there
+are a lot of small objects), all objects of each input are packed into one
+flat array, list matching (on both levels: objects and elements) is
+expressed as index arrays, the function is called once, and the result is
+split back into objects.
+
+The function must be element-wise, i.e. the result for each element may
+depend only on that element of each input.
+"""
+
+from itertools import chain, repeat
+
+import numpy as np
+
+def pack_objects(objects, element_ndim=0):
+    """
+    Pack list of objects into one flat array.
+
+    objects: list of lists (or arrays) of elements.
+    element_ndim: 0 if elements are numbers, 1 if elements are vectors.
+
+    Returns tuple (values, lengths), where values is an array of
+    shape (total, ...), and lengths is an array of lengths of objects;
+    or None if objects can not be packed (they are not lists of numeric
+    elements of expected nesting, or some of them are empty).
+    """
+    if not isinstance(objects, (list, tuple)) or not objects:
+        return None
+    if not all(isinstance(o, (list, tuple, np.ndarray)) for o in objects):
+        return None
+    lengths = np.array([len(o) for o in objects], dtype=np.int64)
+    if not lengths.all():
+        return None
+
+    try:
+        if all(isinstance(o, np.ndarray) for o in objects):
+            if len({o.dtype.kind for o in objects}) > 1:
+                return None
+            values = np.concatenate(objects)
+        else:
+            elements = list(chain.from_iterable(objects))
+            values = np.array(elements)
+    except ValueError:
+        # ragged elements
+        return None
+
+    if values.ndim != 1 + element_ndim or values.dtype.kind not in 'biuf':
+        return None
+    if values.dtype.kind == 'f' and not isinstance(objects[0], np.ndarray):
+        if not _all_objects_float(elements, element_ndim, lengths):
+            return None
+    return values, lengths
+
+def _all_objects_float(elements, element_ndim, lengths):
+    """
+    Whether each object has float numbers. Otherwise some objects consist of
+    integers only, and the per-object code path would keep them integer,
+    while in one packed array they would become float.
+    """
+    numbers = elements if element_ndim == 0 else list(chain.from_iterable(elements))
+    is_float = np.fromiter(map(isinstance, numbers, repeat(float)), dtype=bool, count=len(numbers))
+    element_is_float = is_float.reshape((len(elements), -1)).any(axis=1)
+    starts = np.cumsum(lengths) - lengths
+    return np.logical_or.reduceat(element_is_float, starts).all()
+
+def _match_indexes(idxs, lengths, mode):
+    if mode == 'REPEAT':
+        return np.minimum(idxs, lengths - 1)
+    elif mode == 'CYCLE':
+        return idxs % lengths
+    elif mode == 'SHORT':
+        return idxs
+    else:
+        raise Exception("Unsupported list match mode: " + mode)
+
+def match_packed(lengths_list, mode='REPEAT'):
+    """
+    Express list matching of several packed inputs as index arrays.
+    Matching is done on both levels: objects are matched with objects,
+    and elements of matched objects are matched with each other.
+
+    lengths_list: list of arrays of objects lengths, one per input.
+    mode: 'REPEAT', 'CYCLE' or 'SHORT', as in list_match_func.
+
+    Returns tuple (indexes, out_lengths), where indexes is a list of
+    index arrays into flat values of each input, and out_lengths is an
+    array of lengths of resulting objects.
+    """
+    counts = [len(lengths) for lengths in lengths_list]
+    if mode == 'SHORT':
+        n_objects = min(counts)
+    else:
+        n_objects = max(counts)
+    object_idxs = np.arange(n_objects)
+
+    offsets_list = []
+    matched_lengths = []
+    for lengths in lengths_list:
+        idxs = _match_indexes(object_idxs, len(lengths), mode)
+        offsets = np.cumsum(lengths) - lengths
+        offsets_list.append(offsets[idxs])
+        matched_lengths.append(lengths[idxs])
+
+    if mode == 'SHORT':
+        out_lengths = np.min(matched_lengths, axis=0)
+    else:
+        out_lengths = np.max(matched_lengths, axis=0)
+
+    total = out_lengths.sum()
+    object_of_element = np.repeat(object_idxs, out_lengths)
+    element_idxs = np.arange(total) - np.repeat(np.cumsum(out_lengths) - out_lengths, out_lengths)
+
+    indexes = []
+    for offsets, lengths in zip(offsets_list, matched_lengths):
+        idxs = _match_indexes(element_idxs, lengths[object_of_element], mode)
+        indexes.append(offsets[object_of_element] + idxs)
+    return indexes, out_lengths
+
+def unpack_objects(values, lengths, out_numpy=False):
+    """
+    Split flat array into list of objects of specified lengths.
+    Objects are numpy arrays if out_numpy is True, otherwise lists.
+    """
+    ends = np.cumsum(lengths)
+    if out_numpy:
+        return np.split(values, ends[:-1])
+    starts = (ends - lengths).tolist()
+    values = values.tolist()
+    return [values[start : end] for start, end in zip(starts, ends.tolist())]
+
+def batch_apply(func, inputs, element_ndims=None, mode='REPEAT', out_numpy=False, single_argument=False):
+    """
+    Apply element-wise numpy function to level 2 data of all inputs at once.
+
+    func: function taking one array per input (or one list of arrays, if
+        single_argument is True) and returning an array of per-element results.
+    inputs: list of inputs, each being a list of objects.
+    element_ndims: for each input, 0 if elements are numbers, 1 if they are vectors.
+    mode: list matching mode, 'REPEAT', 'CYCLE' or 'SHORT'.
+
+    Returns list of resulting objects, or None if inputs are not regular
+    enough to be processed in one batch - the caller should fall back to
+    per-object processing then.
+    """
+    if element_ndims is None:
+        element_ndims = [0 for i in inputs]
+    packed = []
+    for objects, element_ndim in zip(inputs, element_ndims):
+        p = pack_objects(objects, element_ndim)
+        if p is None:
+            return None
+        packed.append(p)
+
+    if len(packed) == 1:
+        values, out_lengths = packed[0]
+        arguments = [values]
+    else:
+        indexes, out_lengths = match_packed([lengths for values, lengths in packed], mode)
+        arguments = [values[idxs] for (values, lengths), idxs in zip(packed, indexes)]
+
+    if single_argument:
+        result = func(arguments[0] if len(arguments) == 1 else arguments)
+    else:
+        result = func(*arguments)
+    result = np.asarray(result)
+    if result.ndim == 0 or len(result) != out_lengths.sum():
+        return None
+    return unpack_objects(result, out_lengths, out_numpy)
@@ -0,0 +1,360 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Per-node statistics of tree processing.
+
+While collecting is enabled, the update system reports each call of node's
+process() method here. For each node the module keeps rolling statistics
+of processing time, peak memory allocated during processing (measured by
+tracemalloc) and size of data written into output sockets. The statistics
+can be saved as CSV table, and individual process() calls - as trace
+in Chrome trace-event format (can be opened by chrome://tracing or
+https://ui.perfetto.dev).
+
+Headless usage, e.g. from Blender's python console or a batch script:
+
+    from sverchok.utils.tree_profiling import profile_tree, save_csv, save_trace
+    report = profile_tree(bpy.data.node_groups['NodeTree'], iterations=10)
+    save_csv('/tmp/stats.csv')
+    save_trace('/tmp/trace.json')
+"""
+
+import csv
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+import numpy as np
+
+import bpy
+
+from sverchok.utils.logging import info
+
+# Whether statistics is being collected
+is_collecting = False
+# Whether peak memory of process() calls is measured; it slows processing down
+track_memory = False
+# Number of last process() calls of each node used for rolling statistics
+window_size = 100
+# Maximum number of stored process() calls for the trace
+max_trace_events = 100000
+# Number of items of long lists measured to estimate size of output data
+size_sample_length = 16
+
+_started_tracemalloc = False
+_node_stats = dict()
+_trace_events = deque(maxlen=max_trace_events)
+_lock = threading.Lock()
+# peak memory (absolute) of process() calls which are running in the main thread,
+# from the outer to the nested ones (nodes of monads are processed inside of the monad node)
+_memory_peaks = []
+
+
+class NodeStatistics(object):
+    """Rolling statistics of one node"""
+    def __init__(self, tree_name, node_name, bl_idname):
+        self.tree_name = tree_name
+        self.node_name = node_name
+        self.bl_idname = bl_idname
+        self.count = 0
+        self.total_time = 0.0
+        self.durations = deque(maxlen=window_size)
+        self.last_peak_memory = None
+        self.max_peak_memory = None
+        self.output_sizes = dict()
+
+    def add(self, duration, peak_memory=None, output_sizes=None):
+        self.count += 1
+        self.total_time += duration
+        self.durations.append(duration)
+        if peak_memory is not None:
+            self.last_peak_memory = peak_memory
+            self.max_peak_memory = max(peak_memory, self.max_peak_memory or 0)
+        if output_sizes is not None:
+            self.output_sizes = output_sizes
+
+    @property
+    def mean(self):
+        return float(np.mean(self.durations)) if self.durations else 0.0
+
+    @property
+    def p95(self):
+        return float(np.percentile(self.durations, 95)) if self.durations else 0.0
+
+    @property
+    def max(self):
+        return max(self.durations) if self.durations else 0.0
+
+    def as_dict(self):
+        return dict(tree = self.tree_name, node = self.node_name, bl_idname = self.bl_idname,
+                    count = self.count, total = self.total_time,
+                    mean = self.mean, p95 = self.p95, max = self.max,
+                    last_peak_memory = self.last_peak_memory,
+                    max_peak_memory = self.max_peak_memory,
+                    output_sizes = dict(self.output_sizes))
+
+
+def data_size(data):
+    """
+    Approximate size of socket data in bytes.
+    Of long lists only size_sample_length items are measured,
+    so that the cost does not grow with the size of the data.
+    """
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+    elif isinstance(data, (list, tuple)):
+        return sys.getsizeof(data) + _items_size(data)
+    elif isinstance(data, dict):
+        return sys.getsizeof(data) + _items_size(list(data.values()))
+    else:
+        return sys.getsizeof(data)
+
+
+def _items_size(items):
+    n = len(items)
+    if n <= size_sample_length:
+        return sum(data_size(item) for item in items)
+    step = n / size_sample_length
+    sample = [items[int(i * step)] for i in range(size_sample_length)]
+    return int(sum(data_size(item) for item in sample) * step)
+
+
+def get_output_sizes(node):
+    from sverchok.core.socket_data import get_output_socket_data, SvNoDataError
+
+    sizes = dict()
+    for socket in node.outputs:
+        if not hasattr(socket, 'socket_id'):
+            continue
+        try:
+            sizes[socket.name] = data_size(get_output_socket_data(node, socket.name))
+        except SvNoDataError:
+            pass
+    return sizes
+
+
+def start(memory=None):
+    """Start collecting statistics"""
+    global is_collecting, track_memory, _started_tracemalloc
+    if memory is not None:
+        track_memory = memory
+    if track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+    is_collecting = True
+
+
+def stop():
+    """Stop collecting statistics"""
+    global is_collecting, _started_tracemalloc
+    is_collecting = False
+    if _started_tracemalloc:
+        tracemalloc.stop()
+        _started_tracemalloc = False
+
+
+def reset():
+    """Forget all collected statistics"""
+    with _lock:
+        _node_stats.clear()
+        _trace_events.clear()
+
+
+def process_node(node):
+    """
+    Call process() method of the node, and record its statistics if collecting is enabled.
+    This is called by the update system. Peak memory is not measured for nodes
+    processed in worker threads, because tracemalloc can't distinguish threads.
+    Returns tuple (start time, duration).
+    """
+    if not is_collecting:
+        start_time = time.perf_counter()
+        node.process()
+        return start_time, time.perf_counter() - start_time
+
+    measure_memory = (track_memory and tracemalloc.is_tracing() and hasattr(tracemalloc, 'reset_peak')
+                      and threading.current_thread() is threading.main_thread())
+    if measure_memory:
+        if _memory_peaks:
+            # reset_peak forgets the peak of the enclosing call, keep it
+            _memory_peaks[-1] = max(_memory_peaks[-1], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        initial_memory = tracemalloc.get_traced_memory()[0]
+        _memory_peaks.append(initial_memory)
+
+    peak_memory = None
+    start_time = time.perf_counter()
+    try:
+        node.process()
+    finally:
+        duration = time.perf_counter() - start_time
+        if measure_memory:
+            peak = max(tracemalloc.get_traced_memory()[1], _memory_peaks.pop())
+            peak_memory = peak - initial_memory
+            if _memory_peaks:
+                _memory_peaks[-1] = max(_memory_peaks[-1], peak)
+
+    record(node, start_time, duration, peak_memory, get_output_sizes(node))
+    return start_time, duration
+
+
+def record(node, start_time, duration, peak_memory=None, output_sizes=None):
+    tree_name = node.id_data.name
+    key = (tree_name, node.name)
+    with _lock:
+        stats = _node_stats.get(key)
+        if stats is None:
+            stats = _node_stats[key] = NodeStatistics(tree_name, node.name, node.bl_idname)
+        stats.add(duration, peak_memory, output_sizes)
+        _trace_events.append((tree_name, node.name, node.bl_idname,
+                              threading.get_ident(), start_time, duration, peak_memory))
+
+
+def get_statistics(tree_name=None):
+    """
+    Collected statistics, as list of dictionaries (one per node),
+    sorted by mean processing time, slowest nodes first.
+    """
+    with _lock:
+        stats = [s.as_dict() for s in _node_stats.values()
+                 if tree_name is None or s.tree_name == tree_name]
+    stats.sort(key = lambda s: s['mean'], reverse=True)
+    return stats
+
+
+def get_trace():
+    """
+    Recorded process() calls in Chrome trace-event format
+    """
+    with _lock:
+        events = list(_trace_events)
+    thread_ids = dict()
+    trace = []
+    for tree_name, node_name, bl_idname, thread_id, start_time, duration, peak_memory in events:
+        args = dict(tree = tree_name, bl_idname = bl_idname)
+        if peak_memory is not None:
+            args['peak_memory'] = peak_memory
+        trace.append(dict(name = node_name, cat = tree_name, ph = "X",
+                          ts = start_time * 1e6, dur = duration * 1e6,
+                          pid = 1, tid = thread_ids.setdefault(thread_id, len(thread_ids)),
+                          args = args))
+    return dict(traceEvents = trace, displayTimeUnit = "ms")
+
+
+def save_csv(path, tree_name=None):
+    columns = ['tree', 'node', 'bl_idname', 'count', 'total', 'mean', 'p95', 'max',
+               'last_peak_memory', 'max_peak_memory', 'output_sizes']
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for stats in get_statistics(tree_name):
+            stats['output_sizes'] = ";".join(f"{name}={size}" for name, size in stats['output_sizes'].items())
+            writer.writerow(stats)
+    info("Node statistics saved to %s", path)
+
+
+def save_trace(path):
+    with open(path, 'w') as f:
+        json.dump(get_trace(), f)
+    info("Node processing trace saved to %s", path)
+
+
+def profile_tree(tree, iterations=1, memory=True):
+    """
+    Process the whole tree specified number of times with statistics collecting
+    enabled. Previously collected statistics is reset.
+    Returns statistics of the tree nodes, see get_statistics().
+    """
+    from sverchok.core.update_system import process_tree
+
+    global track_memory
+    was_collecting, was_tracking_memory = is_collecting, track_memory
+    reset()
+    start(memory)
+    try:
+        for i in range(iterations):
+            process_tree(tree)
+    finally:
+        track_memory = was_tracking_memory
+        if was_collecting:
+            start()
+        else:
+            stop()
+    return get_statistics(tree.name)
+
+########################
+#
+# GUI
+#
+#########################
+
+class SvNodeStatisticsToggle(bpy.types.Operator):
+    """Start/stop collecting statistics of nodes processing"""
+    bl_idname = "node.sverchok_node_stats_toggle"
+    bl_label = "Toggle nodes statistics"
+    bl_options = {'INTERNAL'}
+
+    memory: bpy.props.BoolProperty(name = "Track memory",
+            description = "Measure peak memory allocated by nodes (slows processing down)",
+            default = False)
+
+    def execute(self, context):
+        if is_collecting:
+            stop()
+        else:
+            start(self.memory)
+        info("Nodes statistics collecting is set to %s", is_collecting)
+        return {'FINISHED'}
+
+class SvNodeStatisticsSave(bpy.types.Operator):
+    """Save statistics of nodes processing to CSV file, or trace of nodes processing to JSON file"""
+    bl_idname = "node.sverchok_node_stats_save"
+    bl_label = "Save nodes statistics"
+    bl_options = {'INTERNAL'}
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH")
+
+    format: bpy.props.EnumProperty(name = "Format",
+            items = [("CSV", "CSV", "Statistics table", 0),
+                     ("TRACE", "Trace", "Chrome trace-event JSON", 1)],
+            default = "CSV")
+
+    def execute(self, context):
+        if self.format == "CSV":
+            save_csv(self.filepath)
+        else:
+            save_trace(self.filepath)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+class SvNodeStatisticsReset(bpy.types.Operator):
+    """Reset statistics of nodes processing"""
+    bl_idname = "node.sverchok_node_stats_reset"
+    bl_label = "Reset nodes statistics"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        reset()
+        info("Nodes statistics data cleared.")
+        return {'FINISHED'}
+
+classes = [SvNodeStatisticsToggle, SvNodeStatisticsSave, SvNodeStatisticsReset]
+
+def register():
+    for class_name in classes:
+        bpy.utils.register_class(class_name)
+
+def unregister():
+    for class_name in reversed(classes):
+        bpy.utils.unregister_class(class_name)
@@ -3,11 +3,24 @@ Initial code was taken from Houdini software implementation
 https://github.com/sideeffects/SideFXLabs
 """
 
+from heapq import heapify, heappush, heappop
 from itertools import chain
 
 import numpy as np
 
 
+def bitmask_indices(bitmask):
+    # Indices of set bits of the integer, in ascending order
+    indices = []
+    index = 0
+    while bitmask:
+        if bitmask & 1:
+            indices.append(index)
+        bitmask >>= 1
+        index += 1
+    return indices
+
+
 class WaveFunctionCollapse:
     # wave = WaveFunctionCollapse(*params)  this step will read input image and create patterns
     # new_image = wave.solve(*params)  this step will generate output image
@@ -20,7 +33,7 @@ class WaveFunctionCollapse:
             rotate_patterns=True):
 
         self.input_grid_size = image.shape
-        self.input_sample_image = image.reshape(-1, 4).tolist()
+        self.input_sample_image = [tuple(pixel) for pixel in image.reshape(-1, 4).tolist()]
         self.periodic_input = periodic_input
         self.add_rotations = rotate_patterns
         self.pattern_size = patter_size
@@ -33,10 +46,23 @@ class WaveFunctionCollapse:
         self.patterns_transforms = []
         self.pattern_frequencies = []
         self.number_of_unique_patterns = None
-        self.output_grid = {}
-        self.entropy_grid = {}
+        # Wave: for each cell - bitmask of patterns which are still allowed
+        self.output_grid = None
+        # Entropy = Number of remaining legal patterns
+        self.entropy_grid = None
+        self.collapsed_cells = None
+        self.number_of_collapsed_cells = 0
+        # Priority queue of (entropy, cell) items; outdated items are skipped when popped
+        self.entropy_heap = []
+        # For each cell - tuple of (direction, neighbour index) pairs for nbr_directions; index is -1 out of bounds
+        self.neighbor_cells = None
         self.solve_starting_point_index = None
-        self.allowed_pattern_adjacencies = {}
+        # Array of shape (directions, patterns, patterns)
+        self.allowed_pattern_adjacencies = None
+        # For each direction - bitmasks of patterns allowed next to each pattern
+        self.allowed_adjacency_bitmasks = None
+        # For each direction - {bitmask of cell patterns: bitmask of patterns allowed next to the cell}
+        self.allowed_adjacency_cache = None
         self.nbr_directions = ((-1, 0), (1, 0), (0, -1), (0, 1))
         self.respect_user_constraints = False
         self.use_input_pattern_frequency = 1
@@ -131,74 +157,108 @@ class WaveFunctionCollapse:
         self.patterns_transforms = []
         self.pattern_frequencies = []
 
+        pattern_indices = dict()
         for i, pattern in enumerate(all_temp_patterns):
-            if pattern not in self.patterns:
+            index = pattern_indices.get(pattern)
+            if index is None:
+                pattern_indices[pattern] = len(self.patterns)
                 self.patterns.append(pattern)
                 self.pattern_frequencies.append(1)
                 self.patterns_transforms.append(all_temp_patterns_transforms[i])
             else:
-                index = self.patterns.index(pattern)
                 self.pattern_frequencies[index] += 1
 
         self.number_of_unique_patterns = len(self.pattern_frequencies)
 
     def initialize_grid(self):
-        # Here we create a list that will be used as our output grid. (Used for solving in)
-
-        for x in range(self.output_grid_size[0] * self.output_grid_size[1]):
-            self.output_grid[x] = set(range(self.number_of_unique_patterns))
+        # Here we create an array that will be used as our output grid. (Used for solving in)
+        number_of_cells = self.output_grid_size[0] * self.output_grid_size[1]
+        self.output_grid = [(1 << self.number_of_unique_patterns) - 1] * number_of_cells
+        self.collapsed_cells = [False] * number_of_cells
+        self.number_of_collapsed_cells = 0
+        self.calculate_neighbor_cells()
+
+    def calculate_neighbor_cells(self):
+        # Indexes of neighbour cells in each of nbr_directions, -1 for cells out of bounds
+        width, height = self.output_grid_size
+        xs, ys = np.meshgrid(np.arange(width), np.arange(height))
+        xs, ys = xs.flatten(), ys.flatten()
+        neighbor_cells = np.empty((width * height, len(self.nbr_directions)), dtype=np.int64)
+        for direction, (dx, dy) in enumerate(self.nbr_directions):
+            nbr_xs, nbr_ys = xs + dx, ys + dy
+            index = (nbr_xs % width) + (nbr_ys % height) * width
+            if not self.tile_around_bounds:
+                # If the user does not want the WFC solve to create a tiling output,
+                # we just state that the found neighbor cell is invalid and don't propagate it
+                is_wrapping = (nbr_xs < 0) | (nbr_xs >= width) | (nbr_ys < 0) | (nbr_ys >= height)
+                index[is_wrapping] = -1
+            neighbor_cells[:, direction] = index
+        self.neighbor_cells = [tuple(enumerate(cells)) for cells in neighbor_cells.tolist()]
 
     def initialize_entropy_grid(self):
         # Here we create grid that matches the output grid, but we store entropy values instead.
         # (Entropy = Number of remaining legal patterns)
-
-        for x in range(self.output_grid_size[0] * self.output_grid_size[1]):
-            self.entropy_grid[x] = self.number_of_unique_patterns
+        number_of_cells = len(self.output_grid)
+        self.entropy_grid = [self.number_of_unique_patterns] * number_of_cells
 
         # Pick starting point for solve. (Random if not specified)
-        if self.solve_starting_point_index is None:
-            # solve_starting_point_index = np.random.randint(NumberOfUniquePatterns)
-            self.solve_starting_point_index = np.random.randint(len(self.entropy_grid.keys()))
+        # It is picked again for each solve, so results depend only on the seed
+        starting_point_index = self.solve_starting_point_index
+        if starting_point_index is None:
+            starting_point_index = np.random.randint(number_of_cells)
 
-        self.entropy_grid[self.solve_starting_point_index] = self.number_of_unique_patterns - 1
+        self.entropy_grid[starting_point_index] = self.number_of_unique_patterns - 1
+
+        # Cells with equal entropy are taken in order of their indexes
+        self.entropy_heap = [(entropy, cell) for cell, entropy in enumerate(self.entropy_grid)]
+        heapify(self.entropy_heap)
 
     def calculate_adjacencies(self):
         # If PatternIndex = 10 has been observed to be to the left of of PatternIndex = 15 in the InputGrid:
-        # AllowedPatternAdjacencies[PatternIndex=15][0].add(PatternIndex=10)
+        # AllowedPatternAdjacencies[0, PatternIndex=15, PatternIndex=10] = True
         # Directions: 0 = left, 1 = right, 2 = up, 3 = down
-        # OUTPUT EXAMPLE PatternIndex = 15 --> (LEFT: set([65, 36, 69, 44, 87, 56, 29]),
-        # RIGHT: set([8]), UP: set([32, 64, 10, 12, 14, 83, 21]), DOWN: set([15]))
-
-        # Initialize empty AllowedPatternAdjacencies
-        for x in range(self.number_of_unique_patterns):
-            self.allowed_pattern_adjacencies[x] = tuple(set() for _ in range(len(self.nbr_directions)))
-
-        # Comparing patterns to each other
-        for PatternIndex1 in range(self.number_of_unique_patterns):
-            for PatternIndex2 in range(self.number_of_unique_patterns):
-
-                pattern1_boundary_columns = [n for i, n in enumerate(self.patterns[PatternIndex1]) if
-                                             i % self.pattern_size != (self.pattern_size - 1)]
-                pattern2_boundary_columns = [n for i, n in enumerate(self.patterns[PatternIndex2]) if
-                                             i % self.pattern_size != 0]
-
-                # Compare Columns compatability
-                if pattern1_boundary_columns == pattern2_boundary_columns:
-                    self.allowed_pattern_adjacencies[PatternIndex1][0].add(PatternIndex2)
-                    self.allowed_pattern_adjacencies[PatternIndex2][1].add(PatternIndex1)
 
-                pattern1_boundary_rows = self.patterns[PatternIndex1][
-                                       :(self.pattern_size * self.pattern_size) - self.pattern_size]
-                pattern2_boundary_rows = self.patterns[PatternIndex2][self.pattern_size:]
-
-                if pattern1_boundary_rows == pattern2_boundary_rows:
-                    self.allowed_pattern_adjacencies[PatternIndex1][2].add(PatternIndex2)
-                    self.allowed_pattern_adjacencies[PatternIndex2][3].add(PatternIndex1)
+        # Replace pixel values by integer identifiers, to compare patterns by numpy
+        pixel_ids = dict()
+        patterns = np.array([[pixel_ids.setdefault(pixel, len(pixel_ids)) for pixel in pattern]
+                             for pattern in self.patterns])
+        patterns = patterns.reshape((self.number_of_unique_patterns, self.pattern_size, self.pattern_size))
+        n = self.number_of_unique_patterns
+
+        # Compare Columns compatability
+        pattern1_boundary_columns = patterns[:, :, :-1].reshape((n, 1, -1))
+        pattern2_boundary_columns = patterns[:, :, 1:].reshape((1, n, -1))
+        columns_match = np.all(pattern1_boundary_columns == pattern2_boundary_columns, axis=2)
+
+        pattern1_boundary_rows = patterns[:, :-1, :].reshape((n, 1, -1))
+        pattern2_boundary_rows = patterns[:, 1:, :].reshape((1, n, -1))
+        rows_match = np.all(pattern1_boundary_rows == pattern2_boundary_rows, axis=2)
+
+        self.allowed_pattern_adjacencies = np.stack((columns_match, columns_match.T, rows_match, rows_match.T))
+
+        # Bit i of a bitmask stands for PatternIndex = i
+        weights = [1 << i for i in range(n)]
+        self.allowed_adjacency_bitmasks = [[sum(w for w, allowed in zip(weights, row) if allowed)
+                                            for row in adjacencies.tolist()]
+                                           for adjacencies in self.allowed_pattern_adjacencies]
+        self.allowed_adjacency_cache = [dict() for _ in self.nbr_directions]
+
+    def get_allowed_adjacencies(self, direction, cell_patterns):
+        # Bitmask of all the patterns allowed in given direction from the cell with cell_patterns bitmask
+        cache = self.allowed_adjacency_cache[direction]
+        allowed = cache.get(cell_patterns)
+        if allowed is None:
+            allowed = 0
+            bitmasks = self.allowed_adjacency_bitmasks[direction]
+            for pattern_index in bitmask_indices(cell_patterns):
+                allowed |= bitmasks[pattern_index]
+            cache[cell_patterns] = allowed
+        return allowed
 
     def run_wfc_solve(self):
         # This runs the actual WFC solve
-        running = True
-        while running:
+        number_of_cells = len(self.output_grid)
+        while self.number_of_collapsed_cells < number_of_cells:
 
             # Find the cell with the lowest entropy value, and assign a random valid PatternIndex
             lowest_entropy_cell = self.get_lowest_entropy_cell()
@@ -206,98 +266,90 @@ class WaveFunctionCollapse:
             self.assign_pattern_to_cell(lowest_entropy_cell, pattern_index_for_cell)
 
             # Propagate the OutputGrid after collapsing the LowestEntropyCell
-            running, error = self.propagate_grid_cells(lowest_entropy_cell)
-
-            # Check if all cells in the OutputGrid have collapsed yet (done solving)
-            if len(self.entropy_grid.keys()) == 0:
-                running = False
+            if not self.propagate_grid_cells(lowest_entropy_cell):
+                # Contradiction while propagating
+                return False
 
-        # Check if we have ran into an error. (contradiction while propagating)
-        if error == 1:
-            return False
-        else:
-            return True
+        return True
 
     def get_lowest_entropy_cell(self):
-        # Find the list entry in the entropy grid with the lowest value
-        return min(self.entropy_grid, key=self.entropy_grid.get)
+        # Pop the cell with the lowest entropy value; skip items of collapsed cells,
+        # and items which were added before the entropy of the cell was reduced
+        while True:
+            entropy, cell = heappop(self.entropy_heap)
+            if not self.collapsed_cells[cell] and self.entropy_grid[cell] == entropy:
+                return cell
 
     def get_random_allowed_pattern_index_from_cell(self, cell):
         # Assign a random allowed pattern_index to given cell.
         # This can either use frequency of found patterns as a weighted random or not depending on user parm
+        allowed_patterns = np.array(bitmask_indices(self.output_grid[cell]))
         if self.use_input_pattern_frequency == 1:
-            return np.random.choice(
-                [pattern_index for pattern_index in self.output_grid[cell]
-                 for i in range(self.pattern_frequencies[pattern_index])])
+            frequencies = np.asarray(self.pattern_frequencies)[allowed_patterns]
+            return np.random.choice(np.repeat(allowed_patterns, frequencies))
         else:
-            return np.random.choice([pattern_index for pattern_index in self.output_grid[cell]])
+            return np.random.choice(allowed_patterns)
 
     def assign_pattern_to_cell(self, cell, pattern_index):
-        # Assign given cell a chosen PatternIndex, and delete cell from EntropyGrid (Cell has collapsed)
-        self.output_grid[cell] = {pattern_index}
-        del self.entropy_grid[cell]
+        # Assign given cell a chosen PatternIndex, and mark the cell as collapsed
+        self.output_grid[cell] = 1 << int(pattern_index)
+        self.collapsed_cells[cell] = True
+        self.number_of_collapsed_cells += 1
 
     def propagate_grid_cells(self, cell):
         # This propagates all the cells that should have been affected from the just-collapsed cell
+        # Returns False in case of contradiction.
+
+        output_grid = self.output_grid
+        collapsed_cells = self.collapsed_cells
+        allowed_adjacency_cache = self.allowed_adjacency_cache
 
         # We are using a stack to add newly found to-be-updated cells to
-        to_update_stack = {cell}
-        while len(to_update_stack) != 0:
+        to_update_stack = [cell]
+        in_stack = {cell}
+        while to_update_stack:
             cell_index = to_update_stack.pop()
+            in_stack.discard(cell_index)
+            cell_patterns = output_grid[cell_index]
 
             # loop through neighbor cells of currently propagated cell
-            for direction, transform in enumerate(self.nbr_directions):
-
-                neighbor_index_is_valid = True
-
-                x = int((cell_index % self.output_grid_size[0] + transform[0]) % self.output_grid_size[0])
-                y = int((cell_index / self.output_grid_size[0] + transform[1]) % self.output_grid_size[1])
-                neighbor_cell_index = x + y * self.output_grid_size[0]  # index of neighboring cell
-
-                # If the user does not want the WFC solve to create a tiling output,
-                # we just state that the found neighbor cell is invalid and don't propagate it
-                if not self.tile_around_bounds:
-                    x_is_wrapping = abs(neighbor_cell_index % self.output_grid_size[0]
-                                        - cell_index % self.output_grid_size[0]) > 1
-                    y_is_wrapping = abs(neighbor_cell_index / self.output_grid_size[1]
-                                        - cell_index / self.output_grid_size[1]) > 1
-
-                    if x_is_wrapping or y_is_wrapping:
-                        neighbor_index_is_valid = False
-
-                # Cell has not yet been collapsed yet
-                if neighbor_cell_index in self.entropy_grid and neighbor_index_is_valid:
+            for direction, neighbor_cell_index in self.neighbor_cells[cell_index]:
 
-                    # These are all the allowed patterns for the direction of the checked neighbor cell
-                    pattern_indices_in_cell = {n for pattern_index in self.output_grid[cell_index] for n in
-                                               self.allowed_pattern_adjacencies[pattern_index][direction]}
+                # Cell is out of bounds or has been collapsed already
+                if neighbor_cell_index < 0 or collapsed_cells[neighbor_cell_index]:
+                    continue
 
-                    # These are all the patterns the neighbor allows itself
-                    pattern_indices_in_neighbor_cell = self.output_grid[neighbor_cell_index]
+                # These are all the allowed patterns for the direction of the checked neighbor cell
+                pattern_indices_in_cell = allowed_adjacency_cache[direction].get(cell_patterns)
+                if pattern_indices_in_cell is None:
+                    pattern_indices_in_cell = self.get_allowed_adjacencies(direction, cell_patterns)
 
-                    # Make sure we need to update the cell
-                    # by checking if the currently pattern_indices_in_cell patterns for the neighbor cells
-                    # are already fully contained in the now reduced set of patterns
-                    if not pattern_indices_in_neighbor_cell.issubset(pattern_indices_in_cell):
+                # These are all the patterns the neighbor allows itself
+                pattern_indices_in_neighbor_cell = output_grid[neighbor_cell_index]
+                shared_cell_and_neighbor_pattern_indices = pattern_indices_in_neighbor_cell & pattern_indices_in_cell
 
-                        shared_cell_and_neighbor_pattern_indices = set(
-                            [x for x in pattern_indices_in_cell if x in pattern_indices_in_neighbor_cell])
+                # Make sure we need to update the cell
+                # by checking if the patterns of the neighbor cell are already
+                # fully contained in the patterns allowed by the cell
+                if shared_cell_and_neighbor_pattern_indices == pattern_indices_in_neighbor_cell:
+                    continue
+                if shared_cell_and_neighbor_pattern_indices == 0:
+                    return False
 
-                        if len(shared_cell_and_neighbor_pattern_indices) == 0:
-                            return False, 1
+                entropy = bin(shared_cell_and_neighbor_pattern_indices).count('1')
 
-                        self.output_grid[neighbor_cell_index] = shared_cell_and_neighbor_pattern_indices
-                        self.entropy_grid[neighbor_cell_index] = len(self.output_grid[neighbor_cell_index])
-                        to_update_stack.add(neighbor_cell_index)
+                output_grid[neighbor_cell_index] = shared_cell_and_neighbor_pattern_indices
+                self.entropy_grid[neighbor_cell_index] = entropy
+                heappush(self.entropy_heap, (entropy, neighbor_cell_index))
+                if neighbor_cell_index not in in_stack:
+                    to_update_stack.append(neighbor_cell_index)
+                    in_stack.add(neighbor_cell_index)
 
-        return True, 0
+        return True
 
     def assign_wave_to_output(self):
         # This finds and assigns the picked PatternIndex to the output grid as attributes
-        flat_out_image = []
-        for x in self.output_grid.keys():
-            val = next(iter(self.output_grid[x]))
-            flat_out_image.append(self.patterns[val][0])
+        flat_out_image = [self.patterns[bitmask_indices(val)[0]][0] for val in self.output_grid]
 
         out_image = []
         for i_row in range(self.output_grid_size[1]):